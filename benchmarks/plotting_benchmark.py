@@ -0,0 +1,360 @@
+"""
+Headless benchmark of the plotting subsystem.
+
+Sweeps the artist type, the number of artists, the buffer size, the input
+rate and the frame rate. For every combination, a `PlotterManager` with an
+offscreen ``Plotter(backend="Agg")`` is fed with random data for a fixed
+duration, and the following are measured:
+
+- the end-to-end throughput, the number of samples per second accepted by the
+  plotter process, from the first `add_data` call until the plotter
+  processed the last queued item,
+- the producer-side cost of the `add_data` calls,
+- the frame time percentiles and the achieved frame rate, from the plotter
+  telemetry.
+
+The results are written as JSON, together with the versions of the used
+packages, so runs can be compared across versions::
+
+    python benchmarks/plotting_benchmark.py --quick -o results.json
+"""
+
+import argparse
+import datetime
+import importlib.metadata
+import itertools
+import json
+import math
+import platform
+import time
+
+import matplotlib
+import numpy as np
+
+from pydevdtk.plotting import Plotter, PlotterManager
+
+ARTIST_TYPES = (
+    "line",
+    "multi_line",
+    "scatter",
+    "bar",
+    "histogram",
+    "waterfall",
+)
+NUM_CHANNELS = 8
+NUM_ROWS = 64
+NUM_BINS = 64
+
+
+def create_artist(
+    manager: PlotterManager,
+    artist_type: str,
+    artist_id: str,
+    axis_id: str,
+    size: int,
+):
+    """
+    Create an artist of the given type, with a buffer of `size` samples.
+    """
+    if artist_type == "line":
+        manager.create_line_plot(artist_id, axis_id, size, decimate=True)
+    elif artist_type == "multi_line":
+        manager.create_multi_line_plot(artist_id, axis_id, size, NUM_CHANNELS)
+    elif artist_type == "scatter":
+        manager.create_scatter_plot(artist_id, axis_id, size)
+    elif artist_type == "bar":
+        manager.create_bar_plot(artist_id, axis_id, size)
+    elif artist_type == "histogram":
+        manager.create_histogram_plot(
+            artist_id, axis_id, np.linspace(-4, 4, NUM_BINS + 1), window=size
+        )
+    elif artist_type == "waterfall":
+        manager.create_waterfall_plot(
+            artist_id, axis_id, NUM_ROWS, size, vmin=-4, vmax=4
+        )
+    else:
+        raise ValueError(f"Unknown artist type {artist_type}")
+
+
+def generate_samples(
+    rng: np.random.Generator, artist_type: str, num_samples: int, size: int
+) -> np.ndarray:
+    """
+    Returns a batch of random samples for an artist of the given type.
+    """
+    if artist_type in ("line", "histogram"):
+        return rng.standard_normal(num_samples)
+    if artist_type == "multi_line":
+        return rng.standard_normal((num_samples, NUM_CHANNELS))
+    if artist_type == "scatter":
+        return rng.standard_normal((num_samples, 2))
+    if artist_type == "bar":
+        return rng.standard_normal((num_samples, size))
+    if artist_type == "waterfall":
+        return rng.standard_normal((num_samples, NUM_ROWS))
+    raise ValueError(f"Unknown artist type {artist_type}")
+
+
+class ProcessedItems:
+    """
+    Counts the data queue items processed by the plotter process, from the
+    telemetry of the drawn frames.
+    """
+
+    def __init__(self, manager: PlotterManager):
+        self.collector = manager.stats_collector
+        self.count = 0
+        self.last_frame = 0
+
+    def update(self) -> int:
+        self.collector.collect()
+        history = self.collector.history
+        new = history[history["frame_count"] > self.last_frame]
+        if len(new) > 0:
+            self.count += int(new["items_processed"].sum())
+            self.last_frame = int(new["frame_count"][-1])
+        return self.count
+
+
+def run_case(
+    artist_type: str,
+    num_artists: int,
+    size: int,
+    rate: float,
+    fps: float | None,
+    duration: float,
+    send_rate: float,
+    seed: int,
+) -> dict:
+    """
+    Run a single benchmark case and return its results.
+    """
+    rng = np.random.default_rng(seed)
+    manager = PlotterManager(Plotter(backend="Agg"), fps=fps)
+    try:
+        num_cols = math.ceil(math.sqrt(num_artists))
+        num_rows = math.ceil(num_artists / num_cols)
+        manager.create_figure("fig", num_rows, num_cols, figsize=(8, 6))
+        artist_ids = []
+        for i in range(num_artists):
+            axis_id = f"ax{i}"
+            artist_id = f"artist{i}"
+            manager.create_axis(axis_id, "fig", i // num_cols, i % num_cols)
+            create_artist(manager, artist_type, artist_id, axis_id, size)
+            artist_ids.append(artist_id)
+        manager.show()
+        processed = ProcessedItems(manager)
+
+        # warm up, until the first frame is drawn
+        manager.add_data(
+            {
+                artist_id: generate_samples(rng, artist_type, 1, size)
+                for artist_id in artist_ids
+            }
+        )
+        t_end = time.perf_counter() + 30
+        while processed.update() < 1:
+            if time.perf_counter() > t_end:
+                raise RuntimeError("Plotter didn't draw the first frame")
+            time.sleep(0.01)
+        num_warmup_frames = processed.last_frame
+
+        period = 1 / send_rate
+        samples_per_call = max(1, round(rate / send_rate))
+        num_calls = round(duration * send_rate)
+        call_times = np.empty(num_calls)
+        t_start = time.perf_counter()
+        t_poll = t_start
+        for i_call in range(num_calls):
+            data = {
+                artist_id: generate_samples(
+                    rng, artist_type, samples_per_call, size
+                )
+                for artist_id in artist_ids
+            }
+            t_call = time.perf_counter()
+            manager.add_data(data)
+            call_times[i_call] = time.perf_counter() - t_call
+            t_now = time.perf_counter()
+            if t_now - t_poll > 0.1:
+                processed.update()
+                t_poll = t_now
+            t_next = t_start + (i_call + 1) * period
+            if t_next > t_now:
+                time.sleep(t_next - t_now)
+        t_sent = time.perf_counter()
+        timeout = t_sent + max(10, 2 * duration)
+        while processed.update() < num_calls + 1:
+            if time.perf_counter() > timeout:
+                break
+            time.sleep(0.005)
+        t_processed = time.perf_counter()
+        num_processed = processed.count - 1
+        num_frames = processed.last_frame - num_warmup_frames
+        stats = manager.stats(
+            window=max(1, num_frames), percentiles=(50, 95, 99)
+        )
+    finally:
+        manager.stop()
+
+    num_samples = num_processed * samples_per_call * num_artists
+    call_times *= 1e6
+    return {
+        "artist_type": artist_type,
+        "num_artists": num_artists,
+        "buffer_size": size,
+        "input_rate": rate,
+        "fps": fps,
+        "duration": duration,
+        "send_rate": send_rate,
+        "samples_per_call": samples_per_call,
+        "calls_sent": num_calls,
+        "calls_processed": num_processed,
+        "offered_samples_per_s": num_calls
+        * samples_per_call
+        * num_artists
+        / (t_sent - t_start),
+        "accepted_samples_per_s": num_samples / (t_processed - t_start),
+        "drain_time": t_processed - t_sent,
+        "add_data_us": {
+            "p50": float(np.percentile(call_times, 50)),
+            "p95": float(np.percentile(call_times, 95)),
+            "p99": float(np.percentile(call_times, 99)),
+            "mean": float(call_times.mean()),
+            "max": float(call_times.max()),
+        },
+        "frames": num_frames,
+        "achieved_fps": num_frames / (t_processed - t_start),
+        "skipped_frames": stats["skipped_frames"],
+        "draw_time": stats["draw_time"],
+        "process_time": stats["process_time"],
+        "items_processed": stats["items_processed"],
+        "queue_depth": stats["queue_depth"],
+    }
+
+
+def package_version(name: str) -> str:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--artist-types",
+        nargs="+",
+        default=list(ARTIST_TYPES),
+        choices=ARTIST_TYPES,
+    )
+    parser.add_argument(
+        "--artist-counts", nargs="+", type=int, default=[1, 4, 16]
+    )
+    parser.add_argument(
+        "--buffer-sizes", nargs="+", type=int, default=[1000, 100000]
+    )
+    parser.add_argument(
+        "--rates",
+        nargs="+",
+        type=float,
+        default=[1000, 100000],
+        help="input rates in samples per second per artist",
+    )
+    parser.add_argument(
+        "--fps",
+        nargs="+",
+        type=float,
+        default=[30, 0],
+        help="frame rates, 0 for unlimited",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=5.0,
+        help="duration of a case in seconds",
+    )
+    parser.add_argument(
+        "--send-rate",
+        type=float,
+        default=100.0,
+        help="number of add_data calls per second",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="run a small sweep with short cases, unless the swept values "
+        "are given explicitly",
+    )
+    parser.add_argument("-o", "--output", default="plotting_benchmark.json")
+    if parser.parse_known_args()[0].quick:
+        parser.set_defaults(
+            artist_counts=[1, 4],
+            buffer_sizes=[1000],
+            rates=[10000],
+            fps=[30],
+            duration=1.0,
+        )
+    args = parser.parse_args()
+
+    # bars and waterfall columns are costly, keep their number sensible
+    cases = [
+        case
+        for case in itertools.product(
+            args.artist_types,
+            args.artist_counts,
+            args.buffer_sizes,
+            args.rates,
+            args.fps,
+        )
+        if not (case[0] in ("bar", "waterfall") and case[2] > 10000)
+    ]
+    results = []
+    for i, (artist_type, num_artists, size, rate, fps) in enumerate(cases):
+        print(
+            f"[{i + 1}/{len(cases)}] {artist_type}, {num_artists} artists, "
+            f"size {size}, {rate:g} samples/s, fps {fps or 'unlimited'}",
+            flush=True,
+        )
+        result = run_case(
+            artist_type,
+            num_artists,
+            size,
+            rate,
+            fps or None,
+            args.duration,
+            args.send_rate,
+            args.seed,
+        )
+        print(
+            f"  accepted {result['accepted_samples_per_s']:.0f} samples/s, "
+            f"add_data p50 {result['add_data_us']['p50']:.0f} us, "
+            f"draw p95 {result['draw_time']['p95'] * 1e3:.2f} ms, "
+            f"{result['achieved_fps']:.1f} fps",
+            flush=True,
+        )
+        results.append(result)
+
+    output = {
+        "metadata": {
+            "timestamp": datetime.datetime.now(
+                datetime.timezone.utc
+            ).isoformat(),
+            "pydevdtk": package_version("pydevdtk"),
+            "numpy": np.__version__,
+            "matplotlib": matplotlib.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "arguments": vars(args),
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(output, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,28 +2,8 @@ import multiprocessing as mp
 import time
 
 import numpy as np
-from scipy import fft
 
-from pydevdtk.plotting import Plotter, PlotterManager
-
-
-def get_spectrum(fs, x, n_fft=None, log=False):
-    n = x.size
-    if n_fft is None:
-        n_fft = int(2 ** np.ceil(np.log2(n)))
-    x_spec = fft.fft(x, n_fft)
-    x_spec = np.abs(x_spec)
-    x_spec = x_spec / n
-    n_keep = n_fft // 2 + 1
-    x_spec = x_spec[0:n_keep]
-    x_spec[1:-1] = 2 * x_spec[1:-1]
-    f = np.linspace(0, fs / 2, n_keep)
-    if log:
-        eps = 1e-10
-        x_spec[x_spec < eps] = eps
-        x_spec = 20 * np.log10(x_spec)
-
-    return f, x_spec
+from pydevdtk.plotting import Plotter, PlotterManager, Spectrum
 
 
 def generate_sine_signal(
@@ -66,12 +46,6 @@ def main():
     i_sinswp = 0
     n_fft = 64
     n_spec_update = 1
-    spec_buf = np.zeros(n_fft)
-    spectrogram = np.full(
-        (n_fft // 2 + 1, num_samples // n_spec_update), np.nan
-    )
-    i_spec_buf = 0
-    i_spectrogram = 0
     plotter_manager = PlotterManager(Plotter())
     plotter_manager.create_figure("fig_demo", 3, 6, figsize=(12, 7))
     plotter_manager.create_axis("ax_line1", "fig_demo", 0, 0, 1, 2)
@@ -93,15 +67,18 @@ def main():
     )
     plotter_manager.create_scatter_plot("scat", "ax_scat", num_samples // 5)
     plotter_manager.create_line_plot("line4", "ax_line4", num_samples)
-    plotter_manager.create_image_plot(
+    plotter_manager.create_waterfall_plot(
         "img",
         "ax_img",
-        (n_fft // 2 + 1, num_samples // n_spec_update),
+        n_fft // 2 + 1,
+        num_samples // n_spec_update,
         cbar=True,
         vmin=0,
         vmax=1,
-        aspect="auto",
-        origin="lower",
+    )
+    # the spectrogram of the chirp is computed in the plotter process
+    plotter_manager.add_transform(
+        "line4", "img", Spectrum(n_fft, hop=n_spec_update)
     )
 
     plotter_manager.modify_axis(
@@ -161,32 +138,16 @@ def main():
             "scat": [sin_wave[i_sin], cos_wave[i_cos]],
             "line4": sinesweep_wave[i_sinswp],
         }
-        spec_buf[i_spec_buf] = sinesweep_wave[i_sinswp]
-        if i_spec_buf % n_spec_update == 0:
-            _, spec = get_spectrum(fs, spec_buf, n_fft)
-            if i_spectrogram == spectrogram.shape[1] - 1:
-                spectrogram[:, : spectrogram.shape[1] - 1] = spectrogram[:, 1:]
-                spectrogram[:, i_spectrogram] = spec
-            else:
-                spectrogram[:, i_spectrogram] = spec
-                i_spectrogram += 1
-            data["img"] = spectrogram.copy()
         plotter_manager.add_data(data)
         i_sin += 1
         i_cos += 1
         i_sinswp += 1
-        i_spec_buf += 1
         if i_sin >= len(sin_wave):
             i_sin = 0
         if i_cos >= len(cos_wave):
             i_cos = 0
         if i_sinswp >= len(sinesweep_wave):
             i_sinswp = 0
-        if i_spec_buf >= num_samples:
-            i_spec_buf -= n_spec_update
-            spec_buf[: len(spec_buf) - n_spec_update] = spec_buf[
-                n_spec_update:
-            ]
         time.sleep(1 / 50)
     plotter_manager.stop()
 
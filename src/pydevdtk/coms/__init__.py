@@ -1,5 +1,18 @@
 from .serial import Serial
-from .ble import Ble, BleStatus, BleDevice
+from .ble import (
+    Ble,
+    BleStatus,
+    BleDevice,
+    BleReconnectPolicy,
+    BleManufacturerDecoder,
+)
 
 
-__all__ = ["Serial", "Ble", "BleStatus", "BleDevice"]
+__all__ = [
+    "Serial",
+    "Ble",
+    "BleStatus",
+    "BleDevice",
+    "BleReconnectPolicy",
+    "BleManufacturerDecoder",
+]
@@ -1,8 +1,15 @@
 import asyncio
+import bisect
 import enum
+import functools
+import re
+import struct
 import threading
+import time
 from typing import Callable
 
+import numpy as np
+from numpy.typing import DTypeLike
 from bleak import BleakScanner, BleakClient
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
@@ -14,6 +21,7 @@ class BleStatus(enum.Enum):
     Connecting = enum.auto()
     Connected = enum.auto()
     Disconnecting = enum.auto()
+    Reconnecting = enum.auto()
 
 
 class BleDevice:
@@ -119,6 +127,554 @@ class BleService:
         self.characteristics = characteristics
 
 
+class BleReconnectPolicy:
+    """
+    Backoff policy for re-establishing a lost BLE connection.
+
+    The delay before reconnection attempt ``n`` (starting from 1) is
+    ``min(initial_delay * factor ** (n - 1), max_delay)``.
+
+    Parameters
+    ----------
+    initial_delay : float, optional
+        Delay before the first reconnection attempt, in seconds.
+        Defaults to 0.1.
+    max_delay : float, optional
+        Upper limit of the delay between attempts, in seconds.
+        Defaults to 10.
+    factor : float, optional
+        Multiplier applied to the delay after each failed attempt.
+        Defaults to 2.
+    max_attempts : int or None, optional
+        Number of attempts after which the device is given up and considered
+        disconnected. None for unlimited attempts. Defaults to None.
+
+    Attributes
+    ----------
+    initial_delay : float
+        Delay before the first reconnection attempt, in seconds.
+    max_delay : float
+        Upper limit of the delay between attempts, in seconds.
+    factor : float
+        Multiplier applied to the delay after each failed attempt.
+    max_attempts : int or None
+        Number of attempts after which the device is given up.
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = 0.1,
+        max_delay: float = 10.0,
+        factor: float = 2.0,
+        max_attempts: int | None = None,
+    ):
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self.max_attempts = max_attempts
+
+    def delay(self, attempt: int) -> float:
+        """
+        Returns the delay before the given reconnection attempt.
+
+        Parameters
+        ----------
+        attempt : int
+            The reconnection attempt number, starting from 1.
+
+        Returns
+        -------
+        float
+            The delay in seconds.
+        """
+        delay = self.initial_delay * self.factor ** (attempt - 1)
+        return min(delay, self.max_delay)
+
+
+class BleManufacturerDecoder:
+    """
+    Decoder of manufacturer specific advertisement data into typed arrays.
+
+    The payload layout is compiled once into a NumPy dtype. Every decoded
+    advertisement is copied into a preallocated ring of records, which is
+    drained in batches as one array per field.
+
+    Parameters
+    ----------
+    layout : dtype-like or str
+        Layout of the payload. Either a NumPy dtype or dtype string, such as
+        '<u2' or '<i2,<f4', structured for payloads with multiple fields, or
+        a `struct` format string with explicit byte order (one of '<', '>',
+        '!' or '='), such as '<hH'. Strings valid as both, such as '<h', are
+        parsed as NumPy dtype strings, except with `names`.
+    names : list of str or None, optional
+        Names of the fields of a `struct` format layout, one per format item
+        other than pad bytes. Defaults to 'f0', 'f1', ... if None.
+    capacity : int, optional
+        Number of records kept until drained. When full, the oldest records
+        are overwritten. Defaults to 4096.
+    offset : int, optional
+        Number of payload bytes preceding the layout. Defaults to 0.
+
+    Attributes
+    ----------
+    layout : numpy.dtype
+        The compiled payload layout.
+    capacity : int
+        Number of records kept until drained.
+    offset : int
+        Number of payload bytes preceding the layout.
+    dropped : int
+        Number of records overwritten before being drained.
+    invalid : int
+        Number of payloads too short for the layout.
+    """
+
+    _STRUCT_CODES = {
+        "?": "b1",
+        "b": "i1",
+        "B": "u1",
+        "h": "i2",
+        "H": "u2",
+        "i": "i4",
+        "I": "u4",
+        "l": "i4",
+        "L": "u4",
+        "q": "i8",
+        "Q": "u8",
+        "e": "f2",
+        "f": "f4",
+        "d": "f8",
+    }
+
+    def __init__(
+        self,
+        layout: DTypeLike | str,
+        names: list[str] | None = None,
+        capacity: int = 4096,
+        offset: int = 0,
+    ):
+        if isinstance(layout, str) and layout[:1] in "<>!=":
+            self.layout = self._parse_layout(layout, names)
+        else:
+            self.layout = np.dtype(layout)
+        self.capacity = capacity
+        self.offset = offset
+        self.dropped = 0
+        self.invalid = 0
+        self._raw = np.empty((capacity, self.layout.itemsize), np.uint8)
+        self._time = np.empty(capacity, np.float64)
+        self._rssi = np.empty(capacity, np.int16)
+        self._device = np.empty(capacity, np.int32)
+        self._addresses: list[str] = []
+        self._address_index: dict[str, int] = {}
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def decode(self, address: str, rssi: int, payload: bytes, t: float):
+        """
+        Decodes a payload into the next record.
+
+        Parameters
+        ----------
+        address : str
+            The address of the advertising device.
+        rssi : int
+            The RSSI of the advertisement.
+        payload : bytes
+            The manufacturer specific data, without the company ID.
+        t : float
+            The reception time, as returned by `time.time`.
+        """
+        size = self.layout.itemsize
+        with self._lock:
+            if len(payload) < self.offset + size:
+                self.invalid += 1
+                return
+            if address not in self._address_index:
+                self._address_index[address] = len(self._addresses)
+                self._addresses.append(address)
+            i = self._count % self.capacity
+            self._raw[i] = np.frombuffer(payload, np.uint8, size, self.offset)
+            self._time[i] = t
+            self._rssi[i] = rssi
+            self._device[i] = self._address_index[address]
+            if self._count >= self.capacity:
+                self.dropped += 1
+            self._count += 1
+
+    def drain(self) -> dict[str, np.ndarray]:
+        """
+        Returns the records decoded since the previous call, oldest first.
+
+        Returns
+        -------
+        dict of str to numpy.ndarray
+            Dictionary with the 'time', 'address' and 'rssi' arrays, and one
+            array per field of the layout. Non-structured layouts are returned
+            under the 'value' key.
+        """
+        with self._lock:
+            n = min(self._count, self.capacity)
+            i_start = (self._count - n) % self.capacity
+            order = (i_start + np.arange(n)) % self.capacity
+            values = self._raw[order].view(self.layout).reshape(n)
+            records = {
+                "time": self._time[order],
+                "address": (
+                    np.array(self._addresses)[self._device[order]]
+                    if n > 0
+                    else np.empty(0, str)
+                ),
+                "rssi": self._rssi[order],
+            }
+            self._count = 0
+        if self.layout.names is None:
+            records["value"] = values
+        else:
+            for name in self.layout.names:
+                records[name] = values[name]
+        return records
+
+    @classmethod
+    def _parse_layout(cls, layout: str, names: list[str] | None) -> np.dtype:
+        """
+        Parses a layout string with explicit byte order, as a NumPy dtype
+        string if possible and as a `struct` format otherwise. Layouts with
+        field names are always parsed as `struct` formats.
+        """
+        if names is None:
+            try:
+                layout_dtype = np.dtype(layout)
+            except TypeError:
+                pass
+            else:
+                # repeated items, such as '<2h', are fields of struct formats
+                if layout_dtype.subdtype is None:
+                    return layout_dtype
+        return cls._struct_to_dtype(layout, names)
+
+    @classmethod
+    def _struct_to_dtype(cls, fmt: str, names: list[str] | None) -> np.dtype:
+        byteorder = ">" if fmt[0] in ">!" else "<" if fmt[0] == "<" else "="
+        formats, offsets = [], []
+        offset = 0
+        for count, code in re.findall(r"(\d*)([a-zA-Z?])", fmt[1:]):
+            count = int(count) if count else 1
+            if code == "x":
+                offset += count
+                continue
+            if code == "s":
+                formats.append(f"S{count}")
+                size = count
+            elif code in cls._STRUCT_CODES:
+                item = np.dtype(byteorder + cls._STRUCT_CODES[code])
+                formats.append(item if count == 1 else (item, (count,)))
+                size = item.itemsize * count
+            else:
+                raise ValueError(f"Unsupported struct format code '{code}'")
+            offsets.append(offset)
+            offset += size
+        if names is None:
+            names = [f"f{i}" for i in range(len(formats))]
+        if len(names) != len(formats):
+            raise ValueError(
+                f"Expected {len(formats)} field names, got {len(names)}"
+            )
+        return np.dtype(
+            {
+                "names": names,
+                "formats": formats,
+                "offsets": offsets,
+                "itemsize": struct.calcsize(fmt),
+            }
+        )
+
+
+class BleLatencyHistogram:
+    """
+    Histogram of durations with fixed, logarithmically spaced buckets.
+
+    Parameters
+    ----------
+    buckets : tuple of float
+        Upper edges of the buckets in seconds. Durations greater than the last
+        edge are counted in an additional overflow bucket.
+
+    Attributes
+    ----------
+    buckets : tuple of float
+        Upper edges of the buckets in seconds.
+    counts : list of int
+        Number of recorded durations per bucket, including the overflow
+        bucket.
+    count : int
+        Total number of recorded durations.
+    total : float
+        Sum of all recorded durations in seconds.
+    min : float or None
+        Shortest recorded duration in seconds.
+    max : float or None
+        Longest recorded duration in seconds.
+    """
+
+    DEFAULT_BUCKETS = (
+        0.0001,
+        0.0002,
+        0.0005,
+        0.001,
+        0.002,
+        0.005,
+        0.01,
+        0.02,
+        0.05,
+        0.1,
+        0.2,
+        0.5,
+        1.0,
+        2.0,
+        5.0,
+        10.0,
+    )
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, duration: float):
+        """
+        Record a duration.
+
+        Parameters
+        ----------
+        duration : float
+            The duration in seconds.
+        """
+        self.counts[bisect.bisect_left(self.buckets, duration)] += 1
+        self.count += 1
+        self.total += duration
+        if self.min is None or duration < self.min:
+            self.min = duration
+        if self.max is None or duration > self.max:
+            self.max = duration
+
+    def percentile(self, q: float) -> float | None:
+        """
+        Estimates a percentile from the bucket counts.
+
+        Parameters
+        ----------
+        q : float
+            The percentile to estimate, between 0 and 100.
+
+        Returns
+        -------
+        float or None
+            The upper edge of the bucket containing the percentile, clipped to
+            the largest recorded duration. None if nothing is recorded.
+        """
+        if self.count == 0:
+            return None
+        rank = q / 100 * self.count
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= rank and count > 0:
+                edge = self.buckets[i] if i < len(self.buckets) else self.max
+                return min(edge, self.max)
+        return self.max
+
+    def snapshot(self) -> dict:
+        """
+        Returns a summary of the histogram.
+
+        Returns
+        -------
+        dict
+            Dictionary with the keys 'count', 'mean', 'min', 'max', 'p50',
+            'p90', 'p99', 'buckets' and 'counts'. Durations are in seconds.
+        """
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count > 0 else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "buckets": self.buckets,
+            "counts": list(self.counts),
+        }
+
+
+class BleMetrics:
+    """
+    Per-device timing and rate metrics of the BLE stack.
+
+    All durations are measured with `time.perf_counter` and recorded on the
+    asyncio event loop thread. The `snapshot` and `reset` methods can be
+    called from any thread.
+
+    Parameters
+    ----------
+    heartbeat_interval : float, optional
+        Period of the heartbeat used to measure the event loop lag, in
+        seconds. Defaults to 0.1.
+
+    Attributes
+    ----------
+    heartbeat_interval : float
+        Period of the heartbeat used to measure the event loop lag, in
+        seconds.
+    """
+
+    def __init__(self, heartbeat_interval: float = 0.1):
+        self.heartbeat_interval = heartbeat_interval
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Clears all the recorded metrics.
+        """
+        with self._lock:
+            self._t_reset = time.perf_counter()
+            self._devices: dict[str, dict] = {}
+            self._loop_lag = BleLatencyHistogram()
+
+    def snapshot(self) -> dict:
+        """
+        Returns the metrics recorded since the last reset.
+
+        Returns
+        -------
+        dict
+            Dictionary with the following keys:
+
+            - 'elapsed': seconds since the last reset.
+            - 'loop_lag': histogram summary of the event loop lag.
+            - 'devices': dictionary mapping the device address to a dictionary
+              with the keys 'discovery' (seconds from scan start until the
+              first advertisement), 'connect' (duration of the last
+              connection establishment, including service discovery),
+              'read' and 'write' (round-trip latency histogram summaries),
+              'reconnect' (histogram summary of the data gaps caused by
+              automatic reconnections) and 'notifications' (dictionary
+              mapping characteristic UUID to the notification 'count',
+              'rate' in notifications per second and histogram summary of
+              the 'callback' execution time).
+
+            Histogram summaries are described in
+            `BleLatencyHistogram.snapshot`.
+        """
+        with self._lock:
+            elapsed = time.perf_counter() - self._t_reset
+            devices = {}
+            for address, dev_metrics in self._devices.items():
+                notifications = {
+                    uuid: {
+                        "count": notify_metrics["callback"].count,
+                        "rate": (
+                            notify_metrics["callback"].count / elapsed
+                            if elapsed > 0
+                            else 0.0
+                        ),
+                        "callback": notify_metrics["callback"].snapshot(),
+                    }
+                    for uuid, notify_metrics in dev_metrics[
+                        "notifications"
+                    ].items()
+                }
+                devices[address] = {
+                    "discovery": dev_metrics["discovery"],
+                    "connect": dev_metrics["connect"],
+                    "read": dev_metrics["read"].snapshot(),
+                    "write": dev_metrics["write"].snapshot(),
+                    "reconnect": dev_metrics["reconnect"].snapshot(),
+                    "notifications": notifications,
+                }
+            return {
+                "elapsed": elapsed,
+                "loop_lag": self._loop_lag.snapshot(),
+                "devices": devices,
+            }
+
+    def record_discovery(self, address: str, duration: float):
+        """
+        Records the time from scan start until the device was first found.
+        Only the first advertisement of the device after a reset is recorded.
+        """
+        with self._lock:
+            dev_metrics = self._device(address)
+            if dev_metrics["discovery"] is None:
+                dev_metrics["discovery"] = duration
+
+    def record_connect(self, address: str, duration: float):
+        """
+        Records the duration of the connection establishment.
+        """
+        with self._lock:
+            self._device(address)["connect"] = duration
+
+    def record_read(self, address: str, duration: float):
+        """
+        Records the round-trip latency of a characteristic read.
+        """
+        with self._lock:
+            self._device(address)["read"].add(duration)
+
+    def record_write(self, address: str, duration: float):
+        """
+        Records the round-trip latency of a characteristic write.
+        """
+        with self._lock:
+            self._device(address)["write"].add(duration)
+
+    def record_reconnect(self, address: str, gap: float):
+        """
+        Records the gap between losing the connection and restoring it,
+        including the notification subscriptions.
+        """
+        with self._lock:
+            self._device(address)["reconnect"].add(gap)
+
+    def record_notification(
+        self, address: str, char_uuid: str, duration: float
+    ):
+        """
+        Records a received notification and the execution time of its
+        callback.
+        """
+        with self._lock:
+            notifications = self._device(address)["notifications"]
+            if char_uuid not in notifications:
+                notifications[char_uuid] = {"callback": BleLatencyHistogram()}
+            notifications[char_uuid]["callback"].add(duration)
+
+    def record_loop_lag(self, lag: float):
+        """
+        Records how late the event loop heartbeat was woken up.
+        """
+        with self._lock:
+            self._loop_lag.add(max(lag, 0.0))
+
+    def _device(self, address: str) -> dict:
+        if address not in self._devices:
+            self._devices[address] = {
+                "discovery": None,
+                "connect": None,
+                "read": BleLatencyHistogram(),
+                "write": BleLatencyHistogram(),
+                "reconnect": BleLatencyHistogram(),
+                "notifications": {},
+            }
+        return self._devices[address]
+
+
 class Ble:
     """
     A class that allows to utilize the BLE module of the device,
@@ -126,7 +682,7 @@ class Ble:
     and data operations including read, write and notify.
     """
 
-    def __init__(self):
+    def __init__(self, metrics: bool = False):
         """
         Initializes a new instance allowing to utilize the BLE module of the
         device, including scanning for BLE devices, connecting to BLE devices,
@@ -134,23 +690,43 @@ class Ble:
 
         Runs asyncio event loop in a separate thread which handles all BLE
         events.
+
+        Parameters
+        ----------
+        metrics : bool, optional
+            Whether to collect operation latency and rate metrics, retrieved
+            with `get_metrics`. When disabled, no timing is performed.
+            Defaults to False.
         """
         self.found_devices: dict[str, BleDevice] = {}
         self.on_device: Callable[[BleDevice], None] | None = None
         self.scanning = False
         self.scan_stop_event = asyncio.Event()
+        self.t_scan_start = None
+        self.metrics = BleMetrics() if metrics else None
+        self.manufacturer_decoders: dict[int, BleManufacturerDecoder] = {}
 
         self.on_connect: dict[str, Callable[[], None]] = {}
         self.on_disconnect: dict[str, Callable[[], None]] = {}
         self.status_devices: dict[str, BleStatus] = {}
         self.disconnect_events: dict[str, asyncio.Event] = {}
         self.connected_devices: dict[str, BleDevice] = {}
+        self.reconnect_policies: dict[str, BleReconnectPolicy] = {}
+        self.on_reconnect: dict[str, Callable[[float], None]] = {}
+        self.t_connection_lost: dict[str, float] = {}
+        self.subscriptions: dict[
+            str, dict[str, Callable[[bytes | bytearray], None]]
+        ] = {}
 
         self.event_loop = asyncio.new_event_loop()
         self.event_loop_thread = threading.Thread(
             target=self._asyncloop, daemon=True
         )
         self.event_loop_thread.start()
+        if self.metrics is not None:
+            asyncio.run_coroutine_threadsafe(
+                self._heartbeat(), self.event_loop
+            )
 
     def __del__(self):
         for dev in self.connected_devices.values():
@@ -172,6 +748,7 @@ class Ble:
         self.found_devices = {}  # clear previously found devices
         self.on_device = on_device
         self.scan_stop_event.clear()
+        self.t_scan_start = time.perf_counter()
         asyncio.run_coroutine_threadsafe(
             self._bluetooth_scan(self.scan_stop_event), self.event_loop
         )
@@ -208,16 +785,95 @@ class Ble:
         """
         return list(self.found_devices.values())
 
+    def register_manufacturer_decoder(
+        self, company_id: int, decoder: BleManufacturerDecoder
+    ):
+        """
+        Registers a decoder for the manufacturer specific advertisement data
+        of the given company ID. The advertisements are decoded during
+        scanning and retrieved in batches with `get_manufacturer_records`.
+
+        Parameters
+        ----------
+        company_id : int
+            The Bluetooth SIG company identifier.
+        decoder : BleManufacturerDecoder
+            The decoder for the manufacturer specific data.
+        """
+        self.manufacturer_decoders[company_id] = decoder
+
+    def unregister_manufacturer_decoder(self, company_id: int):
+        """
+        Removes the decoder registered for the given company ID.
+
+        Parameters
+        ----------
+        company_id : int
+            The Bluetooth SIG company identifier.
+        """
+        self.manufacturer_decoders.pop(company_id, None)
+
+    def get_manufacturer_records(
+        self, company_id: int
+    ) -> dict[str, np.ndarray] | None:
+        """
+        Returns the manufacturer specific data decoded since the previous call
+        for the given company ID.
+
+        Parameters
+        ----------
+        company_id : int
+            The Bluetooth SIG company identifier.
+
+        Returns
+        -------
+        dict of str to numpy.ndarray or None
+            The decoded records, described in `BleManufacturerDecoder.drain`.
+            None if no decoder is registered for the company ID.
+        """
+        if company_id not in self.manufacturer_decoders:
+            return None
+        return self.manufacturer_decoders[company_id].drain()
+
+    def get_metrics(self) -> dict | None:
+        """
+        Returns the latency and rate metrics collected since the last reset.
+
+        Returns
+        -------
+        dict or None
+            The metrics snapshot, described in `BleMetrics.snapshot`.
+            None if the metrics are not enabled.
+        """
+        if self.metrics is None:
+            return None
+        return self.metrics.snapshot()
+
+    def reset_metrics(self):
+        """
+        Clears the collected latency and rate metrics, if enabled.
+        """
+        if self.metrics is not None:
+            self.metrics.reset()
+
     def connect(
         self,
         dev: BleDevice,
         on_connect: Callable[[], None] | None = None,
         on_disconnect: Callable[[], None] | None = None,
+        reconnect: BleReconnectPolicy | None = None,
+        on_reconnect: Callable[[float], None] | None = None,
     ):
         """
         A method to connect to a BLE device if it is not already connected to
         it.
 
+        If `reconnect` is given, the connection is supervised: when it is lost
+        without calling `disconnect`, the status of the device changes to
+        `BleStatus.Reconnecting` and the connection is re-established with
+        the cached device handle, without scanning. The notifications
+        started with `start_notifications` are restored automatically.
+
         Parameters
         ----------
         dev : BleDevice
@@ -225,13 +881,26 @@ class Ble:
         on_connect : Callable[[], None] or None, optional
             Callback for when the connection is established. Defaults to None.
         on_disconnect : Callable[[], None] or None, optional
-            Callback for when the connection is terminated. Defaults to None.
+            Callback for when the connection is terminated. For supervised
+            connections, it is called only when `disconnect` is called or the
+            reconnection attempts are exhausted. Defaults to None.
+        reconnect : BleReconnectPolicy or None, optional
+            Backoff policy for re-establishing lost connections. None disables
+            the automatic reconnection. Defaults to None.
+        on_reconnect : Callable[[float], None] or None, optional
+            Callback for when a lost connection and its notifications are
+            restored. It receives the duration of the gap in seconds.
+            Defaults to None.
         """
         if not self.is_connected(dev):
             if on_connect is not None:
                 self.on_connect[dev.address] = on_connect
             if on_disconnect is not None:
                 self.on_disconnect[dev.address] = on_disconnect
+            if reconnect is not None:
+                self.reconnect_policies[dev.address] = reconnect
+            if on_reconnect is not None:
+                self.on_reconnect[dev.address] = on_reconnect
             self.disconnect_events[dev.address] = asyncio.Event()
             self.status_devices[dev.address] = BleStatus.Connecting
             asyncio.run_coroutine_threadsafe(
@@ -243,14 +912,18 @@ class Ble:
 
     def disconnect(self, dev: BleDevice):
         """
-        Disconnects a BLE device if it is currently connected to it.
+        Disconnects a BLE device if it is currently connected to it, or stops
+        reconnecting to it if the connection is supervised and was lost.
 
         Parameters
         ----------
         dev : BleDevice
             The BLE device to disconnect.
         """
-        if self.is_connected(dev):
+        if (
+            self.is_connected(dev)
+            or self.get_status(dev) == BleStatus.Reconnecting
+        ):
             self.status_devices[dev.address] = BleStatus.Disconnecting
             self.event_loop.call_soon_threadsafe(
                 self.disconnect_events[dev.address].set
@@ -297,8 +970,8 @@ class Ble:
         Returns
         -------
         BleStatus or None
-            The connection status of the device, if device is connected.
-            None if the device is not connected.
+            The connection status of the device, if device is connected or
+            it is being reconnected. None if the device is not connected.
         """
         if dev.address in self.status_devices:
             return self.status_devices[dev.address]
@@ -463,6 +1136,9 @@ class Ble:
             if char_uuid in chars_uuids:
                 i_char = chars_uuids.index(char_uuid)
                 if "notify" in chars_properties[i_char]:
+                    self.subscriptions.setdefault(dev.address, {})[
+                        char_uuid
+                    ] = on_data
                     asyncio.run_coroutine_threadsafe(
                         self._bluetooth_start_notify(
                             client, char_uuid, on_data
@@ -498,6 +1174,9 @@ class Ble:
             if char_uuid in chars_uuids:
                 i_char = chars_uuids.index(char_uuid)
                 if "notify" in chars_properties[i_char]:
+                    self.subscriptions.get(dev.address, {}).pop(
+                        char_uuid, None
+                    )
                     asyncio.run_coroutine_threadsafe(
                         self._bluetooth_stop_notify(client, char_uuid),
                         self.event_loop,
@@ -522,6 +1201,19 @@ class Ble:
             manufacturer_data=advertisement_data.manufacturer_data,
         )
         dev._device_hndl = device
+        if self.manufacturer_decoders:
+            t = time.time()
+            for company_id, payload in dev.manufacturer_data.items():
+                decoder = self.manufacturer_decoders.get(company_id)
+                if decoder is not None:
+                    decoder.decode(device.address, dev.rssi, payload, t)
+        if (
+            self.metrics is not None
+            and device.address not in self.found_devices
+        ):
+            self.metrics.record_discovery(
+                device.address, time.perf_counter() - self.t_scan_start
+            )
         self.found_devices[device.address] = dev
         if self.on_device is not None:
             self.on_device(dev)
@@ -529,31 +1221,113 @@ class Ble:
     async def _bluetooth_connect(
         self, device: BleDevice, disconnect_event: asyncio.Event
     ):
-        async with BleakClient(
-            device._device_hndl,
-            self._disconnect_callback,
-        ) as client:
-            device._client = client
-            self.connected_devices[client.address] = device
-            self.status_devices[client.address] = BleStatus.Connected
-            if client.address in self.on_connect:
-                self.on_connect[client.address]()
-            await disconnect_event.wait()
-            del self.disconnect_events[client.address]
+        address = device.address
+        attempt = 0
+        while True:
+            t_start = time.perf_counter()
+            try:
+                async with BleakClient(
+                    device._device_hndl,
+                    self._disconnect_callback,
+                ) as client:
+                    if self.metrics is not None:
+                        self.metrics.record_connect(
+                            address, time.perf_counter() - t_start
+                        )
+                    device._client = client
+                    if attempt == 0:
+                        self.connected_devices[address] = device
+                        self.status_devices[address] = BleStatus.Connected
+                        if address in self.on_connect:
+                            self.on_connect[address]()
+                    else:
+                        await self._restore_connection(device)
+                        attempt = 0
+                    await disconnect_event.wait()
+            except Exception:
+                if attempt == 0:
+                    raise
+            status = self.status_devices.get(address)
+            if status != BleStatus.Reconnecting:
+                if status is not None:
+                    # disconnect() was called during a failed reconnection
+                    # attempt, so the disconnect callback wasn't called
+                    self._teardown_connection(address)
+                break
+            attempt += 1
+            policy = self.reconnect_policies[address]
+            if (
+                policy.max_attempts is not None
+                and attempt > policy.max_attempts
+            ):
+                self._teardown_connection(address)
+                break
+            disconnect_event.clear()
+            try:
+                # disconnect() sets the event to stop reconnecting
+                await asyncio.wait_for(
+                    disconnect_event.wait(), policy.delay(attempt)
+                )
+            except asyncio.TimeoutError:
+                pass
+            if self.status_devices.get(address) != BleStatus.Reconnecting:
+                self._teardown_connection(address)
+                break
+        self.disconnect_events.pop(address, None)
+
+    async def _restore_connection(self, device: BleDevice):
+        address = device.address
+        if self.status_devices[address] != BleStatus.Reconnecting:
+            # disconnect() was called during the reconnection attempt
+            return
+        for uuid, on_data in self.subscriptions.get(address, {}).items():
+            await self._bluetooth_start_notify(device._client, uuid, on_data)
+        self.connected_devices[address] = device
+        self.status_devices[address] = BleStatus.Connected
+        gap = time.perf_counter() - self.t_connection_lost.pop(address)
+        if self.metrics is not None:
+            self.metrics.record_reconnect(address, gap)
+        if address in self.on_reconnect:
+            self.on_reconnect[address](gap)
 
     def _disconnect_callback(self, client: BleakClient):
+        status = self.status_devices.get(client.address)
+        if status == BleStatus.Reconnecting:
+            return
+        if (
+            client.address in self.reconnect_policies
+            and status == BleStatus.Connected
+        ):
+            # connection lost, keep the state for reconnecting
+            self.t_connection_lost[client.address] = time.perf_counter()
+            self.status_devices[client.address] = BleStatus.Reconnecting
+            del self.connected_devices[client.address]
+            self.disconnect_events[client.address].set()
+            return
         if client.address in self.disconnect_events:
             self.disconnect_events[client.address].set()
-        del self.connected_devices[client.address]
-        del self.status_devices[client.address]
-        if client.address in self.on_connect:
-            del self.on_connect[client.address]
-        if client.address in self.on_disconnect:
-            self.on_disconnect[client.address]()
-            del self.on_disconnect[client.address]
+        self._teardown_connection(client.address)
+
+    def _teardown_connection(self, address: str):
+        self.connected_devices.pop(address, None)
+        del self.status_devices[address]
+        self.reconnect_policies.pop(address, None)
+        self.on_reconnect.pop(address, None)
+        self.t_connection_lost.pop(address, None)
+        self.subscriptions.pop(address, None)
+        if address in self.on_connect:
+            del self.on_connect[address]
+        if address in self.on_disconnect:
+            self.on_disconnect[address]()
+            del self.on_disconnect[address]
 
     async def _bluetooth_read(self, client: BleakClient, uuid: str):
-        return await client.read_gatt_char(uuid)
+        if self.metrics is None:
+            return await client.read_gatt_char(uuid)
+        t_start = time.perf_counter()
+        data = await client.read_gatt_char(uuid)
+        self.metrics.record_read(client.address, time.perf_counter() - t_start)
+        return data
 
     async def _bluetooth_write(
         self,
@@ -562,7 +1336,14 @@ class Ble:
         data: bytes | bytearray,
         response: bool,
     ):
-        return await client.write_gatt_char(uuid, data, response)
+        if self.metrics is None:
+            return await client.write_gatt_char(uuid, data, response)
+        t_start = time.perf_counter()
+        result = await client.write_gatt_char(uuid, data, response)
+        self.metrics.record_write(
+            client.address, time.perf_counter() - t_start
+        )
+        return result
 
     async def _bluetooth_start_notify(
         self,
@@ -570,11 +1351,42 @@ class Ble:
         uuid: str,
         on_data: Callable[[bytes | bytearray], None],
     ):
-        await client.start_notify(uuid, lambda _, data: on_data(data))
+        if self.metrics is None:
+            await client.start_notify(uuid, lambda _, data: on_data(data))
+        else:
+            await client.start_notify(
+                uuid,
+                functools.partial(
+                    self._timed_notification, client.address, uuid, on_data
+                ),
+            )
+
+    def _timed_notification(
+        self,
+        address: str,
+        uuid: str,
+        on_data: Callable[[bytes | bytearray], None],
+        _,
+        data: bytes | bytearray,
+    ):
+        t_start = time.perf_counter()
+        on_data(data)
+        self.metrics.record_notification(
+            address, uuid, time.perf_counter() - t_start
+        )
 
     async def _bluetooth_stop_notify(self, client: BleakClient, uuid: str):
         await client.stop_notify(uuid)
 
+    async def _heartbeat(self):
+        interval = self.metrics.heartbeat_interval
+        while True:
+            t_start = time.perf_counter()
+            await asyncio.sleep(interval)
+            self.metrics.record_loop_lag(
+                time.perf_counter() - t_start - interval
+            )
+
     def _asyncloop(self):
         asyncio.set_event_loop(self.event_loop)
         self.event_loop.run_forever()
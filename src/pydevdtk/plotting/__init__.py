@@ -1,5 +1,45 @@
-from .plotter import Plotter
+from .frame_scheduler import PacingMode
+from .frame_sinks import (
+    FrameSink,
+    PipeSink,
+    PngSequenceSink,
+    SharedFrameReader,
+    SharedMemorySink,
+)
+from .plotter import Plotter, UpdatePolicy
 from .plotter_base import Plotter as PlotterBase
-from .plotter_manager import PlotterManager
+from .plotter_manager import OverflowPolicy, PlotterManager
+from .transforms import (
+    RMS,
+    Chain,
+    Decimate,
+    FIRFilter,
+    IIRFilter,
+    Spectrum,
+    Transform,
+)
+from .trigger import Trigger, TriggerEdge, TriggerMode
 
-__all__ = ["Plotter", "PlotterBase", "PlotterManager"]
+__all__ = [
+    "Plotter",
+    "PlotterBase",
+    "PlotterManager",
+    "UpdatePolicy",
+    "PacingMode",
+    "OverflowPolicy",
+    "FrameSink",
+    "PngSequenceSink",
+    "PipeSink",
+    "SharedMemorySink",
+    "SharedFrameReader",
+    "Transform",
+    "FIRFilter",
+    "IIRFilter",
+    "RMS",
+    "Decimate",
+    "Spectrum",
+    "Chain",
+    "Trigger",
+    "TriggerEdge",
+    "TriggerMode",
+]
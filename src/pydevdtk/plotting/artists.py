@@ -0,0 +1,327 @@
+import matplotlib.axes
+import matplotlib.collections
+import matplotlib.image
+import matplotlib.path
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+class BarCollection(matplotlib.collections.PolyCollection):
+    """
+    Bar plot drawn as a single collection.
+
+    The vertices of all the bars are kept in one array of shape
+    (num_bars, 5, 2), and the path of every bar is a view into it, so the
+    heights of all the bars are updated with one NumPy operation and the bars
+    are drawn with one ``draw_artist`` call.
+
+    Parameters
+    ----------
+    x : array-like
+        Positions of the bars.
+    width : float or array-like, optional
+        Widths of the bars, by default 0.8.
+    bottom : float or array-like, optional
+        Positions of the bottom edges of the bars, by default 0.
+    align : {'center', 'edge'}, optional
+        Alignment of the bars to the `x` positions, by default 'center'.
+    kwargs
+        Additional keyword arguments for `matplotlib.collections.Collection`.
+    """
+
+    _CODES = np.array(
+        [
+            matplotlib.path.Path.MOVETO,
+            matplotlib.path.Path.LINETO,
+            matplotlib.path.Path.LINETO,
+            matplotlib.path.Path.LINETO,
+            matplotlib.path.Path.CLOSEPOLY,
+        ],
+        dtype=matplotlib.path.Path.code_type,
+    )
+
+    def __init__(
+        self,
+        x: ArrayLike,
+        width: float | ArrayLike = 0.8,
+        bottom: float | ArrayLike = 0,
+        align: str = "center",
+        **kwargs,
+    ):
+        x = np.asarray(x, dtype=float)
+        width = np.broadcast_to(np.asarray(width, dtype=float), x.shape)
+        self._bottom = np.broadcast_to(
+            np.asarray(bottom, dtype=float), x.shape
+        ).copy()
+        if align == "center":
+            left = x - width / 2
+        elif align == "edge":
+            left = x
+        else:
+            raise ValueError(f"Invalid alignment {align}")
+        self._verts = np.empty((x.size, 5, 2))
+        self._verts[:, [0, 1, 4], 0] = left[:, np.newaxis]
+        self._verts[:, 2:4, 0] = (left + width)[:, np.newaxis]
+        self._verts[:, :, 1] = self._bottom[:, np.newaxis]
+        super().__init__([], **kwargs)
+        self._paths = [
+            matplotlib.path.Path(verts, self._CODES) for verts in self._verts
+        ]
+        if np.ndim(bottom) == 0:
+            self.sticky_edges.y.append(float(bottom))
+
+    def get_heights(self) -> np.ndarray:
+        """
+        Returns the heights of the bars.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array with the height of every bar.
+        """
+        return self._verts[:, 1, 1] - self._bottom
+
+    def set_heights(self, heights: ArrayLike):
+        """
+        Set the heights of all the bars.
+
+        Parameters
+        ----------
+        heights : array-like
+            Heights of the bars, of shape (num_bars,).
+        """
+        heights = np.asarray(heights, dtype=float)
+        self._verts[:, 1:3, 1] = (self._bottom + heights)[:, np.newaxis]
+        self.stale = True
+
+
+class MultiLineCollection(matplotlib.collections.LineCollection):
+    """
+    Lines of multiple channels drawn as a single collection.
+
+    The vertices of all the lines are kept in one array of shape
+    (num_channels, size, 2), and the path of every line is a view into it,
+    so the y values of all the channels are updated with one NumPy operation
+    and the lines are drawn with one ``draw_artist`` call.
+
+    Parameters
+    ----------
+    size : int
+        Number of samples of every line, drawn at x positions 0 to
+        ``size - 1``.
+    num_channels : int
+        Number of lines.
+    channel_offsets : float or array-like, optional
+        Vertical offsets added to the channels, by default 0.
+    kwargs
+        Additional keyword arguments for
+        `matplotlib.collections.LineCollection`.
+
+    Attributes
+    ----------
+    channel_offsets : numpy.ndarray
+        Vertical offset of every channel.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        num_channels: int,
+        channel_offsets: float | ArrayLike = 0,
+        **kwargs,
+    ):
+        self.channel_offsets = np.broadcast_to(
+            np.asarray(channel_offsets, dtype=float), (num_channels,)
+        ).copy()
+        self._verts = np.full((num_channels, size, 2), np.nan)
+        self._verts[:, :, 0] = np.arange(size)
+        super().__init__([], **kwargs)
+        self._paths = [matplotlib.path.Path(verts) for verts in self._verts]
+
+    def set_ydata(self, y: ArrayLike):
+        """
+        Set the y values of all the lines.
+
+        Parameters
+        ----------
+        y : array-like
+            The y values, of shape (size, num_channels), without the channel
+            offsets.
+        """
+        y = np.asarray(y, dtype=float)
+        self._verts[:, :, 1] = y.T + self.channel_offsets[:, np.newaxis]
+        self.stale = True
+
+
+class FastImage(matplotlib.image.AxesImage):
+    """
+    Image with a fixed shape and data type, colormapped through a lookup
+    table.
+
+    The frames are copied into a preallocated buffer, and the colors of all
+    the pixels are looked up in a table of RGBA bytes precomputed from the
+    colormap and the color limits, so matplotlib doesn't normalize and
+    colormap every frame. Frames of ``uint8`` and ``uint16`` data type index
+    the table directly, while frames of other data types are scaled to the
+    colors of the colormap with the cached color limits. The table is
+    recomputed when the colormap or the color limits change.
+
+    When the image is shown one to one, with every image pixel covering one
+    display pixel, the RGBA bytes are drawn as they are, without
+    resampling.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        The axis containing the image.
+    shape : tuple[int, int]
+        Shape of the frames.
+    dtype : dtype-like
+        Data type of the frames.
+    vmin, vmax : float or None, optional
+        Color limits, by default None for the range of the data type for
+        integer data types, and (0, 1) for the other data types.
+    kwargs
+        Additional keyword arguments for `matplotlib.image.AxesImage`.
+    """
+
+    def __init__(
+        self,
+        ax: matplotlib.axes.Axes,
+        shape: tuple[int, int],
+        dtype: np.dtype,
+        vmin: float | None = None,
+        vmax: float | None = None,
+        **kwargs,
+    ):
+        dtype = np.dtype(dtype)
+        if np.issubdtype(dtype, np.integer):
+            info = np.iinfo(dtype)
+            default_clim = (info.min, info.max)
+        else:
+            default_clim = (0, 1)
+        self._frame = None
+        super().__init__(ax, **kwargs)
+        self._rgba = np.zeros((*shape, 4), np.uint8)
+        if dtype in (np.uint8, np.uint16):
+            self._scaled = None
+        else:
+            self._scaled = np.empty(shape)
+        super().set_data(self._rgba)
+        # draw from the preallocated bytes instead of their masked copy
+        self._A = self._rgba
+        self._frame = np.zeros(shape, dtype)
+        self.set_extent(self.get_extent())
+        self.set_clim(
+            default_clim[0] if vmin is None else vmin,
+            default_clim[1] if vmax is None else vmax,
+        )
+
+    def get_array(self) -> np.ndarray:
+        """
+        Returns the current frame.
+
+        Returns
+        -------
+        numpy.ndarray
+            The frame buffer, of the fixed shape and data type.
+        """
+        return self._frame
+
+    def set_data(self, A: ArrayLike):
+        """
+        Set the current frame.
+
+        Parameters
+        ----------
+        A : array-like
+            The frame, of the fixed shape. Values of other data types are
+            cast to the data type of the image.
+        """
+        np.copyto(self._frame, A, casting="unsafe")
+        self._apply_lut()
+
+    def changed(self):
+        if self._frame is not None:
+            self._update_lut()
+            self._apply_lut()
+        super().changed()
+
+    def _update_lut(self):
+        """
+        Compute the table of RGBA bytes for the colormap and the color
+        limits.
+        """
+        if self._scaled is None:
+            num_values = np.iinfo(self._frame.dtype).max + 1
+            values = self.norm(np.arange(num_values))
+            self._lut = self.cmap(values, bytes=True)
+        else:
+            # indices of the colors, with the color of NaNs last
+            num_colors = self.cmap.N
+            self._lut = np.concatenate(
+                (
+                    self.cmap(np.arange(num_colors), bytes=True),
+                    self.cmap([np.nan], bytes=True),
+                )
+            )
+            vmin, vmax = self.norm.vmin, self.norm.vmax
+            self._scale = num_colors / ((vmax - vmin) or 1)
+
+    def _apply_lut(self):
+        """
+        Colormap the current frame into the RGBA bytes.
+        """
+        if self._scaled is None:
+            np.take(self._lut, self._frame, axis=0, out=self._rgba)
+        else:
+            scaled = self._scaled
+            np.subtract(self._frame, self.norm.vmin, out=scaled)
+            scaled *= self._scale
+            num_colors = self._lut.shape[0] - 1
+            np.clip(scaled, 0, num_colors - 1, out=scaled)
+            np.nan_to_num(scaled, copy=False, nan=num_colors)
+            indices = scaled.astype(np.intp)
+            np.take(self._lut, indices, axis=0, out=self._rgba)
+        # the RGBA bytes are modified in place, drop the cached copy used
+        # for resampling
+        self._imcache = None
+        self.stale = True
+
+    def draw(self, renderer):
+        image = self._unscaled_image()
+        if image is None:
+            super().draw(renderer)
+            return
+        rgba, x, y = image
+        gc = renderer.new_gc()
+        self._set_gc_clip(gc)
+        gc.set_alpha(self._get_scalar_alpha())
+        renderer.draw_image(gc, x, y, rgba)
+        gc.restore()
+        self.stale = False
+
+    def _unscaled_image(self) -> tuple[np.ndarray, int, int] | None:
+        """
+        Returns the RGBA bytes oriented for drawing and the position of
+        their lower left corner in display coordinates, if the image is
+        shown one to one, otherwise None.
+        """
+        if not self.get_visible() or not self.get_transform().is_affine:
+            return None
+        left, right, bottom, top = self.get_extent()
+        if self.origin == "upper":
+            bottom, top = top, bottom
+        # outer edges of the first and the last rows and columns
+        (x0, y0), (x1, y1) = self.get_transform().transform(
+            [(left, bottom), (right, top)]
+        )
+        num_rows, num_cols = self._frame.shape
+        if abs(x1 - x0 - num_cols) >= 1:
+            return None
+        # the renderer draws the rows of the bytes from the bottom up
+        if abs(y1 - y0 - num_rows) < 1:
+            return self._rgba, round(x0), round(y0)
+        if abs(y0 - y1 - num_rows) < 1:
+            return self._rgba[::-1], round(x0), round(y1)
+        return None
@@ -0,0 +1,130 @@
+import math
+from typing import Callable
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+class Autoscaler:
+    """
+    Throttled autoscaling of the limits of one axis dimension.
+
+    The running minimum and maximum of the incoming data are tracked
+    incrementally. The limits are expanded when the data leaves them, and
+    shrunk when the extent of the shown data falls below a fraction of the
+    limits. New limits are padded by a margin, and are changed at most
+    `max_rate` times per second, so the full redraw that follows a change of
+    the limits is rare and blit-only frames stay the common case.
+
+    Parameters
+    ----------
+    margin : float, optional
+        Padding added on both sides of the data extent, as a fraction of
+        the extent, by default 0.1.
+    shrink_ratio : float, optional
+        The limits are shrunk when the extent of the shown data falls below
+        this fraction of the limits, by default 0.5.
+    max_rate : float, optional
+        Maximum number of changes of the limits per second, by default 2.0.
+
+    Attributes
+    ----------
+    margin : float
+        Padding added on both sides of the data extent.
+    shrink_ratio : float
+        Fraction of the limits below which the limits are shrunk.
+    min_interval : float
+        Minimum time between two changes of the limits, in seconds.
+    data_min : float
+        Running minimum of the data.
+    data_max : float
+        Running maximum of the data.
+    limits : tuple[float, float] or None
+        The current limits, None before the first data arrives.
+    """
+
+    def __init__(
+        self,
+        margin: float = 0.1,
+        shrink_ratio: float = 0.5,
+        max_rate: float = 2.0,
+    ):
+        self.margin = margin
+        self.shrink_ratio = shrink_ratio
+        self.min_interval = 1 / max_rate
+        self.data_min = math.inf
+        self.data_max = -math.inf
+        self.limits = None
+        self._t_relayout = -math.inf
+        self._t_check = -math.inf
+
+    def update(self, values: float | ArrayLike):
+        """
+        Track the extent of new data.
+
+        Parameters
+        ----------
+        values : float or array-like
+            New data values. NaNs are ignored.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size == 0:
+            return
+        vmin = np.fmin.reduce(values)
+        vmax = np.fmax.reduce(values)
+        if vmin < self.data_min:
+            self.data_min = float(vmin)
+        if vmax > self.data_max:
+            self.data_max = float(vmax)
+
+    def new_limits(
+        self,
+        t_now: float,
+        extent: Callable[[], tuple[float, float]],
+    ) -> tuple[float, float] | None:
+        """
+        Returns new limits if they need to change.
+
+        Parameters
+        ----------
+        t_now : float
+            Current time, as returned by `time.perf_counter`.
+        extent : Callable[[], tuple[float, float]]
+            Function returning the minimum and the maximum of the shown data,
+            called at most `max_rate` times per second to check whether the
+            limits can shrink.
+
+        Returns
+        -------
+        tuple[float, float] or None
+            The new limits, or None if the limits stay the same.
+        """
+        if t_now - self._t_relayout < self.min_interval:
+            return None
+        if not self.data_min <= self.data_max:
+            return None
+        if self.limits is not None:
+            low, high = self.limits
+            if low <= self.data_min and self.data_max <= high:
+                if t_now - self._t_check < self.min_interval:
+                    return None
+                self._t_check = t_now
+                # the running extent includes data no longer shown
+                self.data_min, self.data_max = extent()
+                span = self.data_max - self.data_min
+                if not 0 <= span < self.shrink_ratio * (high - low):
+                    return None
+        self._t_relayout = t_now
+        self.limits = self._pad(self.data_min, self.data_max)
+        return self.limits
+
+    def _pad(self, vmin: float, vmax: float) -> tuple[float, float]:
+        """
+        Returns the limits for the data extent, with the margin added.
+        """
+        span = vmax - vmin
+        if span > 0:
+            pad = self.margin * span
+        else:
+            pad = max(abs(vmin) * self.margin, 0.5)
+        return vmin - pad, vmax + pad
@@ -0,0 +1,235 @@
+import dataclasses
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from numpy.typing import ArrayLike
+
+if TYPE_CHECKING:
+    from .plotter import UpdatePolicy
+    from .transforms import Transform
+    from .trigger import Trigger
+
+
+@dataclass
+class Command:
+    """
+    Base class of the commands sent from `PlotterManager` to the plotter
+    process.
+
+    The fields of a command, apart from `kwargs`, are the positional
+    arguments of the plotter method executing it, in order. The plotters map
+    the command types to their methods with a dispatch table.
+    """
+
+    def args(self) -> tuple:
+        """
+        Returns the positional arguments of the plotter method.
+
+        Returns
+        -------
+        tuple
+            Values of the fields of the command, except `kwargs`.
+        """
+        return tuple(
+            getattr(self, f.name)
+            for f in dataclasses.fields(self)
+            if f.name != "kwargs"
+        )
+
+    def keywords(self) -> dict:
+        """
+        Returns the keyword arguments of the plotter method.
+
+        Returns
+        -------
+        dict
+            The `kwargs` field of the command, or an empty dictionary if the
+            command doesn't have one.
+        """
+        return getattr(self, "kwargs", {})
+
+
+@dataclass
+class Show(Command):
+    """Show the plotter window."""
+
+
+@dataclass
+class Close(Command):
+    """Close the plotter window."""
+
+
+@dataclass
+class CreateFigure(Command):
+    """Create a figure with a grid of axes."""
+
+    fig_id: str
+    nrows: int
+    ncols: int
+    kwargs: dict = field(default_factory=dict)
+
+
+@dataclass
+class CreateAxis(Command):
+    """Create an axis at a position in the grid of a figure."""
+
+    ax_id: str
+    fig_id: str
+    irow: int
+    icol: int
+    nrows: int
+    ncols: int
+
+
+@dataclass
+class ModifyAxis(Command):
+    """Modify the limits, labels, ticks and legend of an axis."""
+
+    ax_id: str
+    xlim: tuple[float, float] | None = None
+    ylim: tuple[float, float] | None = None
+    title: str | None = None
+    xlabel: str | None = None
+    ylabel: str | None = None
+    xticks: ArrayLike | None = None
+    xticklabels: ArrayLike | None = None
+    yticks: ArrayLike | None = None
+    yticklabels: ArrayLike | None = None
+    legend: bool = False
+
+
+@dataclass
+class SetAutoscale(Command):
+    """Enable or disable the autoscaling of an axis."""
+
+    ax_id: str
+    axis: str | None
+    margin: float
+    shrink_ratio: float
+    max_rate: float
+
+
+@dataclass
+class CreateLinePlot(Command):
+    """Create a line plot."""
+
+    artist_id: str
+    ax_id: str
+    size: int
+    decimate: bool = False
+    time_window: float | None = None
+    trigger: "Trigger | None" = None
+    kwargs: dict = field(default_factory=dict)
+
+
+@dataclass
+class CreateMultiLinePlot(Command):
+    """Create a multi-channel line plot."""
+
+    artist_id: str
+    ax_id: str
+    size: int
+    num_channels: int
+    channel_offsets: float | ArrayLike | None = None
+    kwargs: dict = field(default_factory=dict)
+
+
+@dataclass
+class CreateScatterPlot(Command):
+    """Create a scatter plot."""
+
+    artist_id: str
+    ax_id: str
+    num_points: int
+    time_window: float | None = None
+    kwargs: dict = field(default_factory=dict)
+
+
+@dataclass
+class CreateBarPlot(Command):
+    """Create a bar plot."""
+
+    artist_id: str
+    ax_id: str
+    num_bars: int
+    kwargs: dict = field(default_factory=dict)
+
+
+@dataclass
+class CreateHistogramPlot(Command):
+    """Create a histogram plot."""
+
+    artist_id: str
+    ax_id: str
+    edges: ArrayLike
+    window: int | None = None
+    kwargs: dict = field(default_factory=dict)
+
+
+@dataclass
+class CreateImagePlot(Command):
+    """Create an image plot."""
+
+    artist_id: str
+    ax_id: str
+    img_shape: tuple[int, int]
+    cbar: bool = False
+    dtype: str | None = None
+    kwargs: dict = field(default_factory=dict)
+
+
+@dataclass
+class CreateWaterfallPlot(Command):
+    """Create a waterfall plot."""
+
+    artist_id: str
+    ax_id: str
+    num_rows: int
+    num_cols: int
+    cbar: bool = False
+    kwargs: dict = field(default_factory=dict)
+
+
+@dataclass
+class SetUpdatePolicy(Command):
+    """Set the update policy of an artist."""
+
+    artist_id: str
+    policy: "UpdatePolicy"
+
+
+@dataclass
+class ArmTrigger(Command):
+    """Arm the trigger of a line plot."""
+
+    artist_id: str
+
+
+@dataclass
+class AddTransform(Command):
+    """Feed an artist with a signal derived from another artist or stream."""
+
+    source_id: str
+    target_id: str
+    transform: "Transform"
+    item_shape: tuple[int, ...] = ()
+
+
+@dataclass
+class AttachSharedRing(Command):
+    """Attach the shared memory ring feeding an artist."""
+
+    artist_id: str
+    name: str
+    capacity: int
+    item_shape: tuple[int, ...]
+    dtype: str
+
+
+@dataclass
+class Batch(Command):
+    """
+    Several commands sent as one message and executed in order.
+    """
+
+    commands: list[Command] = field(default_factory=list)
@@ -0,0 +1,146 @@
+import math
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .ring_buffer import RingBuffer
+
+
+class MinMaxDecimator:
+    """
+    Incremental min/max envelope of the samples in a ring buffer.
+
+    The samples are grouped into buckets of consecutive samples, aligned to
+    the absolute sample index so the buckets don't change as the data
+    scrolls. For every bucket only the minimum and the maximum are kept. The
+    envelope has two points per bucket, so the number of vertices handed to
+    matplotlib depends only on the number of buckets and not on the size of
+    the buffer.
+
+    Parameters
+    ----------
+    buffer : RingBuffer
+        Buffer of scalar samples to decimate. The decimator must be updated
+        with the same samples appended to the buffer.
+    num_columns : int
+        Number of buckets spanning the whole buffer, usually the pixel width
+        of the axis.
+
+    Attributes
+    ----------
+    buffer : RingBuffer
+        Buffer of the decimated samples.
+    num_columns : int
+        Number of buckets spanning the whole buffer.
+    bucket_size : int
+        Number of samples in a bucket.
+    buckets : RingBuffer
+        Minimum and maximum of the recently completed buckets.
+    count : int
+        Total number of samples added to the decimator.
+    """
+
+    def __init__(self, buffer: RingBuffer, num_columns: int):
+        self.buffer = buffer
+        self.rebuild(num_columns)
+
+    def rebuild(self, num_columns: int):
+        """
+        Change the number of buckets and recompute the envelope from the
+        samples in the buffer.
+
+        Parameters
+        ----------
+        num_columns : int
+            Number of buckets spanning the whole buffer.
+        """
+        size = self.buffer.size
+        self.num_columns = max(1, num_columns)
+        self.bucket_size = max(1, math.ceil(size / self.num_columns))
+        self.buckets = RingBuffer(size // self.bucket_size + 2, (2,))
+        num_valid = min(self.buffer.count, size)
+        self.count = self.buffer.count - num_valid
+        self._partial = np.full(2, np.nan)
+        self.append(self.buffer.view()[size - num_valid :])
+
+    def append(self, values: float | ArrayLike):
+        """
+        Add one sample or a batch of samples.
+
+        Parameters
+        ----------
+        values : float or array-like
+            New sample or 1-D array of new samples.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        n = values.size
+        bucket_size = self.bucket_size
+        fill = self.count % bucket_size
+        if fill:
+            head = values[: bucket_size - fill]
+            self._partial = self._reduce(np.concatenate((self._partial, head)))
+            if fill + head.size == bucket_size:
+                self.buckets.append(self._partial)
+                self._partial = np.full(2, np.nan)
+            values = values[head.size :]
+        num_full = values.size // bucket_size
+        if num_full:
+            full = values[: num_full * bucket_size].reshape(num_full, -1)
+            self.buckets.append(self._reduce(full, axis=1))
+        rest = values[num_full * bucket_size :]
+        if rest.size:
+            self._partial = self._reduce(rest)
+        self.count += n
+
+    def envelope(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the envelope of the samples in the buffer.
+
+        The x coordinates are sample positions in the buffer, from 0 for the
+        oldest sample. The bucket cut by the start of the buffer is
+        recomputed from the samples remaining in the buffer.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            The x and y coordinates of the envelope, with the minimum and the
+            maximum of every bucket as consecutive points.
+        """
+        bucket_size = self.bucket_size
+        num_complete = self.count // bucket_size
+        num_stored = min(num_complete, self.buckets.size)
+        values = self.buckets.view()[self.buckets.size - num_stored :]
+        starts = np.arange(num_complete - num_stored, num_complete)
+        if self.count % bucket_size:
+            values = np.concatenate((values, self._partial[np.newaxis]))
+            starts = np.append(starts, num_complete)
+        starts *= bucket_size
+        window_start = self.count - self.buffer.size
+        visible = starts + bucket_size > window_start
+        values = values[visible]
+        x = starts[visible] - window_start
+        if x.size and x[0] < 0:
+            num_cut = min(x[0] + bucket_size, self.buffer.size)
+            i_oldest = self.buffer.index
+            cut = np.take(
+                self.buffer.data,
+                np.arange(i_oldest, i_oldest + num_cut),
+                mode="wrap",
+            )
+            values = values.copy()
+            values[0] = self._reduce(cut)
+            x[0] = 0
+        return np.repeat(x, 2), values.ravel()
+
+    @staticmethod
+    def _reduce(values: np.ndarray, axis: int | None = None) -> np.ndarray:
+        """
+        Returns the minimum and the maximum of the values, ignoring NaNs.
+        """
+        return np.stack(
+            (
+                np.fmin.reduce(values, axis=axis),
+                np.fmax.reduce(values, axis=axis),
+            ),
+            axis=-1,
+        )
@@ -0,0 +1,165 @@
+import collections
+import enum
+import math
+import time
+
+
+class PacingMode(enum.Enum):
+    """
+    Frame pacing modes.
+
+    - ``Fixed``: frames are aligned to a fixed grid of ``1 / fps`` periods,
+      similar to vsync. Grid slots passed while a frame is rendered are
+      skipped.
+    - ``Adaptive``: the period is stretched to the measured rendering time
+      when rendering can't keep up with the requested frame rate, leaving
+      time for processing the incoming data between frames.
+    """
+
+    Fixed = enum.auto()
+    Adaptive = enum.auto()
+
+
+class FrameScheduler:
+    """
+    Scheduler for the frames of the plotter main loop.
+
+    The scheduler tells the main loop when the next frame is due and for how
+    long it can block waiting for new data, so the plotter process uses CPU
+    in proportion to the incoming data and the frame rate.
+
+    Parameters
+    ----------
+    fps : float or None, optional
+        Requested frames per second. If None, frames are drawn as soon as
+        there is something to draw, by default None.
+    pacing : PacingMode, optional
+        The frame pacing mode, by default PacingMode.Fixed.
+    max_wait : float, optional
+        Upper limit for blocking between loop iterations, in seconds, which
+        keeps the GUI responsive, by default 0.02.
+
+    Attributes
+    ----------
+    period : float
+        Requested frame period in seconds, 0 if the frame rate is not
+        limited.
+    pacing : PacingMode
+        The frame pacing mode.
+    max_wait : float
+        Upper limit for blocking between loop iterations, in seconds.
+    next_deadline : float
+        Time of the next frame, as returned by `time.perf_counter`.
+    frame_count : int
+        Number of frames drawn.
+    skipped_frames : int
+        Number of frame slots missed because rendering overran the period.
+    render_time : float
+        Exponentially averaged rendering time of a frame, in seconds.
+    """
+
+    _ADAPTIVE_HEADROOM = 1.25
+
+    def __init__(
+        self,
+        fps: float | None = None,
+        pacing: PacingMode = PacingMode.Fixed,
+        max_wait: float = 0.02,
+    ):
+        self.period = 1 / fps if fps else 0.0
+        self.pacing = pacing
+        self.max_wait = max_wait
+        self.next_deadline = time.perf_counter()
+        self.frame_count = 0
+        self.skipped_frames = 0
+        self.render_time = 0.0
+        self._t_anchor = self.next_deadline
+        self._frame_times = collections.deque()
+
+    @property
+    def achieved_fps(self) -> float:
+        """Number of frames drawn during the last second."""
+        self._discard_old_frames(time.perf_counter())
+        return float(len(self._frame_times))
+
+    def is_frame_due(self) -> bool:
+        """
+        Check if the next frame is due.
+
+        Returns
+        -------
+        bool
+            True if the deadline of the next frame has passed.
+        """
+        return time.perf_counter() >= self.next_deadline
+
+    def time_to_next_frame(self) -> float:
+        """
+        Returns the time until the next frame is due.
+
+        Returns
+        -------
+        float
+            Time until the next frame in seconds, 0 if it is already due.
+        """
+        return max(0.0, self.next_deadline - time.perf_counter())
+
+    def wait_timeout(self, frame_pending: bool = True) -> float:
+        """
+        Returns for how long the main loop can block waiting for new data.
+
+        Parameters
+        ----------
+        frame_pending : bool, optional
+            Whether there is something to draw in the next frame, by default
+            True.
+
+        Returns
+        -------
+        float
+            Time until the next frame, limited to `max_wait`, in seconds.
+            If there is nothing to draw or the frame rate is not limited,
+            `max_wait` is returned, as the next frame is drawn only after new
+            data arrives.
+        """
+        if not frame_pending or self.period == 0:
+            return self.max_wait
+        return min(self.time_to_next_frame(), self.max_wait)
+
+    def frame_done(self, t_start: float):
+        """
+        Register a drawn frame and schedule the next one.
+
+        Parameters
+        ----------
+        t_start : float
+            Time when drawing of the frame started, as returned by
+            `time.perf_counter`.
+        """
+        t_end = time.perf_counter()
+        duration = t_end - t_start
+        if self.frame_count == 0:
+            self.render_time = duration
+        else:
+            self.render_time = 0.9 * self.render_time + 0.1 * duration
+        self.frame_count += 1
+        self._frame_times.append(t_end)
+        self._discard_old_frames(t_end)
+        if self.period == 0:
+            self.next_deadline = t_end
+        elif self.pacing == PacingMode.Fixed:
+            i_slot_start = math.floor((t_start - self._t_anchor) / self.period)
+            i_slot_end = math.floor((t_end - self._t_anchor) / self.period)
+            self.skipped_frames += i_slot_end - i_slot_start
+            self.next_deadline = (
+                self._t_anchor + (i_slot_end + 1) * self.period
+            )
+        else:
+            period = max(
+                self.period, self._ADAPTIVE_HEADROOM * self.render_time
+            )
+            self.next_deadline = t_start + period
+
+    def _discard_old_frames(self, t_now: float):
+        while self._frame_times and t_now - self._frame_times[0] > 1.0:
+            self._frame_times.popleft()
@@ -0,0 +1,287 @@
+import os
+import subprocess
+import time
+from multiprocessing import shared_memory
+
+import matplotlib.image
+import numpy as np
+
+from .shared_ring import attach_shared_memory
+
+
+class FrameSink:
+    """
+    Base class for the outputs of the rendered frames.
+
+    Sinks are created in the main process and passed to the plotter, so they
+    should open their resources lazily, when the first frame of a figure is
+    written in the plotter process. Subclasses implement `write` and, if
+    they hold resources, `close`.
+    """
+
+    def write(self, fig_id: str, frame: np.ndarray):
+        """
+        Output a rendered frame of a figure.
+
+        Parameters
+        ----------
+        fig_id : str
+            Unique identifier for the figure.
+        frame : numpy.ndarray
+            The frame as an array of shape (height, width, 4) of RGBA bytes.
+            The array is a view of the canvas buffer, valid only during the
+            call.
+        """
+        raise NotImplementedError("write method not implemented")
+
+    def close(self):
+        """
+        Release the resources of the sink.
+        """
+
+
+class PngSequenceSink(FrameSink):
+    """
+    Writes the frames of every figure as a sequence of PNG files.
+
+    Parameters
+    ----------
+    directory : str
+        Directory where the files are written, created if it doesn't exist.
+    pattern : str, optional
+        Pattern of the file names, formatted with `fig_id` and the frame
+        `index`, by default "{fig_id}_{index:06d}.png".
+    """
+
+    def __init__(
+        self, directory: str, pattern: str = "{fig_id}_{index:06d}.png"
+    ):
+        self.directory = directory
+        self.pattern = pattern
+        self._indices = {}
+
+    def write(self, fig_id: str, frame: np.ndarray):
+        if not self._indices:
+            os.makedirs(self.directory, exist_ok=True)
+        index = self._indices.get(fig_id, 0)
+        self._indices[fig_id] = index + 1
+        path = os.path.join(
+            self.directory, self.pattern.format(fig_id=fig_id, index=index)
+        )
+        matplotlib.image.imsave(path, frame)
+
+
+class PipeSink(FrameSink):
+    """
+    Writes the raw RGBA frames of every figure to the standard input of an
+    external process, such as a video encoder.
+
+    A process is started for every figure when its first frame is written.
+    The arguments of the command are formatted with `fig_id`, `width` and
+    `height` of the frames, for example::
+
+        PipeSink([
+            "ffmpeg", "-y", "-f", "rawvideo", "-pix_fmt", "rgba",
+            "-s", "{width}x{height}", "-r", "30", "-i", "-",
+            "{fig_id}.mp4",
+        ])
+
+    Parameters
+    ----------
+    command : list[str]
+        The command starting the process.
+    """
+
+    def __init__(self, command: list[str]):
+        self.command = command
+        self._processes = {}
+
+    def write(self, fig_id: str, frame: np.ndarray):
+        process = self._processes.get(fig_id)
+        if process is None:
+            height, width, _ = frame.shape
+            args = [
+                arg.format(fig_id=fig_id, width=width, height=height)
+                for arg in self.command
+            ]
+            process = subprocess.Popen(args, stdin=subprocess.PIPE)
+            self._processes[fig_id] = process
+        process.stdin.write(frame.tobytes())
+
+    def close(self):
+        for process in self._processes.values():
+            process.stdin.close()
+            process.wait()
+        self._processes = {}
+
+
+class SharedMemorySink(FrameSink):
+    """
+    Publishes the latest frame of every figure in shared memory.
+
+    The frames of a figure are written into the shared memory block named
+    ``f"{prefix}_{fig_id}"``, created by the plotter process, from which
+    they can be read with `SharedFrameReader`. The block starts with a
+    header holding the frame counter, the frame size and the closed flag,
+    followed by the RGBA bytes of the frame. The counter is odd while a frame
+    is being written, so readers can detect torn frames.
+
+    When the frame size of a figure changes, such as when its window is
+    resized, the block is replaced by a new block with the same name. The
+    closed flag of the old block is set first, so the readers attached to it
+    attach to the new block.
+
+    Parameters
+    ----------
+    prefix : str
+        Prefix of the names of the shared memory blocks.
+    """
+
+    HEADER_SIZE = 64
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self._blocks = {}
+
+    def write(self, fig_id: str, frame: np.ndarray):
+        block = self._blocks.get(fig_id)
+        if block is None or block[2].shape != frame.shape:
+            frame_count = 0
+            if block is not None:
+                frame_count = int(block[1][0]) // 2
+                self._release(block)
+            block = self._create_block(fig_id, frame.shape, frame_count)
+            self._blocks[fig_id] = block
+        shm, header, data = block
+        header[0] += 1
+        data[...] = frame
+        header[0] += 1
+
+    def close(self):
+        for block in self._blocks.values():
+            self._release(block)
+        self._blocks = {}
+
+    def _create_block(
+        self, fig_id: str, shape: tuple[int, int, int], frame_count: int
+    ):
+        """
+        Create the shared memory block for the frames of a figure, whose
+        frame counter continues from `frame_count`.
+        """
+        height, width, _ = shape
+        shm = shared_memory.SharedMemory(
+            f"{self.prefix}_{fig_id}",
+            create=True,
+            size=self.HEADER_SIZE + height * width * 4,
+        )
+        header = np.ndarray((4,), np.uint64, shm.buf)
+        header[:] = (2 * frame_count, height, width, 0)
+        data = np.ndarray(shape, np.uint8, shm.buf, self.HEADER_SIZE)
+        return shm, header, data
+
+    @staticmethod
+    def _release(block: tuple):
+        """
+        Mark a block as closed for its readers and release it.
+        """
+        shm, header, _ = block
+        header[3] = 1
+        shm.close()
+        shm.unlink()
+
+
+class SharedFrameReader:
+    """
+    Reads the frames published by `SharedMemorySink`.
+
+    Parameters
+    ----------
+    name : str
+        Name of the shared memory block, ``f"{prefix}_{fig_id}"``.
+
+    Attributes
+    ----------
+    name : str
+        Name of the shared memory block.
+    frame_count : int
+        Number of the last frame read.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.shm = None
+        self._attach()
+        self.frame_count = 0
+
+    def _attach(self):
+        """
+        Attach to the shared memory block.
+        """
+        self.shm = attach_shared_memory(self.name)
+        self._header = np.ndarray((4,), np.uint64, self.shm.buf)
+        height, width = int(self._header[1]), int(self._header[2])
+        self._data = np.ndarray(
+            (height, width, 4),
+            np.uint8,
+            self.shm.buf,
+            SharedMemorySink.HEADER_SIZE,
+        )
+
+    def _reattach(self) -> bool:
+        """
+        Attach to the block which replaced the closed block, if it exists.
+        """
+        self.close()
+        try:
+            self._attach()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def read(self, timeout: float = 0.1) -> np.ndarray | None:
+        """
+        Read the newest frame, if a new frame was written since the previous
+        read. If the block was replaced because the frame size changed, the
+        reader attaches to the new block.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time to retry reading while a frame is being written, in
+            seconds, by default 0.1.
+
+        Returns
+        -------
+        numpy.ndarray or None
+            Copy of the frame as an array of shape (height, width, 4) of RGBA
+            bytes, or None if there is no new frame.
+        """
+        t_end = time.perf_counter() + timeout
+        while True:
+            if self.shm is None or self._header[3]:
+                if not self._reattach():
+                    return None
+                continue
+            count = int(self._header[0])
+            if count % 2 == 0:
+                if count // 2 == self.frame_count:
+                    return None
+                frame = self._data.copy()
+                if int(self._header[0]) == count:
+                    self.frame_count = count // 2
+                    return frame
+            if time.perf_counter() > t_end:
+                return None
+            time.sleep(0.001)
+
+    def close(self):
+        """
+        Release the shared memory.
+        """
+        if self.shm is None:
+            return
+        self._header = None
+        self._data = None
+        self.shm.close()
+        self.shm = None
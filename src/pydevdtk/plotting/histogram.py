@@ -0,0 +1,96 @@
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .ring_buffer import RingBuffer
+
+
+class IncrementalHistogram:
+    """
+    Histogram with fixed bins, updated incrementally as samples arrive.
+
+    New samples are assigned to the bins with `numpy.searchsorted` and the
+    bin counts are updated with `numpy.bincount`, so an update costs time
+    proportional to the number of new samples. In the sliding window mode,
+    the bins of the samples in the window are kept in a ring buffer, and the
+    samples leaving the window are subtracted from the counts.
+
+    Parameters
+    ----------
+    edges : array-like
+        Monotonically increasing bin edges. As in `numpy.histogram`, all the
+        bins but the last are half-open, and the last one includes its right
+        edge.
+    window : int or None, optional
+        Number of the newest samples counted, or None to count all the
+        samples, by default None.
+
+    Attributes
+    ----------
+    edges : numpy.ndarray
+        The bin edges.
+    counts : numpy.ndarray
+        Number of samples in every bin.
+    window : RingBuffer or None
+        Bins of the samples in the window, -1 for samples outside of the
+        bins, or None if all the samples are counted.
+    """
+
+    def __init__(self, edges: ArrayLike, window: int | None = None):
+        self.edges = np.asarray(edges, dtype=float)
+        self.counts = np.zeros(self.edges.size - 1, dtype=np.int64)
+        if window is None:
+            self.window = None
+        else:
+            self.window = RingBuffer(window, dtype=np.int64, fill_value=-1)
+
+    def append(self, values: float | ArrayLike):
+        """
+        Count one sample or a batch of samples.
+
+        Parameters
+        ----------
+        values : float or array-like
+            New sample or 1-D array of new samples.
+        """
+        bins = self._bins(np.asarray(values, dtype=float).ravel())
+        if self.window is None:
+            self.counts += self._bincount(bins)
+            return
+        window = self.window
+        if bins.size >= window.size:
+            window.append(bins)
+            self.counts[:] = self._bincount(window.data)
+            return
+        i_oldest = window.index
+        dropped = np.take(
+            window.data,
+            np.arange(i_oldest, i_oldest + bins.size),
+            mode="wrap",
+        )
+        self.counts -= self._bincount(dropped)
+        self.counts += self._bincount(bins)
+        window.append(bins)
+
+    def clear(self):
+        """
+        Reset the counts.
+        """
+        self.counts.fill(0)
+        if self.window is not None:
+            self.window.clear(-1)
+
+    def _bins(self, values: np.ndarray) -> np.ndarray:
+        """
+        Returns the bin of every value, -1 for values outside of the bins.
+        """
+        num_bins = self.counts.size
+        bins = np.searchsorted(self.edges, values, side="right") - 1
+        bins[values == self.edges[-1]] = num_bins - 1
+        bins[(bins < 0) | (bins >= num_bins)] = -1
+        return bins
+
+    def _bincount(self, bins: np.ndarray) -> np.ndarray:
+        """
+        Returns the number of values in every bin, ignoring -1.
+        """
+        return np.bincount(bins + 1, minlength=self.counts.size + 1)[1:]
@@ -1,17 +1,31 @@
 import enum
+import math
 import time
 import threading
 import queue
+import warnings
 
 import matplotlib.artist
 import matplotlib.collections
 import matplotlib.container
+import matplotlib.transforms
 import numpy as np
 from numpy.typing import ArrayLike
 import matplotlib
+import matplotlib.pyplot as plt
 
-matplotlib.use("QtAgg")
-import matplotlib.pyplot as plt  # noqa
+from .artists import BarCollection, FastImage, MultiLineCollection
+from . import commands
+from .autoscale import Autoscaler
+from .decimation import MinMaxDecimator
+from .frame_scheduler import FrameScheduler, PacingMode
+from .frame_sinks import FrameSink
+from .histogram import IncrementalHistogram
+from .ring_buffer import RingBuffer
+from .shared_ring import SharedRingBuffer
+from .telemetry import FrameStatsRecorder, get_queue_depth
+from .transforms import Transform
+from .trigger import Trigger
 
 
 class PlotType(enum.Enum):
@@ -24,13 +38,95 @@ class PlotType(enum.Enum):
     Bar = (enum.auto(),)
     Text = (enum.auto(),)
     Image = enum.auto()
+    Waterfall = enum.auto()
+    MultiLine = enum.auto()
+    Histogram = enum.auto()
+
+
+class UpdatePolicy(enum.Enum):
+    """
+    Policies for combining the updates of an artist received between frames.
+
+    - ``Append``: the samples of all the updates are appended, used for line,
+      multi-channel line, scatter, waterfall and histogram plots.
+    - ``Latest``: only the newest update is applied and the older ones are
+      dropped, used for bar and image plots.
+    - ``Accumulate``: the updates are summed and added to the current data of
+      the artist, available for bar and image plots.
+    """
+
+    Append = enum.auto()
+    Latest = enum.auto()
+    Accumulate = enum.auto()
+
+
+DEFAULT_UPDATE_POLICIES = {
+    PlotType.Line: UpdatePolicy.Append,
+    PlotType.Scatter: UpdatePolicy.Append,
+    PlotType.Bar: UpdatePolicy.Latest,
+    PlotType.Text: UpdatePolicy.Latest,
+    PlotType.Image: UpdatePolicy.Latest,
+    PlotType.Waterfall: UpdatePolicy.Append,
+    PlotType.MultiLine: UpdatePolicy.Append,
+    PlotType.Histogram: UpdatePolicy.Append,
+}
 
 
 class Plotter:
     """
     Class for plotting data in real-time.
+
+    Parameters
+    ----------
+    backend : str, optional
+        The matplotlib backend used in the plotter process, by default
+        "QtAgg". With "Agg", the figures are rendered offscreen, through the
+        same blitting path, which allows running the plotter on machines
+        without a display.
+    frame_sinks : list[FrameSink] or None, optional
+        Outputs to which every rendered frame of a figure is written, such
+        as `PngSequenceSink`, `SharedMemorySink` or `PipeSink`, by default
+        None.
     """
 
+    EARLY_DATA_TIMEOUT = 1.0
+    """Time for which data of an unknown artist is kept, in seconds."""
+
+    COMMAND_HANDLERS = {
+        commands.Show: "show",
+        commands.Close: "close",
+        commands.CreateFigure: "create_figure",
+        commands.CreateAxis: "create_axis",
+        commands.ModifyAxis: "modify_axis",
+        commands.SetAutoscale: "set_autoscale",
+        commands.CreateLinePlot: "create_line_plot",
+        commands.CreateMultiLinePlot: "create_multi_line_plot",
+        commands.CreateScatterPlot: "create_scatter_plot",
+        commands.CreateBarPlot: "create_bar_plot",
+        commands.CreateHistogramPlot: "create_histogram_plot",
+        commands.CreateImagePlot: "create_image_plot",
+        commands.CreateWaterfallPlot: "create_waterfall_plot",
+        commands.SetUpdatePolicy: "set_update_policy",
+        commands.ArmTrigger: "arm_trigger",
+        commands.AddTransform: "add_transform",
+        commands.AttachSharedRing: "attach_shared_ring",
+        commands.Batch: "execute_batch",
+    }
+    """Names of the methods executing every command type."""
+
+    def __init__(
+        self,
+        backend: str = "QtAgg",
+        frame_sinks: list[FrameSink] | None = None,
+    ):
+        self.backend = backend
+        self.frame_sinks = frame_sinks or []
+
+    @property
+    def offscreen(self) -> bool:
+        """Whether the figures are rendered without a window."""
+        return self.backend.lower() == "agg"
+
     def __call__(
         self,
         cmd_queue: queue.Queue,
@@ -38,10 +134,17 @@ class Plotter:
         stop_event: threading.Event,
         plot_closed_event: threading.Event,
         fps: float | None = None,
+        pacing: PacingMode = PacingMode.Fixed,
+        stats_name: str | None = None,
     ):
         """
         Main function for plotting.
 
+        Between frames, the main loop blocks on the data queue until new data
+        arrives or the next frame is due. Frames are drawn only if some
+        artist changed or a figure was redrawn, and only the axes containing
+        changed artists are restored and blitted.
+
         Parameters
         ----------
         cmd_queue : queue.Queue
@@ -54,6 +157,12 @@ class Plotter:
             Event indicating plot window is closed.
         fps : float | None, optional
             Frames per second for plotting, by default None.
+        pacing : PacingMode, optional
+            Frame pacing mode, used if `fps` is given, by default
+            PacingMode.Fixed.
+        stats_name : str | None, optional
+            Name of the shared memory ring into which the statistics of
+            every frame are written, by default None for no statistics.
         """
         self.cmd_queue = cmd_queue
         self.data_queue = data_queue
@@ -62,22 +171,76 @@ class Plotter:
         self.figs = {}
         self.axs = {}
         self.artists = {}
+        self.buffers = {}
+        self.decimators = {}
+        self.triggers = {}
+        self.histograms = {}
+        self.time_series = set()
+        self.time_windows = {}
+        self.time_offsets = {}
+        self.latest_times = {}
+        self.shared_rings = {}
+        self.update_policies = {}
+        self.coalesced_updates = {}
+        self.dirty_artists = set()
+        self.figs_to_redraw = set()
+        self.ax_figs = {}
+        self.ax_artists = {}
+        self.artist_axes = {}
+        self.autoscalers = {}
+        self.transforms = {}
+        self.stream_shapes = {}
+        self.data_backlog = []
+        self.early_data = []
         self.bgs = {}
         self.event_processing = False
-        t_start = time.time()
+        self.frame_scheduler = FrameScheduler(fps, pacing)
+        if stats_name is not None:
+            self.stats_recorder = FrameStatsRecorder(stats_name)
+        else:
+            self.stats_recorder = None
+        plt.switch_backend(self.backend)
         while not self.stop_event.is_set():
             self.process_cmd_queue()
-            self.process_data_queue()
+            t_start = time.perf_counter()
+            queue_depth = get_queue_depth(self.data_queue)
+            if queue_depth >= 0:
+                queue_depth += len(self.data_backlog)
+            num_items = self.process_data_queue()
+            if self.stats_recorder is not None:
+                self.stats_recorder.data_processed(
+                    num_items,
+                    time.perf_counter() - t_start,
+                    sum(self.coalesced_updates.values()),
+                    queue_depth,
+                )
             self.process_events()
-            if fps is not None and time.time() - t_start < 1 / fps:
-                continue
-            self.update_figures()
-            t_start = time.time()
+            frame_pending = bool(self.dirty_artists or self.figs_to_redraw)
+            if frame_pending and self.frame_scheduler.is_frame_due():
+                t_start = time.perf_counter()
+                self.update_figures()
+                self.frame_scheduler.frame_done(t_start)
+                if self.stats_recorder is not None:
+                    self.stats_recorder.frame_done(
+                        t_start, self.frame_scheduler
+                    )
+                frame_pending = False
+            self.wait_for_data(
+                self.frame_scheduler.wait_timeout(frame_pending)
+            )
 
-        while self.cmd_queue.get() is not None:
-            self.cmd_queue.get()
-        while self.data_queue.get() is not None:
-            self.data_queue.get()
+        for ring in self.shared_rings.values():
+            ring.close()
+        for sink in self.frame_sinks:
+            sink.close()
+        if self.stats_recorder is not None:
+            self.stats_recorder.close()
+        for q in (self.cmd_queue, self.data_queue):
+            try:
+                while q.get(timeout=0.1) is not None:
+                    pass
+            except queue.Empty:
+                pass
 
     def process_cmd_queue(self):
         """
@@ -87,93 +250,211 @@ class Plotter:
             cmd = self.cmd_queue.get()
             if cmd is None:
                 # stop
-                pass
-            if cmd[0] == "show":
-                self.show()
-            elif cmd[0] == "close":
-                self.close()
-            elif cmd[0] == "create_fig":
-                fig_id = cmd[1]
-                kwargs = cmd[2]
-                nrows, ncols = cmd[3]
-                self.create_figure(fig_id, nrows, ncols, **kwargs)
-            elif cmd[0] == "create_axis":
-                ax_id = cmd[1]
-                fig_id = cmd[2]
-                irow, icol = cmd[3]
-                nrows, ncols = cmd[4]
-                self.create_axis(ax_id, fig_id, irow, icol, nrows, ncols)
-            elif cmd[0] == "modify_axis":
-                ax_id = cmd[1]
-                xlim = cmd[2]
-                ylim = cmd[3]
-                title = cmd[4]
-                xlabel = cmd[5]
-                ylabel = cmd[6]
-                xticks = cmd[7]
-                xticklabels = cmd[8]
-                yticks = cmd[9]
-                yticklabels = cmd[10]
-                legend = cmd[11]
-                self.modify_axis(
-                    ax_id,
-                    xlim,
-                    ylim,
-                    title,
-                    xlabel,
-                    ylabel,
-                    xticks,
-                    xticklabels,
-                    yticks,
-                    yticklabels,
-                    legend,
-                )
-            elif cmd[0] == "create_line_plot":
-                artist_id = cmd[1]
-                ax_id = cmd[2]
-                size = cmd[3]
-                kwargs = cmd[4]
-                self.create_line_plot(artist_id, ax_id, size, **kwargs)
-            elif cmd[0] == "create_scatter_plot":
-                artist_id = cmd[1]
-                ax_id = cmd[2]
-                num_points = cmd[3]
-                kwargs = cmd[4]
-                self.create_scatter_plot(
-                    artist_id, ax_id, num_points, **kwargs
-                )
-            elif cmd[0] == "create_bar_plot":
-                artist_id = cmd[1]
-                ax_id = cmd[2]
-                num_bars = cmd[3]
-                kwargs = cmd[4]
-                self.create_bar_plot(artist_id, ax_id, num_bars, **kwargs)
-            elif cmd[0] == "create_image_plot":
-                artist_id = cmd[1]
-                ax_id = cmd[2]
-                img_shape = cmd[3]
-                cbar = cmd[4]
-                kwargs = cmd[5]
-                self.create_image_plot(
-                    artist_id, ax_id, img_shape, cbar, **kwargs
-                )
+                continue
+            self.execute_command(cmd)
+
+    def execute_command(self, cmd: commands.Command):
+        """
+        Execute a command with the method registered for its type in
+        `COMMAND_HANDLERS`.
+
+        Parameters
+        ----------
+        cmd : Command
+            The command.
+        """
+        method = getattr(self, self.COMMAND_HANDLERS[type(cmd)])
+        method(*cmd.args(), **cmd.keywords())
+
+    def execute_batch(self, cmds: list[commands.Command]):
+        """
+        Execute several commands in order.
+
+        Parameters
+        ----------
+        cmds : list[Command]
+            The commands.
+        """
+        for cmd in cmds:
+            self.execute_command(cmd)
 
     def process_data_queue(self):
         """
         Process data in the data queue.
+
+        All the queued data is collected first, together with the new samples
+        in the shared memory rings, and the updates of every artist are
+        combined according to its update policy, so every artist is updated
+        once. The updates dropped or merged by the ``Latest`` and
+        ``Accumulate`` policies are counted in `coalesced_updates`, whose total
+        is published in the frame statistics.
+
+        Only the newest samples that fit the buffer of an artist are read
+        from its shared memory ring, and the older ones are skipped, except
+        for triggered lines and the sources of transforms, which need every
+        sample.
+
+        The commands and the data travel through separate queues, so data
+        may arrive before the command creating its artist, especially after
+        a large batch of commands. Such data is kept in `early_data` until
+        the artist is created, for at most `EARLY_DATA_TIMEOUT` seconds.
+
+        Returns
+        -------
+        int
+            Number of the processed data queue items.
         """
+        pending = {}
+        items = self.data_backlog
+        self.data_backlog = []
         while not self.data_queue.empty():
-            data = self.data_queue.get()
+            items.append(self.data_queue.get())
+        t_now = time.perf_counter()
+        early_data = self.early_data
+        self.early_data = []
+        streams = {}
+        for t_arrival, artist_id, val in early_data:
+            if self._route_data(pending, streams, artist_id, val):
+                continue
+            if t_now - t_arrival < self.EARLY_DATA_TIMEOUT:
+                self.early_data.append((t_arrival, artist_id, val))
+            else:
+                warnings.warn(f"Dropped data of unknown artist {artist_id}")
+        for data in items:
+            if data is None:
+                continue
             for artist_id, val in data.items():
-                artist, type = self.artists[artist_id]
-                if type == PlotType.Line:
-                    self.update_line_plot(artist, val)
-                elif type == PlotType.Scatter:
-                    self.update_scatter_plot(artist, val)
-                elif type == PlotType.Bar:
-                    self.update_bar_plot(artist, val)
-                elif type == PlotType.Image:
-                    self.update_image_plot(artist, val)
+                if not self._route_data(pending, streams, artist_id, val):
+                    self.early_data.append((t_now, artist_id, val))
+        for artist_id, ring in self.shared_rings.items():
+            if artist_id in self.triggers or artist_id in self.transforms:
+                # every sample is needed to find the trigger edges and to
+                # keep the state of the transforms continuous
+                max_items = None
+            elif artist_id in self.buffers:
+                max_items = self.buffers[artist_id].size
+            elif self.update_policies[artist_id] == UpdatePolicy.Latest:
+                max_items = 1
+            else:
+                max_items = None
+            val = ring.read(max_items)
+            if len(val) > 0:
+                self._route_data(pending, streams, artist_id, val)
+        for source_id, vals in streams.items():
+            item_shape = self.stream_shapes[source_id]
+            samples = np.asarray(
+                self._concat(vals, item_shape), dtype=float
+            ).reshape(-1, *item_shape)
+            for transform, target_id in self.transforms[source_id]:
+                val = transform(samples)
+                if len(val) > 0:
+                    self._add_pending(pending, target_id, val)
+        for artist_id, val in pending.items():
+            _, type = self.artists[artist_id]
+            policy = self.update_policies[artist_id]
+            if policy == UpdatePolicy.Append:
+                if type == PlotType.Histogram:
+                    item_shape = ()
+                else:
+                    item_shape = self.buffers[artist_id].item_shape
+                val = self._concat(val, item_shape)
+            elif policy == UpdatePolicy.Accumulate:
+                val = self._get_artist_data(artist_id) + val
+            if type == PlotType.Line:
+                self.update_line_plot(artist_id, val)
+            elif type == PlotType.Scatter:
+                self.update_scatter_plot(artist_id, val)
+            elif type == PlotType.Bar:
+                self.update_bar_plot(artist_id, val)
+            elif type == PlotType.Image:
+                self.update_image_plot(artist_id, val)
+            elif type == PlotType.Waterfall:
+                self.update_waterfall_plot(artist_id, val)
+            elif type == PlotType.MultiLine:
+                self.update_multi_line_plot(artist_id, val)
+            elif type == PlotType.Histogram:
+                self.update_histogram_plot(artist_id, val)
+        return len(items)
+
+    def _route_data(
+        self, pending: dict, streams: dict, artist_id: str, val: ArrayLike
+    ) -> bool:
+        """
+        Add an update to the pending updates of its artist and to the
+        stream of the transforms fed by it. Returns False if there is no
+        such artist or transform.
+        """
+        is_known = False
+        if artist_id in self.transforms:
+            streams.setdefault(artist_id, []).append(val)
+            is_known = True
+        if artist_id in self.artists:
+            self._add_pending(pending, artist_id, val)
+            is_known = True
+        return is_known
+
+    def _add_pending(self, pending: dict, artist_id: str, val: ArrayLike):
+        """
+        Combine an update with the pending updates of an artist.
+        """
+        policy = self.update_policies[artist_id]
+        if policy == UpdatePolicy.Append:
+            pending.setdefault(artist_id, []).append(val)
+            return
+        if artist_id in pending:
+            self.coalesced_updates[artist_id] += 1
+        if policy == UpdatePolicy.Latest:
+            pending[artist_id] = val
+        else:
+            val = np.asarray(val, dtype=float)
+            if val.ndim > self._get_artist_data(artist_id).ndim:
+                self.coalesced_updates[artist_id] += val.shape[0] - 1
+                val = val.sum(axis=0)
+            if artist_id in pending:
+                val = pending[artist_id] + val
+            pending[artist_id] = val
+
+    def _get_artist_data(self, artist_id: str) -> np.ndarray:
+        """
+        Returns the current data of a bar or image plot, with NaNs replaced by
+        zeros.
+        """
+        artist, type = self.artists[artist_id]
+        if type == PlotType.Bar:
+            data = artist.get_heights()
+        else:
+            data = np.ma.filled(artist.get_array(), np.nan)
+        return np.nan_to_num(data)
+
+    @staticmethod
+    def _concat(vals: list, item_shape: tuple[int, ...]) -> np.ndarray:
+        """
+        Concatenate single samples and batches of samples into one batch.
+        """
+        if len(vals) == 1:
+            return vals[0]
+        return np.concatenate(
+            [
+                np.asarray(val, dtype=float).reshape(-1, *item_shape)
+                for val in vals
+            ]
+        )
+
+    def wait_for_data(self, timeout: float):
+        """
+        Block until new data arrives in the data queue or the timeout
+        expires. The received data is processed in the next call to
+        `process_data_queue`.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum waiting time in seconds.
+        """
+        try:
+            self.data_backlog.append(self.data_queue.get(timeout=timeout))
+        except queue.Empty:
+            pass
 
     def process_events(self):
         """
@@ -188,16 +469,210 @@ class Plotter:
             if not is_any_plot_present:
                 self.plot_closed_event.set()
 
+    def sync_artists(self):
+        """
+        Copy the buffered data of the artists updated since the last frame
+        into the matplotlib artists.
+        """
+        for artist_id in self.dirty_artists:
+            artist, type = self.artists[artist_id]
+            decimator = self.decimators.get(artist_id)
+            if decimator is not None and decimator.bucket_size > 1:
+                artist.set_data(*decimator.envelope())
+            elif decimator is not None:
+                buffer = self.buffers[artist_id]
+                artist.set_data(np.arange(buffer.size), buffer.view())
+            elif artist_id in self.time_series and type == PlotType.Line:
+                samples = self.buffers[artist_id].view()
+                artist.set_data(samples[:, 0], samples[:, 1])
+            elif type == PlotType.Line:
+                artist.set_ydata(self.buffers[artist_id].view())
+            elif type == PlotType.Scatter:
+                artist.set_offsets(self.buffers[artist_id].view())
+            elif type == PlotType.MultiLine:
+                artist.set_ydata(self.buffers[artist_id].view())
+            elif type == PlotType.Histogram:
+                artist.set_heights(self.histograms[artist_id].counts)
+            elif type == PlotType.Waterfall:
+                columns = self.buffers[artist_id].view()
+                artist.get_array()[...] = np.ma.masked_invalid(columns.T)
+                artist.changed()
+        self.dirty_artists.clear()
+
     def update_figures(self):
         """
         Update figures with new data.
+
+        Only the axes containing artists changed since the last frame are
+        updated: the background of each such axis is restored, its artists
+        are redrawn and only its bounding box is blitted. Figures without
+        changes are skipped. All the axes of a figure are updated after the
+        figure is redrawn, which happens when autoscaling changes the limits
+        of an axis. The updated figures are written to the frame sinks.
         """
-        for fig_id, (fig, _, artists) in self.figs.items():
-            bg = self.bgs[fig_id]
-            fig.canvas.restore_region(bg)
-            for artist in artists:
+        dirty_axes = {
+            self.artist_axes[artist_id] for artist_id in self.dirty_artists
+        }
+        self.sync_artists()
+        self.autoscale_axes(dirty_axes)
+        for ax_id, fig_id in self.ax_figs.items():
+            if fig_id in self.figs_to_redraw:
+                dirty_axes.add(ax_id)
+        self.figs_to_redraw.clear()
+        updated_figs = set()
+        for ax_id in dirty_axes:
+            fig_id = self.ax_figs[ax_id]
+            if fig_id not in self.bgs:
+                continue
+            fig, _, _ = self.figs[fig_id]
+            fig.canvas.restore_region(self.bgs[fig_id][ax_id])
+            for artist in self.ax_artists[ax_id]:
                 fig.draw_artist(artist)
-            fig.canvas.blit(fig.bbox)
+            fig.canvas.blit(self.axs[ax_id].bbox)
+            updated_figs.add(fig_id)
+        if self.frame_sinks:
+            self.write_frames(updated_figs)
+
+    def write_frames(self, fig_ids: set[str]):
+        """
+        Write the rendered frames of figures to the frame sinks.
+
+        Parameters
+        ----------
+        fig_ids : set[str]
+            Unique identifiers of the figures.
+        """
+        for fig_id in fig_ids:
+            fig, _, _ = self.figs[fig_id]
+            frame = np.asarray(fig.canvas.buffer_rgba())
+            for sink in self.frame_sinks:
+                sink.write(fig_id, frame)
+
+    def autoscale_axes(self, ax_ids: set[str]):
+        """
+        Update the limits of the autoscaled axes, and redraw the figures in
+        which limits changed.
+
+        Parameters
+        ----------
+        ax_ids : set[str]
+            Unique identifiers of the axes with changed artists.
+        """
+        t_now = time.perf_counter()
+        figs_to_draw = set()
+        for ax_id in ax_ids:
+            for dim, autoscaler in self.autoscalers.get(ax_id, {}).items():
+                limits = autoscaler.new_limits(
+                    t_now, lambda: self._data_extent(ax_id, dim)
+                )
+                if limits is None:
+                    continue
+                ax = self.axs[ax_id]
+                if dim == 0:
+                    ax.set_xlim(limits)
+                else:
+                    ax.set_ylim(limits)
+                figs_to_draw.add(self.ax_figs[ax_id])
+        for fig_id in figs_to_draw:
+            if fig_id in self.bgs:
+                # the draw event copies the new backgrounds
+                fig, _, _ = self.figs[fig_id]
+                fig.canvas.draw()
+
+    def _data_extent(self, ax_id: str, dim: int) -> tuple[float, float]:
+        """
+        Returns the minimum and the maximum of the data shown in an axis,
+        along x (`dim` 0) or y (`dim` 1).
+        """
+        values = []
+        for artist_id, artist_ax_id in self.artist_axes.items():
+            if artist_ax_id != ax_id:
+                continue
+            artist, type = self.artists[artist_id]
+            if artist_id in self.time_series and dim == 1:
+                samples = self.buffers[artist_id].data
+                t_start = self.latest_times[ax_id] - self.time_windows[ax_id]
+                values.append(samples[samples[:, 0] >= t_start, 1])
+            elif artist_id in self.time_series:
+                continue
+            elif type == PlotType.Line and dim == 1:
+                values.append(self.buffers[artist_id].data)
+            elif type == PlotType.MultiLine and dim == 1:
+                data = self.buffers[artist_id].data + artist.channel_offsets
+                values.append(data.ravel())
+            elif type == PlotType.Scatter:
+                values.append(self.buffers[artist_id].data[:, dim])
+            elif type in (PlotType.Bar, PlotType.Histogram) and dim == 1:
+                datalim = artist.get_datalim(self.axs[ax_id].transData)
+                values.append(datalim.intervaly)
+        if not values:
+            return math.inf, -math.inf
+        values = np.concatenate(values)
+        vmin = np.fmin.reduce(values)
+        vmax = np.fmax.reduce(values)
+        if np.isnan(vmin):
+            return math.inf, -math.inf
+        return float(vmin), float(vmax)
+
+    def _track_extent(self, artist_id: str, val: ArrayLike):
+        """
+        Track the extent of new data for autoscaling the axis of an artist.
+        """
+        autoscalers = self.autoscalers.get(self.artist_axes[artist_id])
+        if not autoscalers:
+            return
+        artist, type = self.artists[artist_id]
+        val = np.asarray(val, dtype=float)
+        if artist_id in self.time_series and 1 in autoscalers:
+            autoscalers[1].update(val.reshape(-1, 2)[:, 1])
+        elif artist_id in self.time_series:
+            return
+        elif type == PlotType.MultiLine and 1 in autoscalers:
+            autoscalers[1].update(val + artist.channel_offsets)
+        elif type == PlotType.Scatter:
+            val = val.reshape(-1, 2)
+            for dim, autoscaler in autoscalers.items():
+                autoscaler.update(val[:, dim])
+        elif (
+            type in (PlotType.Line, PlotType.Bar, PlotType.Histogram)
+            and 1 in autoscalers
+        ):
+            autoscalers[1].update(val)
+
+    def _copy_backgrounds(self, fig_id: str):
+        """
+        Copy the background of every axis of a figure and schedule the
+        artists of the figure to be redrawn.
+
+        The envelopes of the decimated line plots are recomputed if the
+        pixel width of their axis changed.
+
+        Parameters
+        ----------
+        fig_id : str
+            Unique identifier for the figure.
+        """
+        fig, _, _ = self.figs[fig_id]
+        self.bgs[fig_id] = {
+            ax_id: fig.canvas.copy_from_bbox(self.axs[ax_id].bbox)
+            for ax_id, ax_fig_id in self.ax_figs.items()
+            if ax_fig_id == fig_id
+        }
+        for artist_id, decimator in self.decimators.items():
+            ax_id = self.artist_axes[artist_id]
+            if self.ax_figs[ax_id] != fig_id:
+                continue
+            num_columns = self._num_columns(ax_id)
+            if num_columns != decimator.num_columns:
+                decimator.rebuild(num_columns)
+                self.dirty_artists.add(artist_id)
+        self.figs_to_redraw.add(fig_id)
+
+    def _num_columns(self, ax_id: str) -> int:
+        """
+        Returns the width of an axis in pixels.
+        """
+        return max(1, int(self.axs[ax_id].bbox.width))
 
     def _on_draw(self, event: matplotlib.backend_bases.Event):
         """
@@ -209,23 +684,27 @@ class Plotter:
             Event object.
         """
         if event is not None:
-            bg = event.canvas.copy_from_bbox(event.canvas.figure.bbox)
             fig_id = [
                 id
                 for id, (fig, _, _) in self.figs.items()
                 if fig == event.canvas.figure
             ][0]
-            self.bgs[fig_id] = bg
+            self._copy_backgrounds(fig_id)
 
     def show(self):
         """
-        Show the plot.
+        Show the plot. When rendering offscreen, the figures are drawn once
+        to capture the backgrounds.
         """
-        plt.show(block=False)
-        for fig_id, (fig, _, _) in self.figs.items():
-            bg = fig.canvas.copy_from_bbox(fig.bbox)
-            self.bgs[fig_id] = bg
-            fig.canvas.mpl_connect("draw_event", self._on_draw)
+        if self.offscreen:
+            for fig, _, _ in self.figs.values():
+                fig.canvas.mpl_connect("draw_event", self._on_draw)
+                fig.canvas.draw()
+        else:
+            plt.show(block=False)
+            for fig_id, (fig, _, _) in self.figs.items():
+                self._copy_backgrounds(fig_id)
+                fig.canvas.mpl_connect("draw_event", self._on_draw)
         self.plot_closed_event.clear()
         self.event_processing = True
 
@@ -286,6 +765,8 @@ class Plotter:
         fig, gs, _ = self.figs[fig_id]
         ax = fig.add_subplot(gs[irow : irow + nrows, icol : icol + ncols])
         self.axs[ax_id] = ax
+        self.ax_figs[ax_id] = fig_id
+        self.ax_artists[ax_id] = []
 
     def modify_axis(
         self,
@@ -330,6 +811,11 @@ class Plotter:
             Whether to display a legend on the axis.
         """
         ax = self.axs[ax_id]
+        autoscalers = self.autoscalers.get(ax_id, {})
+        if xlim is not None:
+            autoscalers.pop(0, None)
+        if ylim is not None:
+            autoscalers.pop(1, None)
         ax.set_xlim(xlim)
         ax.set_ylim(ylim)
         ax.set_title(title)
@@ -342,12 +828,64 @@ class Plotter:
         if legend:
             ax.legend(loc="upper left")
 
+    def set_autoscale(
+        self,
+        ax_id: str,
+        axis: str | None,
+        margin: float,
+        shrink_ratio: float,
+        max_rate: float,
+    ):
+        """
+        Set the autoscaling of an axis.
+
+        Parameters
+        ----------
+        ax_id : str
+            Unique identifier for the axis.
+        axis : {'x', 'y', 'both'} or None
+            Which limits are autoscaled. The x limits are autoscaled only
+            from the data of scatter plots. If None, autoscaling is disabled.
+        margin : float
+            Padding added on both sides of the data extent, as a fraction of
+            the extent.
+        shrink_ratio : float
+            The limits are shrunk when the extent of the shown data falls
+            below this fraction of the limits.
+        max_rate : float
+            Maximum number of changes of the limits per second.
+        """
+        dims = {"x": (0,), "y": (1,), "both": (0, 1), None: ()}[axis]
+        self.autoscalers[ax_id] = {
+            dim: Autoscaler(margin, shrink_ratio, max_rate) for dim in dims
+        }
+
     def create_line_plot(
-        self, artist_id: str, ax_id: str, size: int, **kwargs
+        self,
+        artist_id: str,
+        ax_id: str,
+        size: int,
+        decimate: bool = False,
+        time_window: float | None = None,
+        trigger: Trigger | None = None,
+        **kwargs,
     ):
         """
         Create a line plot.
 
+        With decimation, the full resolution data is kept in the buffer of
+        the line, but the line is drawn from the min/max envelope of the
+        samples falling into every pixel column of the axis, so the drawing
+        time is bounded by the axis width instead of the line size. The
+        envelope is updated incrementally as new samples arrive.
+
+        In the time-series mode, the line is drawn from (timestamp, value)
+        samples, and the x axis shows the time relative to the latest
+        timestamp received in the axis, from ``-time_window`` to 0.
+
+        A triggered line shows the newest capture of its trigger instead of
+        scrolling, and is redrawn only when a capture completes.
+
         Parameters
         ----------
         artist_id : str
@@ -356,15 +894,95 @@ class Plotter:
             Unique identifier for the axis containing the plot.
         size : int
             Size of the data array for the plot.
+        decimate : bool, optional
+            Whether to draw the min/max envelope of the data when the line
+            has more samples than the axis has pixel columns, by default
+            False.
+        time_window : float or None, optional
+            Length of the time window shown, for time-series lines, or None
+            for lines plotted against the sample index, by default None.
+        trigger : Trigger or None, optional
+            Trigger of the captures shown by the line, not supported for
+            time-series lines, by default None for a scrolling line.
         kwargs
             Additional keyword arguments for creating the plot.
         """
         ax = self.axs[ax_id]
+        if time_window is not None:
+            line = ax.plot([], [], **kwargs)[0]
+            line.set_transform(self._set_time_window(ax_id, time_window))
+            self.add_artist(artist_id, ax_id, line, PlotType.Line)
+            self.buffers[artist_id] = RingBuffer(size, (2,))
+            self.time_series.add(artist_id)
+            return
         line = ax.plot(np.full(size, np.nan), **kwargs)[0]
         self.add_artist(artist_id, ax_id, line, PlotType.Line)
+        self.buffers[artist_id] = RingBuffer(size)
+        if trigger is not None:
+            trigger.reset(size)
+            self.triggers[artist_id] = trigger
+        if decimate:
+            self.decimators[artist_id] = MinMaxDecimator(
+                self.buffers[artist_id], self._num_columns(ax_id)
+            )
+
+    def create_multi_line_plot(
+        self,
+        artist_id: str,
+        ax_id: str,
+        size: int,
+        num_channels: int,
+        channel_offsets: float | ArrayLike | None,
+        **kwargs,
+    ):
+        """
+        Create a multi-channel line plot.
+
+        All the channels are stored in one 2-D ring buffer and drawn as one
+        line collection.
+
+        Parameters
+        ----------
+        artist_id : str
+            Unique identifier for the plot.
+        ax_id : str
+            Unique identifier for the axis containing the plot.
+        size : int
+            Number of samples of every channel.
+        num_channels : int
+            Number of channels.
+        channel_offsets : float or array-like or None
+            Vertical offsets added to the channels, or None for no offsets.
+        kwargs
+            Additional keyword arguments for creating the plot. If no colors
+            are given, the channels use the colors of the axis property
+            cycle.
+        """
+        ax = self.axs[ax_id]
+        if not {"color", "colors"} & kwargs.keys():
+            colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+            kwargs["colors"] = [
+                colors[i % len(colors)] for i in range(num_channels)
+            ]
+        if channel_offsets is None:
+            channel_offsets = 0
+        lines = MultiLineCollection(
+            size, num_channels, channel_offsets, **kwargs
+        )
+        ax.add_collection(lines, autolim=False)
+        offsets = lines.channel_offsets
+        ax.update_datalim([(0, offsets.min()), (size - 1, offsets.max())])
+        ax.autoscale_view()
+        self.add_artist(artist_id, ax_id, lines, PlotType.MultiLine)
+        self.buffers[artist_id] = RingBuffer(size, (num_channels,))
 
     def create_scatter_plot(
-        self, artist_id: str, ax_id: str, num_points: int, **kwargs
+        self,
+        artist_id: str,
+        ax_id: str,
+        num_points: int,
+        time_window: float | None = None,
+        **kwargs,
     ):
         """
         Create a scatter plot.
@@ -377,6 +995,9 @@ class Plotter:
             Unique identifier for the axis containing the plot.
         num_points : int
             Number of points in the scatter plot.
+        time_window : float or None, optional
+            Length of the time window shown, if the x values of the points
+            are timestamps, by default None.
         kwargs
             Additional keyword arguments for creating the plot.
         """
@@ -384,7 +1005,57 @@ class Plotter:
         points = ax.scatter(
             np.full(num_points, np.nan), np.full(num_points, np.nan), **kwargs
         )
+        if time_window is not None:
+            points.set_offset_transform(
+                self._set_time_window(ax_id, time_window)
+            )
+            self.time_series.add(artist_id)
         self.add_artist(artist_id, ax_id, points, PlotType.Scatter)
+        self.buffers[artist_id] = RingBuffer(num_points, (2,))
+
+    def _set_time_window(
+        self, ax_id: str, time_window: float
+    ) -> matplotlib.transforms.Transform:
+        """
+        Set up the x axis of an axis for time-series plots.
+
+        The x limits are fixed to ``(-time_window, 0)``, and the timestamps
+        are shifted by the latest timestamp received by any time-series plot
+        in the axis. The shift is a translation shared by the transforms of
+        all the time-series plots in the axis, so the time window slides
+        without changing the limits, which would require redrawing the whole
+        figure, and streams with different sample rates share the time axis.
+
+        Parameters
+        ----------
+        ax_id : str
+            Unique identifier for the axis.
+        time_window : float
+            Length of the time window shown.
+
+        Returns
+        -------
+        matplotlib.transforms.Transform
+            Transform from the timestamps and values to display coordinates.
+        """
+        ax = self.axs[ax_id]
+        if ax_id not in self.time_offsets:
+            self.time_offsets[ax_id] = matplotlib.transforms.Affine2D()
+            self.latest_times[ax_id] = -math.inf
+        self.time_windows[ax_id] = time_window
+        ax.set_xlim(-time_window, 0)
+        return self.time_offsets[ax_id] + ax.transData
+
+    def _advance_time(self, artist_id: str, val: np.ndarray):
+        """
+        Slide the time window of the axis of a time-series plot to the
+        latest timestamp of the new samples.
+        """
+        ax_id = self.artist_axes[artist_id]
+        t_latest = np.fmax.reduce(val[:, 0]) if len(val) else np.nan
+        if t_latest > self.latest_times[ax_id]:
+            self.latest_times[ax_id] = t_latest
+            self.time_offsets[ax_id].clear().translate(-t_latest, 0)
 
     def create_bar_plot(
         self, artist_id: str, ax_id: str, num_bars: int, **kwargs
@@ -400,16 +1071,54 @@ class Plotter:
             Unique identifier for the axis containing the plot.
         num_bars : int
             Number of bars in the bar plot.
+        kwargs
+            Additional keyword arguments for `BarCollection`: `width`,
+            `bottom` and `align` of the bars, and the keyword arguments of
+            `matplotlib.collections.PolyCollection`.
+        """
+        ax = self.axs[ax_id]
+        bars = BarCollection(np.arange(num_bars), **kwargs)
+        ax.add_collection(bars)
+        ax.autoscale_view()
+        self.add_artist(artist_id, ax_id, bars, PlotType.Bar)
+
+    def create_histogram_plot(
+        self,
+        artist_id: str,
+        ax_id: str,
+        edges: ArrayLike,
+        window: int | None,
+        **kwargs,
+    ):
+        """
+        Create a histogram plot, which counts the received samples.
+
+        Parameters
+        ----------
+        artist_id : str
+            Unique identifier for the plot.
+        ax_id : str
+            Unique identifier for the axis containing the plot.
+        edges : array-like
+            Monotonically increasing bin edges.
+        window : int or None
+            Number of the newest samples counted, or None to count all the
+            samples.
         kwargs
             Additional keyword arguments for creating the plot.
         """
         ax = self.axs[ax_id]
-        bars = ax.bar(
-            [i for i in range(num_bars)],
-            [0 for _ in range(num_bars)],
+        histogram = IncrementalHistogram(edges, window)
+        bars = BarCollection(
+            histogram.edges[:-1],
+            np.diff(histogram.edges),
+            align="edge",
             **kwargs,
         )
-        self.add_artist(artist_id, ax_id, bars, PlotType.Bar)
+        ax.add_collection(bars)
+        ax.autoscale_view()
+        self.add_artist(artist_id, ax_id, bars, PlotType.Histogram)
+        self.histograms[artist_id] = histogram
 
     def create_image_plot(
         self,
@@ -417,11 +1126,15 @@ class Plotter:
         ax_id: str,
         img_shape: tuple[int, int],
         cbar: bool,
+        dtype: str | None = None,
         **kwargs,
     ):
         """
         Create an image plot.
 
+        With `dtype`, the image is a `FastImage`, which keeps the frames in a
+        preallocated buffer and colormaps them through a lookup table.
+
         Parameters
         ----------
         artist_id : str
@@ -432,15 +1145,132 @@ class Plotter:
             Shape of the image data.
         cbar : bool
             Whether to display a colorbar.
+        dtype : str or None, optional
+            Fixed data type of the frames, by default None for an image
+            accepting frames of any data type.
         kwargs
             Additional keyword arguments for creating the plot.
         """
         ax = self.axs[ax_id]
-        img = ax.imshow(np.full(img_shape, np.nan), **kwargs)
+        if dtype is None:
+            img = ax.imshow(np.full(img_shape, np.nan), **kwargs)
+        else:
+            aspect = kwargs.pop("aspect", matplotlib.rcParams["image.aspect"])
+            img = FastImage(ax, img_shape, dtype, **kwargs)
+            ax.add_image(img)
+            ax.set_aspect(aspect)
         if cbar:
             plt.colorbar(img, ax=ax)
         self.add_artist(artist_id, ax_id, img, PlotType.Image)
 
+    def create_waterfall_plot(
+        self,
+        artist_id: str,
+        ax_id: str,
+        num_rows: int,
+        num_cols: int,
+        cbar: bool,
+        **kwargs,
+    ):
+        """
+        Create a waterfall plot.
+
+        The columns are kept in a ring buffer, and the image shows the last
+        `num_cols` columns, with the newest column on the right. The data of
+        the image is updated in place once per frame.
+
+        Parameters
+        ----------
+        artist_id : str
+            Unique identifier for the plot.
+        ax_id : str
+            Unique identifier for the axis containing the plot.
+        num_rows : int
+            Number of values in a column.
+        num_cols : int
+            Number of columns shown.
+        cbar : bool
+            Whether to display a colorbar.
+        kwargs
+            Additional keyword arguments for creating the plot.
+        """
+        ax = self.axs[ax_id]
+        kwargs.setdefault("aspect", "auto")
+        kwargs.setdefault("origin", "lower")
+        img = ax.imshow(np.full((num_rows, num_cols), np.nan), **kwargs)
+        if cbar:
+            plt.colorbar(img, ax=ax)
+        self.add_artist(artist_id, ax_id, img, PlotType.Waterfall)
+        self.buffers[artist_id] = RingBuffer(num_cols, (num_rows,))
+
+    def arm_trigger(self, artist_id: str):
+        """
+        Arm the trigger of a line plot, to capture again in the ``Single``
+        mode.
+
+        Parameters
+        ----------
+        artist_id : str
+            Unique identifier for the line plot.
+        """
+        self.triggers[artist_id].arm()
+
+    def add_transform(
+        self,
+        source_id: str,
+        target_id: str,
+        transform: Transform,
+        item_shape: tuple[int, ...],
+    ):
+        """
+        Feed an artist with a signal derived from the data of another artist
+        or of a stream which isn't plotted.
+
+        Parameters
+        ----------
+        source_id : str
+            Unique identifier for the source artist or stream.
+        target_id : str
+            Unique identifier for the artist fed with the derived signal.
+        transform : Transform
+            The transform computing the derived signal.
+        item_shape : tuple[int, ...]
+            Shape of a single sample of the source.
+        """
+        self.transforms.setdefault(source_id, []).append(
+            (transform, target_id)
+        )
+        self.stream_shapes[source_id] = tuple(item_shape)
+
+    def attach_shared_ring(
+        self,
+        artist_id: str,
+        name: str,
+        capacity: int,
+        item_shape: tuple[int, ...],
+        dtype: str,
+    ):
+        """
+        Attach to the shared memory ring through which the data for an artist
+        is received, instead of the data queue.
+
+        Parameters
+        ----------
+        artist_id : str
+            Unique identifier for the artist.
+        name : str
+            Name of the shared memory block.
+        capacity : int
+            Number of samples stored in the ring.
+        item_shape : tuple[int, ...]
+            Shape of a single sample.
+        dtype : str
+            Data type of the samples.
+        """
+        self.shared_rings[artist_id] = SharedRingBuffer(
+            capacity, item_shape, dtype, name
+        )
+
     def add_artist(
         self,
         artist_id: str,
@@ -462,93 +1292,191 @@ class Plotter:
         type : PlotType
             Type of the plot.
         """
-        if type == PlotType.Bar:
-            for real_artist in artist:
-                real_artist.set_animated(True)
-        else:
-            artist.set_animated(True)
-        fig_id = [
-            id
-            for id, (fig, _, _) in self.figs.items()
-            if self.axs[ax_id] in fig.get_children()
-        ][0]
-        _, _, fig_artists = self.figs[fig_id]
-        if type == PlotType.Bar:
-            for real_artist in artist:
-                fig_artists.append(real_artist)
-        else:
-            fig_artists.append(artist)
+        artist.set_animated(True)
+        _, _, fig_artists = self.figs[self.ax_figs[ax_id]]
+        fig_artists.append(artist)
+        self.ax_artists[ax_id].append(artist)
+        self.artist_axes[artist_id] = ax_id
         self.artists[artist_id] = artist, type
+        self.update_policies[artist_id] = DEFAULT_UPDATE_POLICIES[type]
+        self.coalesced_updates[artist_id] = 0
+
+    def set_update_policy(self, artist_id: str, policy: UpdatePolicy):
+        """
+        Set the policy for combining the updates of an artist received
+        between frames.
+
+        Parameters
+        ----------
+        artist_id : str
+            Unique identifier for the artist.
+        policy : UpdatePolicy
+            The update policy. Line, multi-channel line, scatter, waterfall
+            and histogram plots support only ``UpdatePolicy.Append``, while
+            bar and image plots support ``UpdatePolicy.Latest`` and
+            ``UpdatePolicy.Accumulate``.
+        """
+        _, type = self.artists[artist_id]
+        is_append_type = type in (
+            PlotType.Line,
+            PlotType.MultiLine,
+            PlotType.Scatter,
+            PlotType.Waterfall,
+            PlotType.Histogram,
+        )
+        if is_append_type != (policy == UpdatePolicy.Append):
+            raise ValueError(
+                f"Update policy {policy} not supported for {artist_id}"
+            )
+        self.update_policies[artist_id] = policy
 
-    def update_line_plot(self, artist: matplotlib.lines.Line2D, val: float):
+    def update_line_plot(self, artist_id: str, val: float | ArrayLike):
         """
         Update a line plot with new data.
 
+        The values are appended to the ring buffer of the line, and the line
+        data is updated once before the next frame is drawn.
+
         Parameters
         ----------
-        artist : matplotlib.lines.Line2D
-            Line plot artist.
-        val : float
-            New value for the plot.
+        artist_id : str
+            Unique identifier for the line plot.
+        val : float or array-like
+            New value or 1-D array of new values for the plot. For
+            time-series lines, new (timestamp, value) sample or array of
+            shape (n, 2) of new samples. For triggered lines with an external
+            trigger source, new (value, trigger source) sample or array of
+            shape (n, 2) of new samples.
         """
-        values = artist.get_ydata()
-        values = np.roll(values, -1)
-        values[-1] = val
-        artist.set_ydata(values)
+        if artist_id in self.triggers:
+            # the capture replaces all the samples of the line
+            val = self.triggers[artist_id].capture(val)
+            if val is None:
+                return
+        if artist_id in self.time_series:
+            val = np.asarray(val, dtype=float).reshape(-1, 2)
+            self._advance_time(artist_id, val)
+        self.buffers[artist_id].append(val)
+        if artist_id in self.decimators:
+            self.decimators[artist_id].append(val)
+        self._track_extent(artist_id, val)
+        self.dirty_artists.add(artist_id)
 
-    def update_scatter_plot(
-        self,
-        artist: matplotlib.collections.PathCollection,
-        val: tuple[float, float],
-    ):
+    def update_multi_line_plot(self, artist_id: str, val: ArrayLike):
+        """
+        Update a multi-channel line plot with new data.
+
+        The samples are appended to the 2-D ring buffer of the plot, and the
+        lines are updated once before the next frame is drawn.
+
+        Parameters
+        ----------
+        artist_id : str
+            Unique identifier for the multi-channel line plot.
+        val : array-like
+            New sample of every channel, of shape (num_channels,), or block of
+            samples of shape (n, num_channels).
+        """
+        self.buffers[artist_id].append(val)
+        self._track_extent(artist_id, val)
+        self.dirty_artists.add(artist_id)
+
+    def update_scatter_plot(self, artist_id: str, val: ArrayLike):
         """
         Update a scatter plot with new data.
 
+        The points are appended to the ring buffer of the scatter plot, and
+        the offsets are updated once before the next frame is drawn.
+
         Parameters
         ----------
-        artist : matplotlib.collections.PathCollection
-            Scatter plot artist.
-        val : tuple[float, float]
-            New x, y values for the plot.
+        artist_id : str
+            Unique identifier for the scatter plot.
+        val : array-like
+            New x, y values for the plot, or array of shape (n, 2) of new
+            points.
         """
-        values = artist.get_offsets()
-        x_values = values[:, 0]
-        y_values = values[:, 1]
-        x_values = np.roll(x_values, -1)
-        x_values[-1] = val[0]
-        y_values = np.roll(y_values, -1)
-        y_values[-1] = val[1]
-        values = np.c_[x_values, y_values]
-        artist.set_offsets(values)
+        if artist_id in self.time_series:
+            val = np.asarray(val, dtype=float).reshape(-1, 2)
+            self._advance_time(artist_id, val)
+        self.buffers[artist_id].append(val)
+        self._track_extent(artist_id, val)
+        self.dirty_artists.add(artist_id)
 
-    def update_bar_plot(
-        self, artist: matplotlib.container.BarContainer, val: ArrayLike
-    ):
+    def update_bar_plot(self, artist_id: str, val: ArrayLike):
         """
         Update a bar plot with new data.
 
+        The heights of all the bars are set with one array operation.
+
         Parameters
         ----------
-        artist : matplotlib.container.BarContainer
-            Bar plot artist.
+        artist_id : str
+            Unique identifier for the bar plot.
         val : array-like
-            New heights for the bars.
+            New heights for the bars, or array of shape (n, num_bars) of
+            heights, in which case the last row is shown.
         """
-        bars = artist
-        for bar, h in zip(bars, val):
-            bar.set_height(h)
+        bars, _ = self.artists[artist_id]
+        val = np.asarray(val)
+        if val.ndim == 2:
+            val = val[-1]
+        bars.set_heights(val)
+        self._track_extent(artist_id, val)
+        self.dirty_artists.add(artist_id)
 
-    def update_image_plot(
-        self, artist: matplotlib.image.AxesImage, val: ArrayLike
-    ):
+    def update_histogram_plot(self, artist_id: str, val: float | ArrayLike):
+        """
+        Update a histogram plot with new samples.
+
+        The samples are counted in the bins of the histogram, and the bars
+        are updated once before the next frame is drawn.
+
+        Parameters
+        ----------
+        artist_id : str
+            Unique identifier for the histogram plot.
+        val : float or array-like
+            New sample or 1-D array of new samples.
+        """
+        histogram = self.histograms[artist_id]
+        histogram.append(val)
+        self._track_extent(artist_id, histogram.counts)
+        self.dirty_artists.add(artist_id)
+
+    def update_image_plot(self, artist_id: str, val: ArrayLike):
         """
         Update an image plot with new data.
 
         Parameters
         ----------
-        artist : matplotlib.image.AxesImage
-            Image plot artist.
+        artist_id : str
+            Unique identifier for the image plot.
         val : array-like
-            New image data.
+            New image data, or stack of images along the first axis, in
+            which case the last image is shown.
         """
+        artist, _ = self.artists[artist_id]
+        val = np.asarray(val)
+        if val.ndim > artist.get_array().ndim:
+            val = val[-1]
         artist.set_data(val)
+        self.dirty_artists.add(artist_id)
+
+    def update_waterfall_plot(self, artist_id: str, val: ArrayLike):
+        """
+        Update a waterfall plot with new data.
+
+        The columns are appended to the ring buffer of the waterfall plot,
+        and the image is updated once before the next frame is drawn.
+
+        Parameters
+        ----------
+        artist_id : str
+            Unique identifier for the waterfall plot.
+        val : array-like
+            New column of shape (num_rows,), or array of shape
+            (n, num_rows) of new columns.
+        """
+        self.buffers[artist_id].append(val)
+        self.dirty_artists.add(artist_id)
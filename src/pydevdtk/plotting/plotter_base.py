@@ -1,8 +1,13 @@
+import queue
 import time
 
 import matplotlib
 import matplotlib.pyplot as plt
 
+from . import commands
+from .frame_scheduler import FrameScheduler, PacingMode
+from .telemetry import FrameStatsRecorder, get_queue_depth
+
 
 class Plotter:
     """
@@ -17,11 +22,28 @@ class Plotter:
     background).
     """
 
+    COMMAND_HANDLERS = {
+        commands.Show: "show",
+        commands.Close: "close",
+        commands.Batch: "execute_batch",
+    }
+
     def __call__(
-        self, cmd_queue, data_queue, stop_event, plot_closed_event, fps=None
+        self,
+        cmd_queue,
+        data_queue,
+        stop_event,
+        plot_closed_event,
+        fps=None,
+        pacing=PacingMode.Fixed,
+        stats_name=None,
     ):
         """
         Call method that continuously processes the data and commands.
+        If `fps` is given, the loop sleeps on the stop event until the next
+        frame is due, paced according to `pacing`. If `stats_name` is given,
+        the statistics of every frame are written into the shared memory ring
+        with that name.
         """
         self.cmd_queue = cmd_queue
         self.data_queue = data_queue
@@ -36,20 +58,40 @@ class Plotter:
                 "No figure added, "
                 "ensure `add_figure` is called at least once in `init`"
             )
-        t_start = time.time()
+        self.frame_scheduler = FrameScheduler(fps, pacing)
+        if stats_name is not None:
+            stats_recorder = FrameStatsRecorder(stats_name)
+        else:
+            stats_recorder = None
         while not self.stop_event.is_set():
             self.process_cmd_queue()
-            self.process_data_queue()
+            t_start = time.perf_counter()
+            queue_depth = get_queue_depth(self.data_queue)
+            num_items = self.process_data_queue()
+            if stats_recorder is not None:
+                stats_recorder.data_processed(
+                    -1 if num_items is None else num_items,
+                    time.perf_counter() - t_start,
+                    queue_depth=queue_depth,
+                )
             self.process_events()
-            if fps is not None and time.time() - t_start < 1 / fps:
-                continue
-            self.update_figures()
-            t_start = time.time()
+            if self.frame_scheduler.is_frame_due():
+                t_start = time.perf_counter()
+                self.update_figures()
+                self.frame_scheduler.frame_done(t_start)
+                if stats_recorder is not None:
+                    stats_recorder.frame_done(t_start, self.frame_scheduler)
+            if fps is not None:
+                self.stop_event.wait(self.frame_scheduler.wait_timeout())
 
-        while self.cmd_queue.get() is not None:
-            self.cmd_queue.get()
-        while self.data_queue.get() is not None:
-            self.data_queue.get()
+        for q in (self.cmd_queue, self.data_queue):
+            try:
+                while q.get(timeout=0.1) is not None:
+                    pass
+            except queue.Empty:
+                pass
+        if stats_recorder is not None:
+            stats_recorder.close()
 
     def init(self):
         """
@@ -60,6 +102,8 @@ class Plotter:
     def process_data_queue(self):
         """
         Processes the data queue. Should be overridden in a subclass.
+        May return the number of processed queue items, reported in the
+        statistics as ``items_processed``.
         """
         raise NotImplementedError("process_data_queue method not implemented")
 
@@ -72,11 +116,26 @@ class Plotter:
             cmd = self.cmd_queue.get()
             if cmd is None:
                 # stop
-                pass
-            if cmd[0] == "show":
-                self.show()
-            elif cmd[0] == "close":
-                self.close()
+                continue
+            self.execute_command(cmd)
+
+    def execute_command(self, cmd):
+        """
+        Executes a command with the method registered for its type in
+        `COMMAND_HANDLERS`. Commands without a registered method, such as the
+        commands creating artists, are ignored.
+        """
+        method_name = self.COMMAND_HANDLERS.get(type(cmd))
+        if method_name is not None:
+            method = getattr(self, method_name)
+            method(*cmd.args(), **cmd.keywords())
+
+    def execute_batch(self, cmds):
+        """
+        Executes several commands in order.
+        """
+        for cmd in cmds:
+            self.execute_command(cmd)
 
     def add_figure_and_artists(self, fig, artists):
         """
@@ -1,8 +1,49 @@
+import collections
+import contextlib
+import enum
 import multiprocessing as mp
+import queue
 import warnings
 
-from .plotter import Plotter
+import numpy as np
+
+from . import commands
+from .frame_scheduler import PacingMode
+from .plotter import Plotter, UpdatePolicy
 from .plotter_base import Plotter as PlotterBase
+from .shared_ring import SharedRingBuffer
+from .telemetry import FrameStatsCollector, summarize_stats
+from .transforms import Transform
+from .trigger import Trigger
+
+
+class OverflowPolicy(enum.Enum):
+    """
+    Policies for handling new data when the bounded data queue is full.
+
+    - ``Block``: `PlotterManager.add_data` blocks until there is room in the
+      queue.
+    - ``DropOldest``: the new data waits in a backlog of the manager, of up
+      to `max_queue_size` items, which are sent in order as soon as there is
+      room in the queue. When the backlog is full, its oldest data is
+      dropped. The plotter keeps receiving the newest data, while the data
+      queue is read only by the plotter.
+    - ``DropNewest``: the new data is dropped.
+    - ``Coalesce``: the new data is merged into a single pending item, which
+      is sent when there is room in the queue. The samples of the appended
+      updates are concatenated and only the newest update of the other
+      artists is kept, so no samples are lost while the number of queued
+      items stays bounded.
+
+    ``DropOldest`` and ``DropNewest`` drop whole `add_data` calls, so the
+    samples of appended updates, such as the samples of line and scatter
+    plots, are lost and the plots have gaps.
+    """
+
+    Block = enum.auto()
+    DropOldest = enum.auto()
+    DropNewest = enum.auto()
+    Coalesce = enum.auto()
 
 
 class PlotterManager:
@@ -15,68 +56,488 @@ class PlotterManager:
         The plotter object that will be used to create figures and artists.
     fps : int or None, optional
         The frames per second at which the plotter updates the figures.
+    pacing : PacingMode, optional
+        The frame pacing mode used when `fps` is given. With
+        ``PacingMode.Fixed`` the frames follow a fixed grid, while with
+        ``PacingMode.Adaptive`` the frame period is stretched when rendering
+        can't keep up. Default is ``PacingMode.Fixed``.
+    max_queue_size : int or None, optional
+        Maximum number of items in the data queue, or None for an unbounded
+        queue. Default is None. With a bound, the display stays close to
+        real time when the plotter can't keep up with the data, instead of
+        lagging further and further behind.
+    overflow : OverflowPolicy, optional
+        How new data is handled when the data queue is full. Default is
+        ``OverflowPolicy.Block``.
+    num_processes : int, optional
+        Number of plotter processes, by default 1. With several processes,
+        every figure is drawn by one of the processes, so rendering of
+        multiple figures is spread across the CPU cores. The figures are
+        assigned to the process with the fewest figures, unless a process is
+        given to `create_figure`, and the commands and the data of their
+        axes and artists are routed to the owning process. Every process has
+        its own data queue, of size `max_queue_size`. Not supported with
+        `PlotterBase`, whose figures are created in the plotter process.
+
+    Attributes
+    ----------
+    dropped_items : int
+        Number of `add_data` calls whose data was dropped, or whose data
+        was dropped from the backlog with ``OverflowPolicy.DropOldest``.
+    coalesced_items : int
+        Number of `add_data` calls whose data was merged into a pending item
+        with ``OverflowPolicy.Coalesce``.
+    processes : list[multiprocessing.Process]
+        The plotter processes. The queues, the events and the statistics
+        collectors of the processes are in `cmd_queues`, `data_queues`,
+        `plot_closed_events` and `stats_collectors`, and the ones of the
+        first process are also available as `process`, `cmd_queue`,
+        `data_queue`, `is_plot_closed` and `stats_collector`.
     """
 
-    def __init__(self, plotter: Plotter | PlotterBase, fps: int | None = None):
-        self.cmd_queue = mp.Queue()
-        self.data_queue = mp.Queue()
+    IMAGE_RING_FRAMES = 3
+    """Number of frames held by the shared memory ring of an image plot."""
+
+    def __init__(
+        self,
+        plotter: Plotter | PlotterBase,
+        fps: int | None = None,
+        pacing: PacingMode = PacingMode.Fixed,
+        max_queue_size: int | None = None,
+        overflow: OverflowPolicy = OverflowPolicy.Block,
+        num_processes: int = 1,
+    ):
+        if num_processes < 1:
+            raise ValueError("At least one plotter process is required")
+        if num_processes > 1 and isinstance(plotter, PlotterBase):
+            raise ValueError(
+                "PlotterBase figures can't be sharded across processes"
+            )
+        self.num_processes = num_processes
+        self.cmd_queues = [mp.Queue() for _ in range(num_processes)]
+        self.data_queues = [
+            mp.Queue(max_queue_size or 0) for _ in range(num_processes)
+        ]
+        self.plot_closed_events = [mp.Event() for _ in range(num_processes)]
+        self.stats_collectors = [
+            FrameStatsCollector() for _ in range(num_processes)
+        ]
+        self.overflow = overflow
+        self.max_queue_size = max_queue_size
+        self.dropped_items = 0
+        self.coalesced_items = 0
+        self._coalesced_data: list[dict[str, list]] = [
+            {} for _ in range(num_processes)
+        ]
+        self._backlogs: list[collections.deque] = [
+            collections.deque() for _ in range(num_processes)
+        ]
+        self._artist_updates: dict[str, tuple[UpdatePolicy, tuple]] = {}
+        self._fig_processes: dict[str, int] = {}
+        self._axis_processes: dict[str, int] = {}
+        self._artist_processes: dict[str, int] = {}
         self.stop_event = mp.Event()
-        self.is_plot_closed = mp.Event()
+        self.shared_rings: dict[str, SharedRingBuffer] = {}
+        self._batched_commands: list[list[commands.Command]] | None = None
         self.plotter_worker = plotter
-        self.process = mp.Process(
-            target=self.plotter_worker,
-            args=(
-                self.cmd_queue,
-                self.data_queue,
-                self.stop_event,
-                self.is_plot_closed,
-                fps,
-            ),
-        )
-        self.process.start()
+        self.processes = [
+            mp.Process(
+                target=self.plotter_worker,
+                args=(
+                    self.cmd_queues[i],
+                    self.data_queues[i],
+                    self.stop_event,
+                    self.plot_closed_events[i],
+                    fps,
+                    pacing,
+                    self.stats_collectors[i].name,
+                ),
+            )
+            for i in range(num_processes)
+        ]
+        for process in self.processes:
+            process.start()
+        self.process = self.processes[0]
+        self.cmd_queue = self.cmd_queues[0]
+        self.data_queue = self.data_queues[0]
+        self.is_plot_closed = self.plot_closed_events[0]
+        self.stats_collector = self.stats_collectors[0]
 
     def show(self):
         """Show the plotter window."""
-        self.cmd_queue.put(("show",))
+        self._send_command(commands.Show())
 
     def close(self):
         """Close the plotter window."""
-        self.cmd_queue.put(("close",))
+        self._send_command(commands.Close())
 
     def stop(self):
-        """Stop the plotter process."""
+        """Stop the plotter processes."""
         self.stop_event.set()
-        if self.process is not None and self.process.is_alive():
-            self.cmd_queue.put(None)
-            self.data_queue.put(None)
-            self.process.join(timeout=5)
-            if self.process.exitcode is None:
+        for i, process in enumerate(self.processes):
+            if process.is_alive():
+                self.cmd_queues[i].put(None)
+                try:
+                    self.data_queues[i].put(None, timeout=1)
+                except queue.Full:
+                    pass
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.exitcode is None:
                 warnings.warn("Couldn't stop plotter window process")
+        for ring in self.shared_rings.values():
+            ring.close()
+        self.shared_rings = {}
+        for collector in self.stats_collectors:
+            collector.close()
+
+    def stats(
+        self,
+        window: int | None = None,
+        percentiles: tuple[float, ...] = (50, 95, 99),
+    ) -> dict:
+        """
+        Returns the statistics of the frames drawn by the plotter processes.
+
+        The plotter writes the statistics of every frame into a shared memory
+        ring, so reading them doesn't interfere with plotting. Up to 1024 of
+        the newest frames are kept for the rolling statistics. The statistics
+        should be read at least every 1024 frames, otherwise the oldest
+        frames are missed, counted in ``dropped_records``.
+
+        With several plotter processes, the totals and the frame rates are
+        summed over the processes, and the rolling statistics cover the
+        newest `window` frames of every process.
+
+        Parameters
+        ----------
+        window : int or None, optional
+            Number of the newest frames summarized, by default None for all
+            the kept frames.
+        percentiles : tuple[float, ...], optional
+            Percentiles computed for the rolling statistics, by default
+            (50, 95, 99).
+
+        Returns
+        -------
+        dict
+            Dictionary with:
+
+            - ``frames``: total number of frames drawn.
+            - ``fps``: frames drawn during the last second.
+            - ``skipped_frames``: total number of missed frame slots, when
+              `fps` is given.
+            - ``dropped_records``: number of frames missed by the statistics.
+            - ``dropped_items``, ``coalesced_items``: number of `add_data`
+              calls whose data was dropped or coalesced because the data
+              queue was full.
+            - ``pending_items``: number of items held back by the manager
+              because the data queue was full, to be sent when there is
+              room: the backlog of ``OverflowPolicy.DropOldest``, and one
+              merged item per process with ``OverflowPolicy.Coalesce``.
+            - ``coalesced_updates``: number of artist updates dropped or
+              merged in the plotter processes by the update policies of the
+              artists, see `set_update_policy`.
+            - ``items_processed``: number of data queue items processed per
+              frame. Not available for `PlotterBase` subclasses whose
+              `process_data_queue` doesn't return the number of items.
+            - ``queue_depth``: number of items waiting in the data queue
+              when the plotter started processing the data, the largest
+              per frame. A growing depth means that the plotter is falling
+              behind the data. Not available on platforms without
+              `multiprocessing.Queue.qsize`, such as macOS.
+            - ``process_time``: time spent processing the data per frame.
+            - ``draw_time``: time spent drawing and blitting a frame.
+
+            The rolling statistics are dictionaries with the percentiles,
+            keyed ``"p50"`` etc., the ``"mean"`` and the ``"max"``, and are
+            NaN when no frames were drawn. Times are in seconds.
+        """
+        stats = summarize_stats(self.stats_collectors, window, percentiles)
+        stats["dropped_items"] = self.dropped_items
+        stats["coalesced_items"] = self.coalesced_items
+        stats["pending_items"] = sum(
+            len(backlog) for backlog in self._backlogs
+        ) + sum(1 for data in self._coalesced_data if data)
+        return stats
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Context manager sending all the commands issued inside it, such as
+        creating figures, axes and artists and modifying axes, to the plotter
+        process as one message, when the context exits.
+
+        Every command is otherwise sent as a separate queue message, so
+        batching the setup of a layout with many axes and artists makes the
+        startup much faster. The commands are executed in order. Nested
+        batches are merged into the outermost one.
+
+        Examples
+        --------
+        >>> with manager.batch():
+        ...     manager.create_figure("fig", 2, 1)
+        ...     manager.create_axis("ax0", "fig", 0, 0)
+        ...     manager.create_axis("ax1", "fig", 1, 0)
+        ...     manager.create_line_plot("line0", "ax0", 1000)
+        ...     manager.create_line_plot("line1", "ax1", 1000)
+        """
+        if self._batched_commands is not None:
+            yield
+            return
+        self._batched_commands = [[] for _ in range(self.num_processes)]
+        try:
+            yield
+        finally:
+            batched_commands = self._batched_commands
+            self._batched_commands = None
+            for cmd_queue, cmds in zip(self.cmd_queues, batched_commands):
+                if cmds:
+                    cmd_queue.put(commands.Batch(cmds))
 
     def is_alive(self) -> bool:
-        """Check if the plotter process is alive."""
-        return self.process.is_alive()
+        """Check if the plotter processes are alive."""
+        return all(process.is_alive() for process in self.processes)
 
     def is_shown(self) -> bool:
-        """Check if the plotter window is shown."""
-        return not self.is_plot_closed.is_set()
+        """Check if any plotter window is shown."""
+        return not all(event.is_set() for event in self.plot_closed_events)
 
     def add_data(self, data: dict[str]) -> None:
         """
         Add data to the plotter's data queue.
 
+        Sending batches of samples as NumPy arrays is much cheaper than
+        sending the samples one by one, as every call results in one queue
+        item which is pickled and sent to the plotter process.
+
         Parameters
         ----------
         data : dict[str]
-            Dictionary of data, where the keys are the artist ids.
+            Dictionary of data, where the keys are the artist ids. The values
+            depend on the type of the artist:
+
+            - line plot: a single value or 1-D array of new values. For
+              time-series lines, a single (timestamp, value) sample or array
+              of shape (n, 2) of new samples.
+            - multi-channel line plot: a sample of every channel, of shape
+              (num_channels,), or block of samples of shape
+              (n, num_channels).
+            - scatter plot: a single (x, y) point or array of shape (n, 2) of
+              new points.
+            - bar plot: array of bar heights or array of shape
+              (n, num_bars), of which the last row is shown.
+            - histogram plot: a single sample or 1-D array of new samples,
+              which are counted in the bins of the histogram.
+            - image plot: image or stack of images along the first axis, of
+              which the last one is shown.
+            - waterfall plot: a single column of shape (num_rows,) or array
+              of shape (n, num_rows) of new columns.
+
+            The data for artists created with `shared_memory=True` is written
+            directly into their shared memory rings.
+
+        Notes
+        -----
+        If the data queue is bounded and full, the data is handled according
+        to the `overflow` policy of the manager. With
+        ``OverflowPolicy.Coalesce`` and ``OverflowPolicy.DropOldest``, the
+        pending data is sent by the next call when there is room in the
+        queue, or by `flush`.
+        """
+        if self.shared_rings:
+            queued_data = {}
+            for artist_id, val in data.items():
+                if artist_id in self.shared_rings:
+                    self.shared_rings[artist_id].write(val)
+                else:
+                    queued_data[artist_id] = val
+            if len(queued_data) == 0:
+                return
+            data = queued_data
+        if self.num_processes == 1:
+            self._put_data(0, data)
+            return
+        process_data = {}
+        for artist_id, val in data.items():
+            i_process = self._artist_processes.get(artist_id, 0)
+            process_data.setdefault(i_process, {})[artist_id] = val
+        for i_process, data in process_data.items():
+            self._put_data(i_process, data)
+
+    def flush(self) -> bool:
+        """
+        Send the data coalesced with ``OverflowPolicy.Coalesce``, or held
+        in the backlog with ``OverflowPolicy.DropOldest``, while the data
+        queue was full, if there is room in the queue.
+
+        Returns
+        -------
+        bool
+            True if there is no pending data left.
+        """
+        return all(
+            [self._flush(i_process) for i_process in range(self.num_processes)]
+        )
+
+    def _put_data(self, i_process: int, data: dict[str]):
+        """
+        Put data into the data queue of a plotter process, according to the
+        overflow policy.
+        """
+        data_queue = self.data_queues[i_process]
+        if self.overflow == OverflowPolicy.Block:
+            data_queue.put(data)
+        elif self.overflow == OverflowPolicy.DropNewest:
+            try:
+                data_queue.put_nowait(data)
+            except queue.Full:
+                self.dropped_items += 1
+        elif self.overflow == OverflowPolicy.DropOldest:
+            backlog = self._backlogs[i_process]
+            backlog.append(data)
+            self._flush(i_process)
+            while len(backlog) > (self.max_queue_size or 0):
+                backlog.popleft()
+                self.dropped_items += 1
+        else:
+            if not self._coalesced_data[i_process]:
+                try:
+                    data_queue.put_nowait(data)
+                    return
+                except queue.Full:
+                    pass
+            self._coalesce(i_process, data)
+            self.coalesced_items += 1
+            self._flush(i_process)
+
+    def _flush(self, i_process: int) -> bool:
+        """
+        Send the coalesced data or the backlog of a plotter process, if there
+        is room in its data queue.
+        """
+        if self.overflow == OverflowPolicy.DropOldest:
+            backlog = self._backlogs[i_process]
+            while backlog:
+                try:
+                    self.data_queues[i_process].put_nowait(backlog[0])
+                except queue.Full:
+                    return False
+                backlog.popleft()
+            return True
+        coalesced_data = self._coalesced_data[i_process]
+        if not coalesced_data:
+            return True
+        data = {
+            artist_id: self._combine_updates(artist_id, vals)
+            for artist_id, vals in coalesced_data.items()
+        }
+        try:
+            self.data_queues[i_process].put_nowait(data)
+        except queue.Full:
+            return False
+        self._coalesced_data[i_process] = {}
+        return True
+
+    def set_update_policy(self, artist_id: str, policy: UpdatePolicy):
         """
-        self.data_queue.put(data)
+        Set the policy for combining the updates of an artist which arrive
+        faster than the figures are redrawn.
+
+        By default, line and scatter plots append all the samples, while bar
+        and image plots show only the newest update and drop the superseded
+        ones before they reach matplotlib.
+
+        Parameters
+        ----------
+        artist_id : str
+            The ID of the artist.
+        policy : UpdatePolicy
+            The update policy. ``UpdatePolicy.Latest`` and
+            ``UpdatePolicy.Accumulate`` are supported for bar and image plots.
+        """
+        _, item_shape = self._artist_updates.get(artist_id, (None, ()))
+        self._register_artist(artist_id, policy, item_shape)
+        self._send_command(commands.SetUpdatePolicy(artist_id, policy))
+
+    def arm_trigger(self, artist_id: str):
+        """
+        Arm the trigger of a line plot again, to capture the next trigger
+        event in the ``TriggerMode.Single`` mode.
+
+        Parameters
+        ----------
+        artist_id : str
+            The ID of the triggered line plot.
+        """
+        self._send_command(commands.ArmTrigger(artist_id))
+
+    def add_transform(
+        self,
+        source_id: str,
+        target_id: str,
+        transform: Transform,
+        item_shape: tuple[int, ...] | None = None,
+    ):
+        """
+        Feed an artist with a signal derived in the plotter process from the
+        data of another artist, such as a filtered signal, its envelope or
+        its spectrum.
+
+        The source can also be a stream which isn't plotted itself, whose
+        data is passed to `add_data` as for an artist. The transform keeps
+        its state between the updates, so the derived signal is continuous.
+
+        Parameters
+        ----------
+        source_id : str
+            The ID of the source artist or stream.
+        target_id : str
+            The ID of the artist fed with the derived signal.
+        transform : Transform
+            The transform computing the derived signal, a copy of which is
+            sent to the plotter process.
+        item_shape : tuple[int, ...] or None, optional
+            Shape of a single sample of the source, by default None for the
+            shape of the samples of the source artist, or a scalar if the
+            source isn't an artist.
+
+        Raises
+        ------
+        ValueError
+            If the target artist doesn't exist, or if the source and the
+            target are shown by different plotter processes.
+        """
+        if target_id not in self._artist_updates:
+            raise ValueError(f"Unknown artist {target_id}")
+        if source_id in self._artist_updates:
+            if item_shape is None:
+                _, item_shape = self._artist_updates[source_id]
+        else:
+            if item_shape is None:
+                item_shape = ()
+            # all the samples of a stream are needed by its transforms
+            self._register_artist(source_id, UpdatePolicy.Append, item_shape)
+        if self.num_processes > 1:
+            i_process = self._artist_processes[target_id]
+            i_source = self._artist_processes.setdefault(source_id, i_process)
+            if i_source != i_process:
+                raise ValueError(
+                    f"Artists {source_id} and {target_id} are shown by "
+                    "different plotter processes"
+                )
+        self._send_command(
+            commands.AddTransform(
+                source_id, target_id, transform, tuple(item_shape)
+            )
+        )
 
     def create_figure(
         self,
         fig_id: str,
         grid_rows: int = 1,
         grid_cols: int = 1,
+        process: int | None = None,
         **kwargs,
     ) -> None:
         """
@@ -91,12 +552,25 @@ class PlotterManager:
             The number of rows in the grid. Default is 1.
         grid_cols : int, optional
             The number of columns in the grid. Default is 1.
+        process : int or None, optional
+            Index of the plotter process drawing the figure, when the manager
+            has several processes. Default is None, for the process with the
+            fewest figures.
         kwargs
             Keyword arguments to pass to the figure constructor.
             Look-up the docstring for `matplotlib.figure.Figure`.
         """
-        grid_size = (grid_rows, grid_cols)
-        self.cmd_queue.put(("create_fig", fig_id, kwargs, grid_size))
+        if process is None:
+            num_figs = [0] * self.num_processes
+            for i_process in self._fig_processes.values():
+                num_figs[i_process] += 1
+            process = num_figs.index(min(num_figs))
+        elif not 0 <= process < self.num_processes:
+            raise ValueError(f"Invalid plotter process {process}")
+        self._fig_processes[fig_id] = process
+        self._send_command(
+            commands.CreateFigure(fig_id, grid_rows, grid_cols, kwargs)
+        )
 
     def create_axis(
         self,
@@ -125,13 +599,9 @@ class PlotterManager:
         num_cols : int, optional
             The number of columns in the grid. Default is 1.
         """
-        self.cmd_queue.put(
-            (
-                "create_axis",
-                axis_id,
-                fig_id,
-                (i_row, i_col),
-                (num_rows, num_cols),
+        self._send_command(
+            commands.CreateAxis(
+                axis_id, fig_id, i_row, i_col, num_rows, num_cols
             )
         )
 
@@ -177,9 +647,8 @@ class PlotterManager:
         legend : bool, optional
             Whether to show the legend. Default is False.
         """
-        self.cmd_queue.put(
-            (
-                "modify_axis",
+        self._send_command(
+            commands.ModifyAxis(
                 axis_id,
                 xlim,
                 ylim,
@@ -194,16 +663,77 @@ class PlotterManager:
             )
         )
 
+    def set_autoscale(
+        self,
+        axis_id: str,
+        axis: str | None = "y",
+        margin: float = 0.1,
+        shrink_ratio: float = 0.5,
+        max_rate: float = 2.0,
+    ):
+        """
+        Autoscale the limits of the axis with the given ID to the plotted
+        data.
+
+        The limits follow the running minimum and maximum of the incoming
+        data, with hysteresis: they are expanded when the data leaves them,
+        and shrunk only when the shown data spans less than `shrink_ratio` of
+        them. As every change of the limits redraws the whole figure, the
+        limits change at most `max_rate` times per second. Setting fixed
+        limits with `modify_axis` disables autoscaling of those limits.
+
+        Parameters
+        ----------
+        axis_id : str
+            The ID of the axis.
+        axis : {'x', 'y', 'both'} or None, optional
+            Which limits to autoscale. The x limits are autoscaled only from
+            the data of scatter plots. None disables autoscaling. Default is
+            'y'.
+        margin : float, optional
+            Padding added on both sides of the data extent, as a fraction of
+            the extent. Default is 0.1.
+        shrink_ratio : float, optional
+            Fraction of the limits below which the extent of the shown data
+            must fall for the limits to shrink. Default is 0.5.
+        max_rate : float, optional
+            Maximum number of changes of the limits per second. Default is
+            2.0.
+        """
+        if axis not in ("x", "y", "both", None):
+            raise ValueError(f"Invalid autoscale axis {axis}")
+        self._send_command(
+            commands.SetAutoscale(
+                axis_id, axis, margin, shrink_ratio, max_rate
+            )
+        )
+
     def create_line_plot(
         self,
         artist_id: str,
         axis_id: str,
         size: int,
+        shared_memory: bool = False,
+        decimate: bool = False,
+        time_window: float | None = None,
+        trigger: Trigger | None = None,
         **kwargs,
     ) -> None:
         """
         Create a line plot.
 
+        By default, the line is plotted against the sample index. With
+        `time_window`, the line is a time series drawn from (timestamp,
+        value) samples, which suits irregularly sampled data, and lines with
+        different sample rates can share one axis. The x axis of a
+        time-series axis shows the time relative to the latest timestamp
+        received in the axis, from ``-time_window`` to 0, and slides without
+        redrawing the figure.
+
+        With `trigger`, the line works like an oscilloscope: it shows
+        captures aligned on the trigger events, detected in the plotter
+        process, and is redrawn only when a capture completes.
+
         Parameters
         ----------
         artist_id : str
@@ -212,19 +742,108 @@ class PlotterManager:
             The ID of the axis.
         size : int
             The number of points on the line plot.
+        shared_memory : bool, optional
+            Whether to send the data for the line plot through a shared
+            memory ring buffer instead of the data queue. Default is False.
+        decimate : bool, optional
+            Whether to draw the per-pixel-column min/max envelope of the data
+            instead of all the samples, when the line has more samples than
+            the axis has pixel columns. Useful for lines with long history.
+            Not supported for time-series lines. Default is False.
+        time_window : float or None, optional
+            The length of the time window shown, in the units of the
+            timestamps, for time-series lines. Default is None.
+        trigger : Trigger or None, optional
+            The trigger of the captures shown by the line, whose size is the
+            number of points on the line. With an external trigger source,
+            the line receives (value, trigger source) samples. Not supported
+            for time-series lines. Default is None.
         kwargs : Any
             Additional keyword arguments to pass to the plot method.
             Look-up the docstring for `matplotlib.Axes.plot` method.
         """
-        self.cmd_queue.put(
-            ("create_line_plot", artist_id, axis_id, size, kwargs)
+        if decimate and time_window is not None:
+            raise ValueError("Time-series lines can't be decimated")
+        if trigger is not None and time_window is not None:
+            raise ValueError("Time-series lines can't be triggered")
+        if trigger is not None and not 0 <= trigger.pre_trigger < size:
+            raise ValueError("Pre-trigger must be smaller than the line size")
+        self._send_command(
+            commands.CreateLinePlot(
+                artist_id,
+                axis_id,
+                size,
+                decimate,
+                time_window,
+                trigger,
+                kwargs,
+            )
+        )
+        if trigger is not None:
+            item_shape = trigger.item_shape
+        elif time_window is not None:
+            item_shape = (2,)
+        else:
+            item_shape = ()
+        self._register_artist(artist_id, UpdatePolicy.Append, item_shape)
+        if shared_memory:
+            self._create_shared_ring(artist_id, 2 * size, item_shape)
+
+    def create_multi_line_plot(
+        self,
+        artist_id: str,
+        axis_id: str,
+        size: int,
+        num_channels: int,
+        channel_offsets: float | list[float] | None = None,
+        shared_memory: bool = False,
+        **kwargs,
+    ) -> None:
+        """
+        Create a line plot with multiple channels, which are updated with one
+        array and drawn with one draw call.
+
+        Parameters
+        ----------
+        artist_id : str
+            The ID of the artist.
+        axis_id : str
+            The ID of the axis.
+        size : int
+            The number of points on the line of every channel.
+        num_channels : int
+            The number of channels.
+        channel_offsets : float or list[float] or None, optional
+            The vertical offsets added to the channels, for stacking the
+            channels on top of each other. Default is None.
+        shared_memory : bool, optional
+            Whether to send the data for the plot through a shared memory ring
+            buffer instead of the data queue. Default is False.
+        kwargs : Any
+            Additional keyword arguments to pass to the `LineCollection`.
+            Look-up the docstring for `matplotlib.collections.LineCollection`.
+        """
+        self._send_command(
+            commands.CreateMultiLinePlot(
+                artist_id,
+                axis_id,
+                size,
+                num_channels,
+                channel_offsets,
+                kwargs,
+            )
         )
+        self._register_artist(artist_id, UpdatePolicy.Append, (num_channels,))
+        if shared_memory:
+            self._create_shared_ring(artist_id, 2 * size, (num_channels,))
 
     def create_scatter_plot(
         self,
         artist_id: str,
         axis_id: str,
         num_points: int,
+        shared_memory: bool = False,
+        time_window: float | None = None,
         **kwargs,
     ) -> None:
         """
@@ -239,13 +858,25 @@ class PlotterManager:
             The ID of the axis.
         num_points : int
             The number of points in the scatter plot.
+        shared_memory : bool, optional
+            Whether to send the data for the scatter plot through a shared
+            memory ring buffer instead of the data queue. Default is False.
+        time_window : float or None, optional
+            If given, the x values of the points are timestamps, and the x
+            axis shows the last `time_window` of time, as for time-series
+            line plots. Default is None.
         kwargs
             Additional keyword arguments to pass to the scatter method.
             Look-up the docstring for `matplotlib.Axes.scatter` method.
         """
-        self.cmd_queue.put(
-            ("create_scatter_plot", artist_id, axis_id, num_points, kwargs)
+        self._send_command(
+            commands.CreateScatterPlot(
+                artist_id, axis_id, num_points, time_window, kwargs
+            )
         )
+        self._register_artist(artist_id, UpdatePolicy.Append, (2,))
+        if shared_memory:
+            self._create_shared_ring(artist_id, 2 * num_points, (2,))
 
     def create_bar_plot(
         self,
@@ -257,6 +888,10 @@ class PlotterManager:
         """
         Create a bar plot.
 
+        The bars are placed at the positions 0 to ``num_bars - 1`` and drawn
+        as one `BarCollection`, instead of the separate rectangles of
+        `matplotlib.Axes.bar`.
+
         Parameters
         ----------
         artist_id : str
@@ -266,12 +901,63 @@ class PlotterManager:
         num_bars : int
             The number of bars in the bar plot.
         kwargs
-            Additional keyword arguments to pass to the bar method.
-            Look-up the docstring for `matplotlib.Axes.bar` method.
+            Additional keyword arguments for the bars: `width`, `bottom`
+            and `align`, as for `matplotlib.Axes.bar`, and the keyword
+            arguments of `matplotlib.collections.PolyCollection`, such as
+            `facecolor`, `edgecolor`, `linewidth`, `alpha` and `label`. The
+            colors can be given per bar. Unlike for `matplotlib.Axes.bar`,
+            `color` sets both the face and the edge colors, and `tick_label`,
+            `xerr`, `yerr`, `capsize`, `error_kw` and `log` aren't
+            supported. The tick labels can be set with `modify_axis`.
         """
-        self.cmd_queue.put(
-            ("create_bar_plot", artist_id, axis_id, num_bars, kwargs)
+        self._send_command(
+            commands.CreateBarPlot(artist_id, axis_id, num_bars, kwargs)
         )
+        self._register_artist(artist_id, UpdatePolicy.Latest, (num_bars,))
+
+    def create_histogram_plot(
+        self,
+        artist_id: str,
+        axis_id: str,
+        bin_edges: list[float],
+        window: int | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        Create a histogram plot of raw samples, which are binned in the
+        plotter process.
+
+        Parameters
+        ----------
+        artist_id : str
+            The ID of the artist.
+        axis_id : str
+            The ID of the axis.
+        bin_edges : list[float]
+            The monotonically increasing bin edges. All the bins but the last
+            are half-open, and the last one includes its right edge.
+        window : int or None, optional
+            The number of the newest samples counted. If None, all the
+            received samples are counted. Default is None.
+        kwargs
+            Additional keyword arguments to pass to the bar collection.
+            Look-up the docstring for `matplotlib.collections.PolyCollection`.
+        """
+        bin_edges = np.asarray(bin_edges, dtype=float)
+        if bin_edges.ndim != 1 or bin_edges.size < 2:
+            raise ValueError("At least two bin edges are required")
+        if np.any(np.diff(bin_edges) <= 0):
+            raise ValueError("Bin edges must increase monotonically")
+        self._send_command(
+            commands.CreateHistogramPlot(
+                artist_id,
+                axis_id,
+                bin_edges,
+                window,
+                kwargs,
+            )
+        )
+        self._register_artist(artist_id, UpdatePolicy.Append, ())
 
     def create_image_plot(
         self,
@@ -279,12 +965,22 @@ class PlotterManager:
         axis_id: str,
         img_shape: tuple[int, int],
         cbar: bool = False,
+        dtype: np.dtype | None = None,
+        shared_memory: bool = False,
         **kwargs,
     ) -> None:
         """
         Create an image plot with the given ID, axis ID, image shape, and
         keyword arguments.
 
+        With `dtype`, the image takes the fast path for high frame rates:
+        the frames are written into a preallocated buffer of the fixed shape
+        and data type, and colormapped through a lookup table precomputed
+        from the colormap and the color limits, instead of matplotlib
+        normalizing and colormapping every frame. If every frame pixel
+        covers one display pixel, the frames are also drawn without
+        resampling.
+
         Parameters
         ----------
         artist_id : str
@@ -295,10 +991,188 @@ class PlotterManager:
             The shape of the image.
         cbar : bool, optional
             Whether to include colorbar, by default False.
+        dtype : dtype-like or None, optional
+            The fixed data type of the frames, such as ``np.uint8`` or
+            ``np.uint16``, by default None for frames of any data type.
+        shared_memory : bool, optional
+            Whether to send the frames through a shared memory ring buffer
+            instead of the data queue, from which the plotter colormaps the
+            newest frame in place. Requires `dtype`. Default is False.
+        kwargs
+            Additional keyword arguments to pass to the imshow method.
+            Look-up the docstring for `matplotlib.Axes.imshow` method.
+            With `dtype`, the color limits `vmin` and `vmax` default to the
+            range of integer data types and to (0, 1) for the other ones.
+        """
+        if shared_memory and dtype is None:
+            raise ValueError("Shared memory images need a fixed dtype")
+        if dtype is not None:
+            dtype = np.dtype(dtype).str
+        self._send_command(
+            commands.CreateImagePlot(
+                artist_id, axis_id, img_shape, cbar, dtype, kwargs
+            )
+        )
+        self._register_artist(artist_id, UpdatePolicy.Latest, img_shape)
+        if shared_memory:
+            # the newest frame isn't overwritten while it's colormapped
+            self._create_shared_ring(
+                artist_id, self.IMAGE_RING_FRAMES, img_shape, dtype
+            )
+
+    def create_waterfall_plot(
+        self,
+        artist_id: str,
+        axis_id: str,
+        num_rows: int,
+        num_cols: int,
+        cbar: bool = False,
+        shared_memory: bool = False,
+        **kwargs,
+    ) -> None:
+        """
+        Create a waterfall plot, such as a spectrogram, which scrolls to the
+        left as new columns are added.
+
+        Only the new columns are sent to the plotter process, which keeps the
+        image in a ring buffer of columns.
+
+        Parameters
+        ----------
+        artist_id : str
+            The ID of the artist.
+        axis_id : str
+            The ID of the axis.
+        num_rows : int
+            The number of values in a column.
+        num_cols : int
+            The number of columns shown.
+        cbar : bool, optional
+            Whether to include colorbar, by default False.
+        shared_memory : bool, optional
+            Whether to send the columns through a shared memory ring buffer
+            instead of the data queue. Default is False.
         kwargs
             Additional keyword arguments to pass to the imshow method.
             Look-up the docstring for `matplotlib.Axes.imshow` method.
         """
-        self.cmd_queue.put(
-            ("create_image_plot", artist_id, axis_id, img_shape, cbar, kwargs)
+        self._send_command(
+            commands.CreateWaterfallPlot(
+                artist_id, axis_id, num_rows, num_cols, cbar, kwargs
+            )
+        )
+        self._register_artist(artist_id, UpdatePolicy.Append, (num_rows,))
+        if shared_memory:
+            self._create_shared_ring(artist_id, 2 * num_cols, (num_rows,))
+
+    def _coalesce(self, i_process: int, data: dict[str]):
+        """
+        Add data to the pending coalesced data of a plotter process.
+        """
+        coalesced_data = self._coalesced_data[i_process]
+        for artist_id, val in data.items():
+            policy, _ = self._artist_updates.get(
+                artist_id, (UpdatePolicy.Latest, ())
+            )
+            if policy == UpdatePolicy.Latest:
+                coalesced_data[artist_id] = [val]
+            else:
+                coalesced_data.setdefault(artist_id, []).append(val)
+
+    def _combine_updates(self, artist_id: str, vals: list):
+        """
+        Combine the coalesced updates of an artist into one update. The
+        samples of the appended and the accumulated updates are stacked, and
+        the plotter applies them in order.
+        """
+        if len(vals) == 1:
+            return vals[0]
+        _, item_shape = self._artist_updates[artist_id]
+        return np.concatenate(
+            [np.reshape(val, (-1, *item_shape)) for val in vals]
+        )
+
+    def _register_artist(
+        self,
+        artist_id: str,
+        policy: UpdatePolicy,
+        item_shape: tuple[int, ...],
+    ):
+        """
+        Register the update policy and the shape of a sample of an artist,
+        used for coalescing its updates.
+        """
+        self._artist_updates[artist_id] = (policy, tuple(item_shape))
+
+    def _send_command(self, cmd: commands.Command):
+        """
+        Send a command to the plotter process, or add it to the current
+        batch.
+
+        Parameters
+        ----------
+        cmd : Command
+            The command.
+        """
+        for i_process in self._route_command(cmd):
+            if self._batched_commands is not None:
+                self._batched_commands[i_process].append(cmd)
+            else:
+                self.cmd_queues[i_process].put(cmd)
+
+    def _route_command(self, cmd: commands.Command) -> list[int]:
+        """
+        Returns the indices of the plotter processes to which a command is
+        sent, and records the owners of the created axes and artists.
+        """
+        if self.num_processes == 1:
+            return [0]
+        if isinstance(cmd, commands.CreateFigure):
+            return [self._fig_processes[cmd.fig_id]]
+        if isinstance(cmd, commands.CreateAxis):
+            if cmd.fig_id not in self._fig_processes:
+                raise ValueError(f"Unknown figure {cmd.fig_id}")
+            i_process = self._fig_processes[cmd.fig_id]
+            self._axis_processes[cmd.ax_id] = i_process
+            return [i_process]
+        if isinstance(cmd, commands.AddTransform):
+            return [self._artist_processes[cmd.target_id]]
+        if hasattr(cmd, "ax_id"):
+            if cmd.ax_id not in self._axis_processes:
+                raise ValueError(f"Unknown axis {cmd.ax_id}")
+            i_process = self._axis_processes[cmd.ax_id]
+            if hasattr(cmd, "artist_id"):
+                self._artist_processes[cmd.artist_id] = i_process
+            return [i_process]
+        if hasattr(cmd, "artist_id"):
+            if cmd.artist_id not in self._artist_processes:
+                raise ValueError(f"Unknown artist {cmd.artist_id}")
+            return [self._artist_processes[cmd.artist_id]]
+        # commands for all the figures, such as showing the windows
+        return list(range(self.num_processes))
+
+    def _create_shared_ring(
+        self,
+        artist_id: str,
+        capacity: int,
+        item_shape: tuple[int, ...],
+        dtype: np.dtype = np.float64,
+    ) -> None:
+        """
+        Create the shared memory ring for the data of an artist and send it to
+        the plotter. The rings of the plots of sample streams hold twice the
+        samples shown by the artist, so the producer can run ahead of the
+        plotter by a full artist length without overwriting samples being
+        read, while the rings of image plots hold `IMAGE_RING_FRAMES` frames.
+        """
+        ring = SharedRingBuffer(capacity, item_shape, dtype)
+        self.shared_rings[artist_id] = ring
+        self._send_command(
+            commands.AttachSharedRing(
+                artist_id,
+                ring.name,
+                capacity,
+                item_shape,
+                ring.dtype.str,
+            )
         )
@@ -0,0 +1,111 @@
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
+
+
+class RingBuffer:
+    """
+    Fixed-size circular buffer of samples with constant time appends.
+
+    Samples are written in place at the write index, which wraps around when
+    the end of the buffer is reached. The ordered view, from the oldest to
+    the newest sample, is materialized only when requested.
+
+    Parameters
+    ----------
+    size : int
+        Number of samples kept in the buffer.
+    item_shape : tuple[int, ...], optional
+        Shape of a single sample, by default () for scalar samples.
+    dtype : dtype-like, optional
+        Data type of the samples, by default float64.
+    fill_value : float, optional
+        Initial value of the buffer, by default NaN.
+
+    Attributes
+    ----------
+    data : numpy.ndarray
+        The underlying storage, of shape (size, *item_shape).
+    index : int
+        Position where the next sample is written.
+    count : int
+        Total number of samples appended to the buffer.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        item_shape: tuple[int, ...] = (),
+        dtype: DTypeLike = np.float64,
+        fill_value: float = np.nan,
+    ):
+        self.data = np.full((size, *item_shape), fill_value, dtype)
+        self.index = 0
+        self.count = 0
+
+    @property
+    def size(self) -> int:
+        """Number of samples kept in the buffer."""
+        return self.data.shape[0]
+
+    @property
+    def item_shape(self) -> tuple[int, ...]:
+        """Shape of a single sample."""
+        return self.data.shape[1:]
+
+    def append(self, values: ArrayLike):
+        """
+        Append one sample or a batch of samples to the buffer.
+
+        Parameters
+        ----------
+        values : array-like
+            A single sample of shape `item_shape` or a batch of samples of
+            shape (n, *item_shape).
+        """
+        values = np.asarray(values, dtype=self.data.dtype)
+        if values.shape == self.item_shape:
+            values = values[np.newaxis]
+        n = values.shape[0]
+        size = self.size
+        self.count += n
+        if n >= size:
+            self.data[:] = values[n - size :]
+            self.index = 0
+            return
+        end = self.index + n
+        if end <= size:
+            self.data[self.index : end] = values
+        else:
+            n_first = size - self.index
+            self.data[self.index :] = values[:n_first]
+            self.data[: n - n_first] = values[n_first:]
+        self.index = end % size
+
+    def view(self) -> np.ndarray:
+        """
+        Returns the samples ordered from the oldest to the newest.
+
+        Returns
+        -------
+        numpy.ndarray
+            Copy of the buffer of shape (size, *item_shape), starting with the
+            oldest sample.
+        """
+        if self.index == 0:
+            return self.data.copy()
+        return np.concatenate(
+            (self.data[self.index :], self.data[: self.index])
+        )
+
+    def clear(self, fill_value: float = np.nan):
+        """
+        Reset the buffer to its initial state.
+
+        Parameters
+        ----------
+        fill_value : float, optional
+            Value the buffer is filled with, by default NaN.
+        """
+        self.data.fill(fill_value)
+        self.index = 0
+        self.count = 0
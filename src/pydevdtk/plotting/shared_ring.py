@@ -0,0 +1,216 @@
+import math
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
+
+
+def attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to an existing shared memory block without tracking it.
+
+    The block is owned and destroyed by the process which created it. Before
+    Python 3.13, attaching registers the block with the resource tracker,
+    which would destroy it when the attaching process exits, or, if the
+    tracker is shared with the creating process, fail when the creator
+    destroys it, so the registration is suppressed.
+
+    Parameters
+    ----------
+    name : str
+        Name of the shared memory block.
+
+    Returns
+    -------
+    multiprocessing.shared_memory.SharedMemory
+        The attached shared memory block.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+class SharedRingBuffer:
+    """
+    Lock-free single-producer/single-consumer ring buffer of samples with
+    fixed data type, stored in shared memory.
+
+    The shared memory block starts with a header holding the total number of
+    samples written, followed by the sample storage. The producer writes the
+    samples in place and then advances the counter. The consumer keeps its
+    own read counter and returns the samples written since the previous read.
+    If the producer runs ahead by more than the capacity, the oldest unread
+    samples are overwritten and counted as dropped.
+
+    Parameters
+    ----------
+    capacity : int
+        Number of samples stored in the ring.
+    item_shape : tuple[int, ...], optional
+        Shape of a single sample, by default () for scalar samples.
+    dtype : dtype-like, optional
+        Data type of the samples, by default float64.
+    name : str or None, optional
+        Name of an existing shared memory block to attach to. If None, a new
+        block is created, by default None.
+
+    Attributes
+    ----------
+    capacity : int
+        Number of samples stored in the ring.
+    item_shape : tuple[int, ...]
+        Shape of a single sample.
+    dtype : numpy.dtype
+        Data type of the samples.
+    data : numpy.ndarray
+        The sample storage, of shape (capacity, *item_shape), backed by the
+        shared memory.
+    read_count : int
+        Number of samples consumed by the consumer.
+    dropped : int
+        Number of samples overwritten before being read by the consumer.
+    """
+
+    _HEADER_SIZE = 64
+
+    def __init__(
+        self,
+        capacity: int,
+        item_shape: tuple[int, ...] = (),
+        dtype: DTypeLike = np.float64,
+        name: str | None = None,
+    ):
+        self.capacity = capacity
+        self.item_shape = tuple(item_shape)
+        self.dtype = np.dtype(dtype)
+        nbytes = (
+            self._HEADER_SIZE
+            + capacity * math.prod(self.item_shape) * self.dtype.itemsize
+        )
+        self._owner = name is None
+        if self._owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        else:
+            self.shm = attach_shared_memory(name)
+        self._write_count = np.ndarray((1,), np.uint64, self.shm.buf, 0)
+        if self._owner:
+            self._write_count[0] = 0
+        self.data = np.ndarray(
+            (capacity, *self.item_shape),
+            self.dtype,
+            self.shm.buf,
+            self._HEADER_SIZE,
+        )
+        self.read_count = 0
+        self.dropped = 0
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block."""
+        return self.shm.name
+
+    @property
+    def write_count(self) -> int:
+        """Total number of samples written by the producer."""
+        return int(self._write_count[0])
+
+    def write(self, values: ArrayLike):
+        """
+        Write one sample or a batch of samples. Called by the producer.
+
+        Parameters
+        ----------
+        values : array-like
+            A single sample of shape `item_shape` or a batch of samples of
+            shape (n, *item_shape).
+        """
+        values = np.asarray(values, dtype=self.dtype)
+        if values.shape == self.item_shape:
+            values = values[np.newaxis]
+        n = values.shape[0]
+        count = self.write_count
+        if n > self.capacity:
+            count += n - self.capacity
+            values = values[n - self.capacity :]
+            n = self.capacity
+        start = count % self.capacity
+        end = start + n
+        if end <= self.capacity:
+            self.data[start:end] = values
+        else:
+            n_first = self.capacity - start
+            self.data[start:] = values[:n_first]
+            self.data[: n - n_first] = values[n_first:]
+        # publish the samples only after they are written
+        self._write_count[0] = count + n
+
+    def read(self, max_items: int | None = None) -> np.ndarray:
+        """
+        Read the samples written since the previous read. Called by the
+        consumer.
+
+        If the samples are stored contiguously, a view of the shared memory
+        is returned without copying. The view must be used before the
+        producer writes `capacity` more samples.
+
+        Parameters
+        ----------
+        max_items : int or None, optional
+            Read only the newest `max_items` samples and skip the older ones,
+            by default None to read all the unread samples.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape (n, *item_shape) with the new samples, oldest
+            first.
+        """
+        count = self.write_count
+        n = count - self.read_count
+        if n > self.capacity:
+            self.dropped += n - self.capacity
+            n = self.capacity
+        if max_items is not None:
+            n = min(n, max_items)
+        self.read_count = count
+        start = (count - n) % self.capacity
+        end = start + n
+        if end <= self.capacity:
+            return self.data[start:end]
+        return np.concatenate(
+            (self.data[start:], self.data[: end - self.capacity])
+        )
+
+    def latest(self) -> np.ndarray | None:
+        """
+        Returns a view of the newest sample and marks all the samples as read.
+        Called by the consumer.
+
+        Returns
+        -------
+        numpy.ndarray or None
+            View of the newest sample, of shape `item_shape`, or None if no
+            new samples were written since the previous read.
+        """
+        count = self.write_count
+        if count == self.read_count:
+            return None
+        self.read_count = count
+        return self.data[(count - 1) % self.capacity]
+
+    def close(self):
+        """
+        Release the shared memory. The block is also destroyed if it was
+        created by this instance.
+        """
+        self._write_count = None
+        self.data = None
+        self.shm.close()
+        if self._owner:
+            self.shm.unlink()
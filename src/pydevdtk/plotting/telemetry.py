@@ -0,0 +1,322 @@
+import time
+
+import numpy as np
+
+from .frame_scheduler import FrameScheduler
+from .shared_ring import SharedRingBuffer
+
+FRAME_STATS_DTYPE = np.dtype(
+    [
+        ("time", np.float64),
+        ("items_processed", np.int64),
+        ("queue_depth", np.int64),
+        ("process_time", np.float64),
+        ("draw_time", np.float64),
+        ("fps", np.float64),
+        ("frame_count", np.int64),
+        ("skipped_frames", np.int64),
+        ("coalesced_updates", np.int64),
+    ]
+)
+"""Data type of the per-frame statistics records."""
+
+STATS_RING_SIZE = 1024
+"""Number of records held by the shared memory ring."""
+
+
+def get_queue_depth(data_queue) -> int:
+    """
+    Returns the number of items waiting in a queue, or -1 if the platform
+    doesn't support it, such as `multiprocessing.Queue` on macOS.
+    """
+    try:
+        return data_queue.qsize()
+    except NotImplementedError:
+        return -1
+
+
+class FrameStatsRecorder:
+    """
+    Records the statistics of every frame drawn by the plotter process into
+    the shared memory ring created by `FrameStatsCollector`.
+
+    Parameters
+    ----------
+    name : str
+        Name of the shared memory block of the ring.
+
+    Attributes
+    ----------
+    items_processed : int
+        Number of data queue items processed since the previous frame, -1 if
+        unknown.
+    queue_depth : int
+        Largest number of items waiting in the data queue since the previous
+        frame, -1 if unknown.
+    process_time : float
+        Time spent processing the data since the previous frame, in seconds.
+    coalesced_updates : int
+        Total number of artist updates dropped or merged by the update
+        policies of the plotter.
+    """
+
+    def __init__(self, name: str):
+        self.ring = SharedRingBuffer(
+            STATS_RING_SIZE, (), FRAME_STATS_DTYPE, name
+        )
+        self.items_processed = 0
+        self.queue_depth = 0
+        self.process_time = 0.0
+        self.coalesced_updates = 0
+
+    def data_processed(
+        self,
+        num_items: int,
+        duration: float,
+        coalesced_updates: int | None = None,
+        queue_depth: int | None = None,
+    ):
+        """
+        Register processing of the incoming data.
+
+        Parameters
+        ----------
+        num_items : int
+            Number of data queue items processed, -1 if unknown.
+        duration : float
+            Processing time in seconds.
+        coalesced_updates : int or None, optional
+            Total number of artist updates dropped or merged by the update
+            policies so far, by default None if unchanged.
+        queue_depth : int or None, optional
+            Number of items waiting in the data queue before the processing,
+            -1 if unknown, by default None if not measured.
+        """
+        if num_items < 0 or self.items_processed < 0:
+            self.items_processed = -1
+        else:
+            self.items_processed += num_items
+        if queue_depth is not None:
+            if queue_depth < 0 or self.queue_depth < 0:
+                self.queue_depth = -1
+            else:
+                self.queue_depth = max(self.queue_depth, queue_depth)
+        self.process_time += duration
+        if coalesced_updates is not None:
+            self.coalesced_updates = coalesced_updates
+
+    def frame_done(self, t_start: float, scheduler: FrameScheduler):
+        """
+        Record a drawn frame. Called after the frame is registered with the
+        frame scheduler.
+
+        Parameters
+        ----------
+        t_start : float
+            Time when drawing of the frame started, as returned by
+            `time.perf_counter`.
+        scheduler : FrameScheduler
+            The frame scheduler of the plotter.
+        """
+        t_end = time.perf_counter()
+        record = np.array(
+            (
+                t_end,
+                self.items_processed,
+                self.queue_depth,
+                self.process_time,
+                t_end - t_start,
+                scheduler.achieved_fps,
+                scheduler.frame_count,
+                scheduler.skipped_frames,
+                self.coalesced_updates,
+            ),
+            dtype=FRAME_STATS_DTYPE,
+        )
+        self.ring.write(record)
+        self.items_processed = 0
+        self.queue_depth = 0
+        self.process_time = 0.0
+
+    def close(self):
+        """
+        Release the shared memory.
+        """
+        self.ring.close()
+
+
+class FrameStatsCollector:
+    """
+    Collects the per-frame statistics recorded by the plotter process and
+    summarizes them with rolling percentiles.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Number of the newest frames kept for the summary, by default 1024.
+        Records are received through a ring of `STATS_RING_SIZE` records,
+        so the statistics should be read at least every `STATS_RING_SIZE`
+        frames not to miss any.
+
+    Attributes
+    ----------
+    ring : SharedRingBuffer or None
+        The shared memory ring through which the records are received, None
+        after closing.
+    history : numpy.ndarray
+        The newest records, at most `capacity` of them.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = capacity
+        self.ring = SharedRingBuffer(STATS_RING_SIZE, (), FRAME_STATS_DTYPE)
+        self.history = np.empty(0, FRAME_STATS_DTYPE)
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block of the ring."""
+        return self.ring.name
+
+    def collect(self):
+        """
+        Read the records written since the previous call into the history.
+        """
+        if self.ring is None:
+            return
+        records = self.ring.read()
+        if len(records) > 0:
+            self.history = np.concatenate((self.history, records))[
+                -self.capacity :
+            ]
+
+    def summary(
+        self,
+        window: int | None = None,
+        percentiles: tuple[float, ...] = (50, 95, 99),
+    ) -> dict:
+        """
+        Returns the summary of the statistics of the newest frames.
+
+        Parameters
+        ----------
+        window : int or None, optional
+            Number of the newest frames summarized, by default None for all
+            the frames in the history.
+        percentiles : tuple[float, ...], optional
+            Percentiles computed for the rolling statistics, by default
+            (50, 95, 99).
+
+        Returns
+        -------
+        dict
+            Dictionary with:
+
+            - ``frames``: total number of frames drawn.
+            - ``fps``: frames drawn during the last second.
+            - ``skipped_frames``: total number of missed frame slots.
+            - ``dropped_records``: number of records overwritten before they
+              were collected.
+            - ``coalesced_updates``: total number of artist updates dropped
+              or merged in the plotter by the update policies.
+            - ``items_processed``, ``queue_depth``, ``process_time``,
+              ``draw_time``: dictionaries with the percentiles, keyed
+              ``"p50"`` etc., the ``"mean"`` and the ``"max"`` over the
+              window. Times are in seconds.
+        """
+        return summarize_stats([self], window, percentiles)
+
+    @property
+    def dropped(self) -> int:
+        """Number of records overwritten before they were collected."""
+        return self._dropped if self.ring is None else self.ring.dropped
+
+    def close(self):
+        """
+        Collect the remaining records and release the shared memory. The
+        collected statistics stay available.
+        """
+        if self.ring is None:
+            return
+        self.collect()
+        self._dropped = self.ring.dropped
+        self.ring.close()
+        self.ring = None
+
+
+def summarize_stats(
+    collectors: list[FrameStatsCollector],
+    window: int | None = None,
+    percentiles: tuple[float, ...] = (50, 95, 99),
+) -> dict:
+    """
+    Returns the summary of the statistics of the newest frames of one or
+    more plotter processes.
+
+    The totals and the frame rates of the processes are summed, while the
+    rolling statistics are computed over the newest frames of all the
+    processes together.
+
+    Parameters
+    ----------
+    collectors : list[FrameStatsCollector]
+        The collectors of the statistics of the plotter processes.
+    window : int or None, optional
+        Number of the newest frames of every process summarized, by default
+        None for all the frames in the histories.
+    percentiles : tuple[float, ...], optional
+        Percentiles computed for the rolling statistics, by default
+        (50, 95, 99).
+
+    Returns
+    -------
+    dict
+        The summary, as described in `FrameStatsCollector.summary`.
+    """
+    summary = {
+        "frames": 0,
+        "fps": 0.0,
+        "skipped_frames": 0,
+        "dropped_records": 0,
+        "coalesced_updates": 0,
+    }
+    histories = []
+    for collector in collectors:
+        collector.collect()
+        history = collector.history
+        if window is not None:
+            history = history[-window:]
+        histories.append(history)
+        summary["dropped_records"] += collector.dropped
+        if len(history) > 0:
+            latest = history[-1]
+            summary["frames"] += int(latest["frame_count"])
+            summary["fps"] += float(latest["fps"])
+            summary["skipped_frames"] += int(latest["skipped_frames"])
+            summary["coalesced_updates"] += int(latest["coalesced_updates"])
+    history = np.concatenate(histories)
+    items_processed = history["items_processed"]
+    queue_depth = history["queue_depth"]
+    for field, values in (
+        ("items_processed", items_processed[items_processed >= 0]),
+        ("queue_depth", queue_depth[queue_depth >= 0]),
+        ("process_time", history["process_time"]),
+        ("draw_time", history["draw_time"]),
+    ):
+        summary[field] = _rolling_stats(values, percentiles)
+    return summary
+
+
+def _rolling_stats(values: np.ndarray, percentiles: tuple[float, ...]) -> dict:
+    """
+    Returns the percentiles, the mean and the maximum of the values.
+    """
+    if len(values) == 0:
+        stats = {f"p{p:g}": np.nan for p in percentiles}
+        stats.update(mean=np.nan, max=np.nan)
+        return stats
+    stats = {
+        f"p{p:g}": float(v)
+        for p, v in zip(percentiles, np.percentile(values, percentiles))
+    }
+    stats.update(mean=float(values.mean()), max=float(values.max()))
+    return stats
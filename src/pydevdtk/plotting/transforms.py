@@ -0,0 +1,317 @@
+import math
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from numpy.typing import ArrayLike
+
+
+class Transform:
+    """
+    Base class of the transforms computing derived signals in the plotter
+    process.
+
+    A transform receives the samples of a source stream in batches, with the
+    samples along the first axis, and returns the samples of the derived
+    signal computed from them, possibly none. The state needed to continue
+    the computation with the next batch is kept in the transform, so the
+    output doesn't depend on how the stream is split into batches.
+    Subclasses implement `process` and `reset`.
+    """
+
+    def __call__(self, values: np.ndarray) -> np.ndarray:
+        return self.process(np.asarray(values, dtype=float))
+
+    def process(self, values: np.ndarray) -> np.ndarray:
+        """
+        Process a batch of samples.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            Samples of the source stream, along the first axis.
+
+        Returns
+        -------
+        numpy.ndarray
+            Samples of the derived signal, along the first axis.
+        """
+        raise NotImplementedError("process method not implemented")
+
+    def reset(self):
+        """
+        Reset the state of the transform.
+        """
+
+
+class FIRFilter(Transform):
+    """
+    Finite impulse response filter.
+
+    Parameters
+    ----------
+    taps : array-like
+        Coefficients of the filter.
+
+    Attributes
+    ----------
+    taps : numpy.ndarray
+        Coefficients of the filter.
+    """
+
+    def __init__(self, taps: ArrayLike):
+        self.taps = np.asarray(taps, dtype=float)
+        self.reset()
+
+    def process(self, values: np.ndarray) -> np.ndarray:
+        num_taps = self.taps.size
+        if self._state is None:
+            self._state = np.zeros((num_taps - 1, *values.shape[1:]))
+        x = np.concatenate((self._state, values))
+        self._state = x[x.shape[0] - (num_taps - 1) :]
+        windows = sliding_window_view(x, num_taps, axis=0)
+        return windows @ self.taps[::-1]
+
+    def reset(self):
+        self._state = None
+
+
+class IIRFilter(Transform):
+    """
+    Infinite impulse response filter, in the form of `scipy.signal.lfilter`.
+
+    If SciPy is installed, the batches are filtered with
+    `scipy.signal.lfilter`. Otherwise, the recursion of the filter is solved
+    for a whole batch with a prefix scan, in about ``log2(n)`` vectorized
+    passes over a batch of ``n`` samples, which is slower than SciPy, but
+    doesn't loop over the samples in Python.
+
+    Parameters
+    ----------
+    b : array-like
+        Numerator coefficients of the filter.
+    a : array-like
+        Denominator coefficients of the filter, with ``a[0] != 0``.
+
+    Attributes
+    ----------
+    b : numpy.ndarray
+        Numerator coefficients, normalized by ``a[0]``.
+    a : numpy.ndarray
+        Denominator coefficients, normalized by ``a[0]``.
+    """
+
+    def __init__(self, b: ArrayLike, a: ArrayLike):
+        b = np.asarray(b, dtype=float)
+        a = np.asarray(a, dtype=float)
+        if a[0] == 0:
+            raise ValueError("First denominator coefficient can't be zero")
+        order = max(b.size, a.size)
+        self.b = np.pad(b, (0, order - b.size)) / a[0]
+        self.a = np.pad(a, (0, order - a.size)) / a[0]
+        # direct form II transposed as z[n] = A @ z[n - 1] + c * x[n] and
+        # y[n] = b[0] * x[n] + z[n - 1][0]
+        self._transition = np.eye(order - 1, k=1)
+        self._transition[:, 0] -= self.a[1:]
+        self._input_gains = self.b[1:] - self.b[0] * self.a[1:]
+        try:
+            from scipy.signal import lfilter
+        except ImportError:
+            lfilter = None
+        self._lfilter = lfilter
+        self.reset()
+
+    def process(self, values: np.ndarray) -> np.ndarray:
+        if self._state is None:
+            self._state = np.zeros((self.a.size - 1, *values.shape[1:]))
+        if self._lfilter is not None:
+            y, self._state = self._lfilter(
+                self.b, self.a, values, axis=0, zi=self._state
+            )
+            return y
+        if self._state.shape[0] == 0:
+            return self.b[0] * values
+        gains = self._input_gains.reshape(-1, *([1] * (values.ndim - 1)))
+        # the initial state followed by the states after every sample
+        z = np.concatenate((self._state[np.newaxis], gains * values[:, None]))
+        # Hillis-Steele scan: after the pass with the shift d, every state
+        # sums the contributions of its 2 * d newest inputs
+        power = self._transition
+        shift = 1
+        while shift < z.shape[0]:
+            z[shift:] = z[shift:] + np.einsum(
+                "ij,nj...->ni...", power, z[:-shift]
+            )
+            power = power @ power
+            shift *= 2
+        self._state = z[-1].copy()
+        return self.b[0] * values + z[:-1, 0]
+
+    def reset(self):
+        self._state = None
+
+
+class RMS(Transform):
+    """
+    Root mean square over a sliding window, such as an envelope of the
+    signal.
+
+    Parameters
+    ----------
+    window : int
+        Number of samples in the window.
+    hop : int, optional
+        Number of samples between two outputs, by default 1. Until the
+        window is filled, the RMS of the available samples is output.
+    """
+
+    def __init__(self, window: int, hop: int = 1):
+        self.window = window
+        self.hop = hop
+        self.reset()
+
+    def process(self, values: np.ndarray) -> np.ndarray:
+        squares = values**2
+        if self._tail is None:
+            self._tail = np.zeros((0, *values.shape[1:]))
+        x = np.concatenate((self._tail, squares))
+        num_tail = self._tail.shape[0]
+        count_start = self._count
+        self._count += values.shape[0]
+        self._tail = x[max(0, x.shape[0] - (self.window - 1)) :]
+        # absolute sample counts at which an output is due
+        first = (count_start // self.hop + 1) * self.hop
+        counts = np.arange(first, self._count + 1, self.hop)
+        ends = counts - count_start + num_tail
+        cumsum = np.concatenate(
+            (np.zeros((1, *x.shape[1:])), np.cumsum(x, axis=0))
+        )
+        lengths = np.minimum(counts, self.window)
+        sums = cumsum[ends] - cumsum[ends - lengths]
+        lengths = lengths.reshape(-1, *([1] * (x.ndim - 1)))
+        return np.sqrt(np.maximum(sums, 0) / lengths)
+
+    def reset(self):
+        self._tail = None
+        self._count = 0
+
+
+class Decimate(Transform):
+    """
+    Keeps every `factor`-th sample. To avoid aliasing, chain it after a
+    low-pass `FIRFilter`.
+
+    Parameters
+    ----------
+    factor : int
+        Decimation factor.
+    """
+
+    def __init__(self, factor: int):
+        self.factor = factor
+        self.reset()
+
+    def process(self, values: np.ndarray) -> np.ndarray:
+        offset = -self._count % self.factor
+        self._count += values.shape[0]
+        return values[offset :: self.factor]
+
+    def reset(self):
+        self._count = 0
+
+
+class Spectrum(Transform):
+    """
+    Sliding magnitude spectrum, computed with the real FFT of the newest
+    `n_fft` samples every `hop` samples. Feeding a waterfall plot with
+    ``n_fft // 2 + 1`` rows results in a spectrogram, and feeding a bar plot
+    with ``n_fft // 2 + 1`` bars in a live spectrum.
+
+    Parameters
+    ----------
+    n_fft : int
+        Number of samples in a frame.
+    hop : int or None, optional
+        Number of samples between two spectra, by default None for `n_fft`.
+    window : str or array-like or None, optional
+        Window applied to the frames, "hann", an array of `n_fft` weights
+        or None for no window, by default "hann".
+    log : bool, optional
+        Whether the magnitudes are returned in decibels, by default False.
+
+    Notes
+    -----
+    The magnitudes are scaled so a sine of amplitude 1 in the middle of a bin
+    has a magnitude of 1.
+    """
+
+    def __init__(
+        self,
+        n_fft: int,
+        hop: int | None = None,
+        window: str | ArrayLike | None = "hann",
+        log: bool = False,
+    ):
+        self.n_fft = n_fft
+        self.hop = hop or n_fft
+        if window is None:
+            self.window = np.ones(n_fft)
+        elif isinstance(window, str):
+            if window != "hann":
+                raise ValueError(f"Unknown window {window}")
+            self.window = np.hanning(n_fft + 1)[:-1]
+        else:
+            self.window = np.asarray(window, dtype=float)
+        self.log = log
+        self._scale = np.full(n_fft // 2 + 1, 2 / self.window.sum())
+        self._scale[0] /= 2
+        if n_fft % 2 == 0:
+            self._scale[-1] /= 2
+        self.reset()
+
+    def process(self, values: np.ndarray) -> np.ndarray:
+        values = values.reshape(-1)
+        x = np.concatenate((self._tail, values))
+        num_tail = self._tail.size
+        count_start = self._count
+        self._count += values.size
+        self._tail = x[max(0, x.size - (self.n_fft - 1)) :]
+        first = max(
+            (count_start // self.hop + 1) * self.hop,
+            math.ceil(self.n_fft / self.hop) * self.hop,
+        )
+        counts = np.arange(first, self._count + 1, self.hop)
+        if counts.size == 0:
+            return np.empty((0, self.n_fft // 2 + 1))
+        starts = counts - count_start + num_tail - self.n_fft
+        frames = sliding_window_view(x, self.n_fft)[starts] * self.window
+        spectra = np.abs(np.fft.rfft(frames, axis=1)) * self._scale
+        if self.log:
+            spectra = 20 * np.log10(np.maximum(spectra, 1e-10))
+        return spectra
+
+    def reset(self):
+        self._tail = np.empty(0)
+        self._count = 0
+
+
+class Chain(Transform):
+    """
+    Applies several transforms one after another.
+
+    Parameters
+    ----------
+    *transforms : Transform
+        The transforms, in the order of application.
+    """
+
+    def __init__(self, *transforms: Transform):
+        self.transforms = transforms
+
+    def process(self, values: np.ndarray) -> np.ndarray:
+        for transform in self.transforms:
+            values = transform(values)
+        return values
+
+    def reset(self):
+        for transform in self.transforms:
+            transform.reset()
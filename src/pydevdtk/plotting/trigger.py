@@ -0,0 +1,194 @@
+import enum
+import math
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+class TriggerMode(enum.Enum):
+    """
+    Modes of the trigger of a line plot.
+
+    - ``Auto``: a capture starts on every trigger event, and if there is no
+      event within one capture length after arming, the newest samples are
+      captured without an event, so the line keeps updating.
+    - ``Normal``: a capture starts only on trigger events.
+    - ``Single``: only the first trigger event is captured, until the
+      trigger is armed again.
+    """
+
+    Auto = enum.auto()
+    Normal = enum.auto()
+    Single = enum.auto()
+
+
+class TriggerEdge(enum.Enum):
+    """
+    Edges of the trigger source signal on which the trigger fires.
+    """
+
+    Rising = enum.auto()
+    Falling = enum.auto()
+
+
+class Trigger:
+    """
+    Oscilloscope-style trigger for line plots.
+
+    Instead of scrolling, a triggered line shows captures of as many samples
+    as the line has, aligned on the crossings of a level by the trigger
+    source. The line is redrawn only when a capture completes, with the
+    newest completed capture.
+
+    The crossings are detected with vectorized comparisons over every batch
+    of samples, and only the trigger events are visited one by one, so the
+    cost is proportional to the number of samples and not to the number of
+    edges in them.
+
+    Parameters
+    ----------
+    level : float, optional
+        The level crossed by the trigger source, by default 0.
+    edge : TriggerEdge, optional
+        The edge on which the trigger fires, by default TriggerEdge.Rising.
+    mode : TriggerMode, optional
+        The trigger mode, by default TriggerMode.Auto.
+    pre_trigger : int, optional
+        Number of samples before the trigger event in a capture, by default
+        0. Must be smaller than the capture size.
+    holdoff : int, optional
+        Number of samples after the end of a capture during which the
+        trigger isn't armed, by default 0.
+    external : bool, optional
+        Whether the trigger source is an external channel, by default False
+        for triggering on the plotted signal. With an external source, the
+        line receives (value, trigger source) samples.
+
+    Attributes
+    ----------
+    size : int or None
+        Number of samples in a capture, None until `reset` is called.
+    """
+
+    def __init__(
+        self,
+        level: float = 0.0,
+        edge: TriggerEdge = TriggerEdge.Rising,
+        mode: TriggerMode = TriggerMode.Auto,
+        pre_trigger: int = 0,
+        holdoff: int = 0,
+        external: bool = False,
+    ):
+        if pre_trigger < 0 or holdoff < 0:
+            raise ValueError("Pre-trigger and holdoff can't be negative")
+        self.level = level
+        self.edge = edge
+        self.mode = mode
+        self.pre_trigger = pre_trigger
+        self.holdoff = holdoff
+        self.external = external
+        self.size = None
+
+    @property
+    def item_shape(self) -> tuple[int, ...]:
+        """Shape of a single sample received by the triggered line."""
+        return (2,) if self.external else ()
+
+    def reset(self, size: int):
+        """
+        Clear the captured history and arm the trigger.
+
+        Parameters
+        ----------
+        size : int
+            Number of samples in a capture.
+        """
+        if not 0 <= self.pre_trigger < size:
+            raise ValueError(
+                f"Pre-trigger must be smaller than the capture size {size}"
+            )
+        self.size = size
+        # the samples preceding the batch, NaN before the start of the stream
+        self._tail = np.full(size - 1, np.nan)
+        self._last_source = np.nan
+        self._count = 0
+        self._pending = None
+        self.arm()
+
+    def arm(self):
+        """
+        Arm the trigger, starting with the next sample. Used to capture
+        again in the ``Single`` mode.
+        """
+        self._armed_at = self._count
+        self._pending = None
+        self._fired = False
+
+    def capture(self, values: ArrayLike) -> np.ndarray | None:
+        """
+        Process a batch of samples.
+
+        Parameters
+        ----------
+        values : array-like
+            New samples, an array of shape (n,), or (n, 2) for (value,
+            trigger source) samples with an external source.
+
+        Returns
+        -------
+        numpy.ndarray or None
+            The newest capture completed by the batch, None if there is no
+            such capture.
+        """
+        values = np.asarray(values, dtype=float)
+        if self.external:
+            values = values.reshape(-1, 2)
+            signal, source = values[:, 0], values[:, 1]
+        else:
+            signal = source = values.reshape(-1)
+        num_new = signal.size
+        if num_new == 0:
+            return None
+        size = self.size
+        post_trigger = size - self.pre_trigger
+        x = np.concatenate((self._tail, signal))
+        x_start = self._count - self._tail.size
+        end = self._count + num_new
+
+        previous = np.concatenate(([self._last_source], source[:-1]))
+        if self.edge == TriggerEdge.Rising:
+            crossed = (previous < self.level) & (source >= self.level)
+        else:
+            crossed = (previous > self.level) & (source <= self.level)
+        events = np.flatnonzero(crossed) + self._count
+        self._last_source = source[-1]
+
+        capture_start = None
+        while not self._fired:
+            if self._pending is not None:
+                t_trigger = self._pending
+            else:
+                i_event = np.searchsorted(events, self._armed_at)
+                if i_event < events.size:
+                    t_trigger = events[i_event]
+                else:
+                    t_trigger = math.inf
+                if self.mode == TriggerMode.Auto:
+                    t_trigger = min(t_trigger, self._armed_at + size)
+                if t_trigger >= end:
+                    break
+            if t_trigger + post_trigger > end:
+                # wait for the rest of the capture
+                self._pending = t_trigger
+                break
+            self._pending = None
+            capture_start = t_trigger - self.pre_trigger
+            self._armed_at = t_trigger + post_trigger + self.holdoff
+            self._fired = self.mode == TriggerMode.Single
+
+        self._tail = x[x.size - (size - 1) :]
+        self._count = end
+        if capture_start is None:
+            return None
+        i_start = capture_start - x_start
+        return x[i_start : i_start + size].copy()
@@ -0,0 +1,115 @@
+import struct
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from pydevdtk.coms import ble as ble_module
+from pydevdtk.coms.ble import (
+    Ble,
+    BleDevice,
+    BleManufacturerDecoder,
+    BleReconnectPolicy,
+)
+
+
+@pytest.mark.parametrize(
+    "layout, values",
+    [
+        ("<u2", [1, 65535]),
+        ("<i2", [-2, 3]),
+        (">f4", [0.5, -1.25]),
+    ],
+)
+def test_decoder_dtype_string(layout, values):
+    decoder = BleManufacturerDecoder(layout)
+    assert decoder.layout == np.dtype(layout)
+    for value in values:
+        payload = np.array(value, layout).tobytes()
+        decoder.decode("AA:BB", -40, payload, 0.0)
+    records = decoder.drain()
+    np.testing.assert_array_equal(records["value"], values)
+
+
+def test_decoder_structured_dtype_string():
+    decoder = BleManufacturerDecoder("<i2,<f4")
+    payload = struct.pack("<hf", -7, 2.5)
+    decoder.decode("AA:BB", -40, payload, 1.0)
+    records = decoder.drain()
+    assert records["f0"].tolist() == [-7]
+    assert records["f1"].tolist() == [2.5]
+
+
+def test_decoder_struct_format():
+    decoder = BleManufacturerDecoder("<hH2xB", names=["a", "b", "c"])
+    payload = struct.pack("<hH2xB", -3, 40000, 9)
+    decoder.decode("AA:BB", -40, payload, 1.0)
+    decoder.decode("CC:DD", -50, payload[:-1], 2.0)
+    records = decoder.drain()
+    assert records["a"].tolist() == [-3]
+    assert records["b"].tolist() == [40000]
+    assert records["c"].tolist() == [9]
+    assert records["address"].tolist() == ["AA:BB"]
+    assert decoder.invalid == 1
+
+
+def test_decoder_struct_format_without_names():
+    decoder = BleManufacturerDecoder("<hH")
+    decoder.decode("AA:BB", -40, struct.pack("<hH", -1, 2), 1.0)
+    records = decoder.drain()
+    assert records["f0"].tolist() == [-1]
+    assert records["f1"].tolist() == [2]
+
+
+class FailingReconnectClient:
+    """
+    Fake BleakClient whose first connection succeeds and whose reconnection
+    attempts fail, while calling `Ble.disconnect` during the attempt.
+    """
+
+    connections = 0
+
+    def __init__(self, ble, device):
+        self.ble = ble
+        self.device = device
+        self.address = device.address
+
+    async def __aenter__(self):
+        FailingReconnectClient.connections += 1
+        if FailingReconnectClient.connections == 1:
+            return self
+        self.ble.disconnect(self.device)
+        raise OSError("device not found")
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def test_disconnect_during_failing_reconnect(monkeypatch):
+    ble = Ble()
+    dev = BleDevice("dev", "AA:BB", -40, [], {})
+    monkeypatch.setattr(
+        ble_module,
+        "BleakClient",
+        lambda device, callback: FailingReconnectClient(ble, dev),
+    )
+    FailingReconnectClient.connections = 0
+    disconnected = threading.Event()
+    ble.connect(
+        dev,
+        on_disconnect=disconnected.set,
+        reconnect=BleReconnectPolicy(initial_delay=0.01),
+    )
+    t_end = time.monotonic() + 5
+    while not ble.is_connected(dev):
+        assert time.monotonic() < t_end
+        time.sleep(0.01)
+    # the connection is lost, the reconnection attempt fails
+    ble.event_loop.call_soon_threadsafe(
+        ble._disconnect_callback, FailingReconnectClient(ble, dev)
+    )
+    assert disconnected.wait(5)
+    assert FailingReconnectClient.connections == 2
+    assert ble.get_status(dev) is None
+    assert dev.address not in ble.reconnect_policies
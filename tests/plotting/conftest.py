@@ -0,0 +1,88 @@
+import queue
+import threading
+
+import matplotlib.pyplot as plt
+import pytest
+
+from pydevdtk.plotting import Plotter, PlotterManager
+
+
+class SteppedPlotter(Plotter):
+    """
+    Offscreen plotter running its main loop in the calling thread. Instead of
+    waiting for new data between the iterations, the next step of commands
+    and data items is put into the queues, and the loop stops when there are
+    no steps left.
+    """
+
+    def __init__(self, steps: list[tuple[list, list[dict]]]):
+        super().__init__(backend="Agg")
+        self.steps = list(steps)
+
+    def wait_for_data(self, timeout: float):
+        if self.steps:
+            cmds, data = self.steps.pop(0)
+            for cmd in cmds:
+                self.cmd_queue.put(cmd)
+            for item in data:
+                self.data_queue.put(item)
+            return
+        self.stop_event.set()
+        # end the draining of the queues when the loop stops
+        self.cmd_queue.put(None)
+        self.data_queue.put(None)
+
+
+class IdlePlotter:
+    """
+    Plotter process which only waits for the stop event, so the test can
+    read what the manager sends through the queues.
+    """
+
+    def __call__(self, cmd_queue, data_queue, stop_event, *args):
+        stop_event.wait()
+
+
+@pytest.fixture
+def run_plotter():
+    """
+    Returns a function running a plotter with the given commands and data.
+
+    The commands and the data items are processed by the first iteration of
+    the main loop, and every following step, a tuple of commands and data
+    items, by one more iteration. The plotter is returned for inspecting its
+    state.
+    """
+
+    def run(cmds, data=(), steps=()):
+        plotter = SteppedPlotter(steps)
+        cmd_queue = queue.Queue()
+        data_queue = queue.Queue()
+        for cmd in cmds:
+            cmd_queue.put(cmd)
+        for item in data:
+            data_queue.put(item)
+        plotter(cmd_queue, data_queue, threading.Event(), threading.Event())
+        return plotter
+
+    yield run
+    plt.close("all")
+
+
+@pytest.fixture
+def idle_manager():
+    """
+    Returns a function creating a `PlotterManager` of idle plotter
+    processes, with the given keyword arguments. The managers are stopped
+    after the test.
+    """
+    managers = []
+
+    def create(**kwargs):
+        manager = PlotterManager(IdlePlotter(), **kwargs)
+        managers.append(manager)
+        return manager
+
+    yield create
+    for manager in managers:
+        manager.stop()
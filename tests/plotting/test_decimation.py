@@ -0,0 +1,76 @@
+import math
+
+import numpy as np
+import pytest
+
+from pydevdtk.plotting.decimation import MinMaxDecimator
+from pydevdtk.plotting.ring_buffer import RingBuffer
+
+
+def brute_force_envelope(history, size, bucket_size):
+    """
+    Min/max of the samples in the buffer of every bucket aligned to the
+    absolute sample index, as x and y coordinates.
+    """
+    count = len(history)
+    window_start = count - size
+    xs, ys = [], []
+    for start in range(0, count, bucket_size):
+        end = start + bucket_size
+        if end <= window_start:
+            continue
+        samples = history[max(start, window_start) : min(end, count)]
+        xs += [max(start, window_start) - window_start] * 2
+        ys += [samples.min(), samples.max()]
+    return np.array(xs), np.array(ys)
+
+
+@pytest.mark.parametrize("num_columns", [1, 7, 10, 33, 100, 250])
+def test_envelope_matches_brute_force(num_columns):
+    rng = np.random.default_rng(num_columns)
+    size = 100
+    buffer = RingBuffer(size)
+    decimator = MinMaxDecimator(buffer, num_columns)
+    bucket_size = decimator.bucket_size
+    assert bucket_size == max(1, math.ceil(size / num_columns))
+    history = np.empty(0)
+    batch_sizes = [1, bucket_size - 1, bucket_size, bucket_size + 1, 3, 57]
+    for n in batch_sizes + [250, 2, 99, 100, 101] + batch_sizes:
+        values = rng.standard_normal(n)
+        buffer.append(values)
+        decimator.append(values)
+        history = np.concatenate((history, values))
+        x, y = decimator.envelope()
+        x_expected, y_expected = brute_force_envelope(
+            history, size, bucket_size
+        )
+        np.testing.assert_array_equal(x, x_expected)
+        np.testing.assert_array_equal(y, y_expected)
+
+
+def test_rebuild_recomputes_envelope():
+    rng = np.random.default_rng(1)
+    buffer = RingBuffer(100)
+    decimator = MinMaxDecimator(buffer, 10)
+    history = rng.standard_normal(237)
+    for batch in np.split(history, [50, 51, 180]):
+        buffer.append(batch)
+        decimator.append(batch)
+    decimator.rebuild(30)
+    assert decimator.bucket_size == 4
+    x, y = decimator.envelope()
+    x_expected, y_expected = brute_force_envelope(history, 100, 4)
+    np.testing.assert_array_equal(x, x_expected)
+    np.testing.assert_array_equal(y, y_expected)
+
+
+def test_envelope_of_partially_filled_buffer():
+    buffer = RingBuffer(10)
+    decimator = MinMaxDecimator(buffer, 5)
+    values = np.array([3.0, 1.0, 4.0])
+    buffer.append(values)
+    decimator.append(values)
+    x, y = decimator.envelope()
+    # the samples are at the end of the buffer, after the NaN fill
+    np.testing.assert_array_equal(x, [7, 7, 9, 9])
+    np.testing.assert_array_equal(y, [1, 3, 4, 4])
@@ -0,0 +1,25 @@
+import os
+
+import numpy as np
+
+from pydevdtk.plotting.frame_sinks import SharedFrameReader, SharedMemorySink
+
+
+def test_reader_follows_resized_frames():
+    prefix = f"test_sink_{os.getpid()}"
+    sink = SharedMemorySink(prefix)
+    try:
+        sink.write("fig", np.full((4, 5, 4), 1, np.uint8))
+        reader = SharedFrameReader(f"{prefix}_fig")
+        assert reader.read().shape == (4, 5, 4)
+        assert reader.read() is None
+
+        sink.write("fig", np.full((6, 3, 4), 2, np.uint8))
+        frame = reader.read()
+        assert frame.shape == (6, 3, 4)
+        assert np.all(frame == 2)
+        assert reader.frame_count == 2
+    finally:
+        sink.close()
+    assert reader.read() is None
+    reader.close()
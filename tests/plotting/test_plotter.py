@@ -0,0 +1,186 @@
+import numpy as np
+import pytest
+
+from pydevdtk.plotting import Plotter, PlotterBase, UpdatePolicy, commands
+from pydevdtk.plotting.shared_ring import SharedRingBuffer
+from pydevdtk.plotting.transforms import Decimate
+from pydevdtk.plotting.trigger import Trigger, TriggerMode
+
+
+def setup_commands(*cmds):
+    return [
+        commands.CreateFigure("fig", 1, 1),
+        commands.CreateAxis("ax", "fig", 0, 0, 1, 1),
+        *cmds,
+    ]
+
+
+def attach(ring, artist_id):
+    return commands.AttachSharedRing(
+        artist_id, ring.name, ring.capacity, ring.item_shape, ring.dtype.str
+    )
+
+
+def test_shared_ring_of_triggered_line_is_read_completely(run_plotter):
+    ring = SharedRingBuffer(100)
+    try:
+        values = np.zeros(40)
+        values[5:20] = 1
+        ring.write(values)
+        trigger = Trigger(level=0.5, mode=TriggerMode.Normal)
+        plotter = run_plotter(
+            setup_commands(
+                commands.CreateLinePlot("line", "ax", 10, trigger=trigger),
+                attach(ring, "line"),
+            )
+        )
+        # the only edge is older than the newest 10 samples
+        np.testing.assert_array_equal(
+            plotter.buffers["line"].view(), np.ones(10)
+        )
+    finally:
+        ring.close()
+
+
+def test_shared_ring_of_transform_source_is_read_completely(run_plotter):
+    ring = SharedRingBuffer(100)
+    try:
+        ring.write(np.arange(40))
+        plotter = run_plotter(
+            setup_commands(
+                commands.CreateLinePlot("source", "ax", 10),
+                commands.CreateLinePlot("decimated", "ax", 10),
+                commands.AddTransform("source", "decimated", Decimate(4)),
+                attach(ring, "source"),
+            )
+        )
+        np.testing.assert_array_equal(
+            plotter.buffers["source"].view(), np.arange(30, 40)
+        )
+        np.testing.assert_array_equal(
+            plotter.buffers["decimated"].view(), np.arange(0, 40, 4)
+        )
+    finally:
+        ring.close()
+
+
+def test_latest_policy_shows_newest_update(run_plotter):
+    plotter = run_plotter(
+        setup_commands(commands.CreateBarPlot("bars", "ax", 3)),
+        [
+            {"bars": [1, 2, 3]},
+            {"bars": [4, 5, 6]},
+            {"bars": [[7, 8, 9], [1, 1, 1]]},
+        ],
+    )
+    bars, _ = plotter.artists["bars"]
+    np.testing.assert_array_equal(bars.get_heights(), [1, 1, 1])
+    assert plotter.coalesced_updates["bars"] == 2
+
+
+def test_accumulate_policy_sums_updates(run_plotter):
+    plotter = run_plotter(
+        setup_commands(
+            commands.CreateBarPlot("bars", "ax", 2),
+            commands.SetUpdatePolicy("bars", UpdatePolicy.Accumulate),
+        ),
+        [{"bars": [1, 2]}, {"bars": [[1, 1], [2, 2]]}],
+        steps=[([], [{"bars": [1, 1]}])],
+    )
+    bars, _ = plotter.artists["bars"]
+    np.testing.assert_array_equal(bars.get_heights(), [5, 6])
+    assert plotter.coalesced_updates["bars"] == 2
+
+
+def test_append_policy_keeps_every_sample(run_plotter):
+    plotter = run_plotter(
+        setup_commands(commands.CreateLinePlot("line", "ax", 6)),
+        [{"line": [1, 2]}, {"line": 3}, {"line": np.array([4, 5])}],
+        steps=[([], [{"line": [6, 7]}])],
+    )
+    np.testing.assert_array_equal(
+        plotter.buffers["line"].view(), [2, 3, 4, 5, 6, 7]
+    )
+    assert plotter.coalesced_updates["line"] == 0
+
+
+def test_append_policy_is_rejected_for_bars(run_plotter):
+    with pytest.raises(ValueError):
+        run_plotter(
+            setup_commands(
+                commands.CreateBarPlot("bars", "ax", 2),
+                commands.SetUpdatePolicy("bars", UpdatePolicy.Append),
+            )
+        )
+
+
+def test_every_command_has_a_handler():
+    command_types = [
+        value
+        for value in vars(commands).values()
+        if isinstance(value, type)
+        and issubclass(value, commands.Command)
+        and value is not commands.Command
+    ]
+    assert set(command_types) == set(Plotter.COMMAND_HANDLERS)
+    for method_name in Plotter.COMMAND_HANDLERS.values():
+        assert callable(getattr(Plotter, method_name))
+
+
+def test_base_plotter_ignores_commands_without_handler():
+    class BasePlotter(PlotterBase):
+        def init(self):
+            pass
+
+    plotter = BasePlotter()
+    plotter.execute_command(commands.Batch([commands.CreateFigure("f", 1, 1)]))
+
+
+def test_nested_batches_are_executed_in_order(run_plotter):
+    plotter = run_plotter(
+        [
+            commands.Batch(
+                [
+                    commands.CreateFigure("fig", 1, 1),
+                    commands.Batch(
+                        [
+                            commands.CreateAxis("ax", "fig", 0, 0, 1, 1),
+                            commands.CreateLinePlot("line", "ax", 3),
+                        ]
+                    ),
+                    commands.ModifyAxis("ax", ylim=(-1, 1)),
+                ]
+            )
+        ],
+        [{"line": [1, 2, 3]}],
+    )
+    np.testing.assert_array_equal(plotter.buffers["line"].view(), [1, 2, 3])
+    assert plotter.axs["ax"].get_ylim() == (-1, 1)
+
+
+def test_early_data_is_applied_when_artist_is_created(run_plotter):
+    plotter = run_plotter(
+        setup_commands(),
+        [{"line": [1, 2]}],
+        steps=[
+            (
+                [commands.CreateLinePlot("line", "ax", 4)],
+                [{"line": 3}],
+            )
+        ],
+    )
+    np.testing.assert_array_equal(
+        plotter.buffers["line"].view(), [np.nan, 1, 2, 3]
+    )
+    assert plotter.early_data == []
+
+
+def test_early_data_is_dropped_after_timeout(run_plotter, monkeypatch):
+    monkeypatch.setattr(Plotter, "EARLY_DATA_TIMEOUT", 0.0)
+    with pytest.warns(UserWarning, match="unknown artist line"):
+        plotter = run_plotter(
+            setup_commands(),
+            [{"line": [1, 2]}],
+            steps=[([], []), ([commands.CreateLinePlot("line", "ax", 4)], [])],
+        )
+    assert np.all(np.isnan(plotter.buffers["line"].view()))
@@ -0,0 +1,85 @@
+import numpy as np
+
+from pydevdtk.plotting import OverflowPolicy, commands
+
+
+def test_batch_sends_one_message(idle_manager):
+    manager = idle_manager()
+    with manager.batch():
+        manager.create_figure("fig")
+        with manager.batch():
+            manager.create_axis("ax", "fig", 0, 0)
+        manager.create_line_plot("line", "ax", 10)
+    cmd = manager.cmd_queue.get(timeout=5)
+    assert isinstance(cmd, commands.Batch)
+    assert [type(c) for c in cmd.commands] == [
+        commands.CreateFigure,
+        commands.CreateAxis,
+        commands.CreateLinePlot,
+    ]
+    manager.show()
+    assert isinstance(manager.cmd_queue.get(timeout=5), commands.Show)
+
+
+def create_plots(manager):
+    manager.create_figure("fig")
+    manager.create_axis("ax", "fig", 0, 0)
+    manager.create_line_plot("line", "ax", 100)
+    manager.create_multi_line_plot("lines", "ax", 100, 2)
+    manager.create_bar_plot("bars", "ax", 3)
+
+
+def test_coalesce_concatenates_appended_samples(idle_manager):
+    manager = idle_manager(max_queue_size=1, overflow=OverflowPolicy.Coalesce)
+    create_plots(manager)
+    manager.add_data({"line": [1, 2]})
+    manager.add_data({"line": 3, "lines": [1, 2], "bars": [1, 2, 3]})
+    manager.add_data(
+        {
+            "line": np.array([4, 5]),
+            "lines": [[3, 4], [5, 6]],
+            "bars": [4, 5, 6],
+        }
+    )
+    assert manager.coalesced_items == 2
+    assert manager.stats()["pending_items"] == 1
+    assert not manager.flush()
+    assert manager.data_queue.get(timeout=5) == {"line": [1, 2]}
+    assert manager.flush()
+    assert manager.stats()["pending_items"] == 0
+    data = manager.data_queue.get(timeout=5)
+    np.testing.assert_array_equal(data["line"], [3, 4, 5])
+    np.testing.assert_array_equal(data["lines"], [[1, 2], [3, 4], [5, 6]])
+    assert data["bars"] == [4, 5, 6]
+    assert manager.dropped_items == 0
+
+
+def test_drop_oldest_keeps_newest_backlog(idle_manager):
+    manager = idle_manager(
+        max_queue_size=2, overflow=OverflowPolicy.DropOldest
+    )
+    create_plots(manager)
+    for i in range(6):
+        manager.add_data({"line": i})
+    assert manager.dropped_items == 2
+    assert manager.stats()["pending_items"] == 2
+    assert manager.data_queue.get(timeout=5) == {"line": 0}
+    # the backlog is sent in order as there is room in the queue
+    manager.add_data({"line": 6})
+    assert manager.dropped_items == 2
+    received = [manager.data_queue.get(timeout=5)["line"] for _ in range(2)]
+    assert manager.stats()["pending_items"] == 2
+    assert manager.flush()
+    received += [manager.data_queue.get(timeout=5)["line"] for _ in range(2)]
+    assert received == [1, 4, 5, 6]
+
+
+def test_drop_newest_drops_new_data(idle_manager):
+    manager = idle_manager(
+        max_queue_size=1, overflow=OverflowPolicy.DropNewest
+    )
+    create_plots(manager)
+    for i in range(3):
+        manager.add_data({"line": i})
+    assert manager.dropped_items == 2
+    assert manager.data_queue.get(timeout=5) == {"line": 0}
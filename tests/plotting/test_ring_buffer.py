@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from pydevdtk.plotting.ring_buffer import RingBuffer
+
+
+@pytest.mark.parametrize("item_shape", [(), (3,)])
+def test_ring_buffer_matches_newest_samples(item_shape):
+    rng = np.random.default_rng(0)
+    size = 10
+    buffer = RingBuffer(size, item_shape)
+    history = np.full((size, *item_shape), np.nan)
+    for n in [1, 3, 6, 9, 10, 1, 11, 25, 4, 0, 7]:
+        values = rng.standard_normal((n, *item_shape))
+        buffer.append(values)
+        history = np.concatenate((history, values))
+        np.testing.assert_array_equal(buffer.view(), history[-size:])
+        assert buffer.count == history.shape[0] - size
+
+
+def test_ring_buffer_single_sample():
+    buffer = RingBuffer(3, (2,))
+    for i in range(4):
+        buffer.append([i, -i])
+    np.testing.assert_array_equal(buffer.view(), [[1, -1], [2, -2], [3, -3]])
+
+
+def test_ring_buffer_clear():
+    buffer = RingBuffer(4)
+    buffer.append(np.arange(6))
+    buffer.clear(0)
+    np.testing.assert_array_equal(buffer.view(), np.zeros(4))
+    assert buffer.count == 0
+    buffer.append([1, 2])
+    np.testing.assert_array_equal(buffer.view(), [0, 0, 1, 2])
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from pydevdtk.plotting.shared_ring import SharedRingBuffer
+
+
+@pytest.fixture
+def ring_pair():
+    producer = SharedRingBuffer(8, (2,), np.int32)
+    consumer = SharedRingBuffer(8, (2,), np.int32, producer.name)
+    yield producer, consumer
+    consumer.close()
+    producer.close()
+
+
+def samples(start, stop):
+    return np.stack((np.arange(start, stop), -np.arange(start, stop)), 1)
+
+
+def test_shared_ring_counters(ring_pair):
+    producer, consumer = ring_pair
+    assert consumer.read().shape == (0, 2)
+    producer.write(samples(0, 5))
+    assert consumer.write_count == 5
+    np.testing.assert_array_equal(consumer.read(), samples(0, 5))
+    assert consumer.read_count == 5
+    # wraps around the end of the storage
+    producer.write(samples(5, 11))
+    producer.write(samples(11, 12)[0])
+    np.testing.assert_array_equal(consumer.read(), samples(5, 12))
+    assert consumer.read_count == producer.write_count == 12
+    assert consumer.dropped == 0
+    assert consumer.read().shape == (0, 2)
+
+
+def test_shared_ring_overrun(ring_pair):
+    producer, consumer = ring_pair
+    producer.write(samples(0, 3))
+    producer.write(samples(3, 13))
+    np.testing.assert_array_equal(consumer.read(), samples(5, 13))
+    assert consumer.dropped == 5
+    # a batch larger than the ring keeps its newest samples
+    producer.write(samples(13, 33))
+    assert producer.write_count == 33
+    np.testing.assert_array_equal(consumer.read(), samples(25, 33))
+    assert consumer.dropped == 17
+
+
+def test_shared_ring_max_items_and_latest(ring_pair):
+    producer, consumer = ring_pair
+    producer.write(samples(0, 6))
+    np.testing.assert_array_equal(consumer.read(2), samples(4, 6))
+    # skipped samples aren't counted as dropped
+    assert consumer.dropped == 0
+    assert consumer.latest() is None
+    producer.write(samples(6, 9))
+    np.testing.assert_array_equal(consumer.latest(), samples(8, 9)[0])
+    assert consumer.read().shape == (0, 2)
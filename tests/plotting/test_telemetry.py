@@ -0,0 +1,68 @@
+import queue
+import time
+
+from pydevdtk.plotting.frame_scheduler import FrameScheduler
+from pydevdtk.plotting.telemetry import (
+    FrameStatsCollector,
+    FrameStatsRecorder,
+    get_queue_depth,
+    summarize_stats,
+)
+
+
+def record_frames(recorder, scheduler, coalesced_updates):
+    for total in coalesced_updates:
+        recorder.data_processed(2, 0.001, total)
+        t_start = time.perf_counter()
+        scheduler.frame_done(t_start)
+        recorder.frame_done(t_start, scheduler)
+
+
+def test_coalesced_updates_are_published():
+    collectors = [FrameStatsCollector(), FrameStatsCollector()]
+    try:
+        for collector, totals in zip(collectors, ([1, 4], [2])):
+            recorder = FrameStatsRecorder(collector.name)
+            record_frames(recorder, FrameScheduler(), totals)
+            recorder.close()
+        assert collectors[0].summary()["coalesced_updates"] == 4
+        summary = summarize_stats(collectors)
+        assert summary["frames"] == 3
+        assert summary["coalesced_updates"] == 6
+    finally:
+        for collector in collectors:
+            collector.close()
+
+
+def test_queue_depth_is_the_largest_per_frame():
+    collector = FrameStatsCollector()
+    try:
+        recorder = FrameStatsRecorder(collector.name)
+        scheduler = FrameScheduler()
+        for depths in ([3, 7, 0], [2], [-1, 5]):
+            for depth in depths:
+                recorder.data_processed(1, 0.001, queue_depth=depth)
+            t_start = time.perf_counter()
+            scheduler.frame_done(t_start)
+            recorder.frame_done(t_start, scheduler)
+        recorder.close()
+        collector.collect()
+        assert list(collector.history["queue_depth"]) == [7, 2, -1]
+        summary = collector.summary(percentiles=(50,))
+        assert summary["queue_depth"]["max"] == 7
+        assert summary["queue_depth"]["mean"] == 4.5
+    finally:
+        collector.close()
+
+
+def test_get_queue_depth():
+    data_queue = queue.Queue()
+    for i in range(3):
+        data_queue.put(i)
+    assert get_queue_depth(data_queue) == 3
+
+    class NoQsizeQueue:
+        def qsize(self):
+            raise NotImplementedError
+
+    assert get_queue_depth(NoQsizeQueue()) == -1
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from pydevdtk.plotting.transforms import IIRFilter
+
+
+def difference_equation(b, a, x):
+    b = np.asarray(b, dtype=float) / a[0]
+    a = np.asarray(a, dtype=float) / a[0]
+    y = np.zeros_like(x)
+    for n in range(len(x)):
+        for k in range(len(b)):
+            if n - k >= 0:
+                y[n] += b[k] * x[n - k]
+        for k in range(1, len(a)):
+            if n - k >= 0:
+                y[n] -= a[k] * y[n - k]
+    return y
+
+
+@pytest.mark.parametrize(
+    "b, a",
+    [
+        # second-order low-pass section
+        ([0.0675, 0.1349, 0.0675], [1.0, -1.143, 0.4128]),
+        # resonator with poles close to the unit circle
+        ([1.0, 0.0, -1.0], [2.0, -3.9, 1.98]),
+        ([0.2], [1.0, -0.8]),
+        ([0.5, 0.5], [1.0]),
+        ([1.0, -2.0, 1.0, 0.5], [1.0, -0.5, 0.25, -0.125]),
+    ],
+)
+def test_iir_filter_matches_difference_equation(b, a):
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((1000, 2))
+    expected = np.stack(
+        [difference_equation(b, a, x[:, i]) for i in range(2)], axis=1
+    )
+    iir = IIRFilter(b, a)
+    iir._lfilter = None
+    bounds = [0, 1, 1, 2, 5, 64, 65, 300, 1000]
+    y = np.concatenate(
+        [iir(x[start:end]) for start, end in zip(bounds, bounds[1:])]
+    )
+    np.testing.assert_allclose(y, expected, rtol=1e-9, atol=1e-9)
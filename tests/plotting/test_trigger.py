@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+
+from pydevdtk.plotting.trigger import Trigger, TriggerEdge, TriggerMode
+
+
+def brute_force_captures(signal, source, trigger, size):
+    """
+    Captures of the whole stream, found sample by sample, as a list of
+    (index of the sample completing the capture, capture).
+    """
+    level = trigger.level
+    post_trigger = size - trigger.pre_trigger
+    padded = np.concatenate((np.full(size, np.nan), signal))
+    captures = []
+    armed_at = 0
+    t = 0
+    while t < len(source):
+        if t >= armed_at:
+            previous = source[t - 1] if t > 0 else np.nan
+            if trigger.edge == TriggerEdge.Rising:
+                crossed = previous < level <= source[t]
+            else:
+                crossed = previous > level >= source[t]
+            is_auto = trigger.mode == TriggerMode.Auto and t == armed_at + size
+            if crossed or is_auto:
+                end = t + post_trigger
+                if end > len(source):
+                    break
+                start = t - trigger.pre_trigger + size
+                captures.append((end, padded[start : start + size]))
+                if trigger.mode == TriggerMode.Single:
+                    break
+                armed_at = end + trigger.holdoff
+                t = armed_at
+                continue
+        t += 1
+    return captures
+
+
+def expected_results(captures, bounds):
+    """
+    The newest capture completed by every batch, None if there is none.
+    """
+    results = []
+    for start, end in zip(bounds, bounds[1:]):
+        completed = [c for t, c in captures if start < t <= end]
+        results.append(completed[-1] if completed else None)
+    return results
+
+
+def check_batches(trigger, values, signal, source, size, bounds):
+    captures = brute_force_captures(signal, source, trigger, size)
+    trigger.reset(size)
+    for (start, end), expected in zip(
+        zip(bounds, bounds[1:]), expected_results(captures, bounds)
+    ):
+        result = trigger.capture(values[start:end])
+        if expected is None:
+            assert result is None
+        else:
+            np.testing.assert_array_equal(result, expected)
+    return captures
+
+
+def random_bounds(rng, num_samples):
+    cuts = rng.choice(np.arange(1, num_samples), 40, replace=False)
+    return [0, *sorted(cuts), num_samples]
+
+
+@pytest.mark.parametrize("mode", list(TriggerMode))
+@pytest.mark.parametrize("edge", list(TriggerEdge))
+@pytest.mark.parametrize("pre_trigger, holdoff", [(0, 0), (5, 0), (3, 17)])
+def test_trigger_matches_brute_force(mode, edge, pre_trigger, holdoff):
+    rng = np.random.default_rng(0)
+    num_samples = 2000
+    t = np.arange(num_samples)
+    # bursts of oscillation separated by quiet spans, for the auto captures
+    signal = np.sin(2 * np.pi * t / 37) * (np.sin(2 * np.pi * t / 600) > 0)
+    signal += 0.05 * rng.standard_normal(num_samples)
+    trigger = Trigger(0.2, edge, mode, pre_trigger, holdoff)
+    size = 50
+    captures = check_batches(
+        trigger,
+        signal,
+        signal,
+        signal,
+        size,
+        random_bounds(rng, num_samples),
+    )
+    assert len(captures) > (0 if mode == TriggerMode.Single else 10)
+
+
+def test_external_trigger_source():
+    rng = np.random.default_rng(1)
+    num_samples = 1000
+    signal = rng.standard_normal(num_samples)
+    source = (np.arange(num_samples) % 90 < 45).astype(float)
+    trigger = Trigger(0.5, pre_trigger=10, external=True)
+    assert trigger.item_shape == (2,)
+    captures = check_batches(
+        trigger,
+        np.stack((signal, source), axis=1),
+        signal,
+        source,
+        40,
+        random_bounds(rng, num_samples),
+    )
+    assert len(captures) > 5
+
+
+def test_single_mode_captures_again_after_arming():
+    trigger = Trigger(0.5, mode=TriggerMode.Single)
+    trigger.reset(4)
+    square = np.tile([0.0, 0.0, 1.0, 1.0], 3)
+    np.testing.assert_array_equal(
+        trigger.capture(square), [1.0, 1.0, 0.0, 0.0]
+    )
+    assert trigger.capture(square) is None
+    trigger.arm()
+    assert trigger.capture(square[:3]) is None
+    np.testing.assert_array_equal(
+        trigger.capture(square[3:]), [1.0, 1.0, 0.0, 0.0]
+    )
+
+
+def test_pre_trigger_must_fit_the_capture():
+    with pytest.raises(ValueError):
+        Trigger(pre_trigger=10).reset(10)